@@ -16,4 +16,5 @@
 # GNU General Public License for more details.
 #
 # You should have received a copy of the GNU General Public License
-# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
\ No newline at end of file
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+__version__ = '0.1.2.2'
@@ -51,11 +51,10 @@ class CoCoAllVariablesDefined(CoCo):
         node.accept(expression_collector_visitor)
         expressions = expression_collector_visitor.ret
         for expr in expressions:
+            # this part is required to check that we handle invariants differently
+            expr_par = ASTUtils.get_parent(node, expr)
             for var in ASTHelper.get_variables_from_expression(expr):
                 symbol = var.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
-                # this part is required to check that we handle invariants differently
-                # expr_par = node.get_parent(expr)
-                expr_par = ASTUtils.get_parent(node, expr)
 
                 # first test if the symbol has been defined at least
                 if symbol is None:
@@ -39,15 +39,22 @@ class CoCoNoTwoNeuronsInSetOfCompilationUnits(CoCo):
         :type list_of_compilation_units: list(ASTNestMLCompilationUnit)
         """
         list_of_neurons = ASTUtils.get_all_neurons(list_of_compilation_units)
+        return self.check_name_index([(neuron.get_name(), neuron.get_artifact_name()) for neuron in list_of_neurons])
+
+    def check_name_index(self, name_index):
+        """
+        Checks the coco for a handed over index of neuron names, such that the models do not have to be kept in
+        memory.
+        :param name_index: a list of tuples of neuron name and the name of the artifact it is declared in.
+        :type name_index: list((str,str))
+        :return: the names of all conflicting neurons.
+        :rtype: list(str)
+        """
         conflicting_neurons = list()
-        checked = list()
-        for neuronA in list_of_neurons:
-            for neuronB in list_of_neurons:
-                if neuronA is not neuronB and neuronA.get_name() == neuronB.get_name():
-                    code, message = Messages.get_compilation_unit_name_collision(neuronA.get_name(),
-                                                                                 neuronA.get_artifact_name(),
-                                                                                 neuronB.get_artifact_name())
+        for index_a, (name_a, artifact_a) in enumerate(name_index):
+            for index_b, (name_b, artifact_b) in enumerate(name_index):
+                if index_a != index_b and name_a == name_b:
+                    code, message = Messages.get_compilation_unit_name_collision(name_a, artifact_a, artifact_b)
                     Logger.log_message(code=code, message=message, log_level=LoggingLevel.ERROR)
-                conflicting_neurons.append(neuronB)
-            checked.append(neuronA)
+                    conflicting_neurons.append(name_b)
         return conflicting_neurons
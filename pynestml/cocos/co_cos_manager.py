@@ -250,6 +250,15 @@ class CoCosManager(object):
         """
         CoCoNoTwoNeuronsInSetOfCompilationUnits().check_co_co(compilation_units)
 
+    @classmethod
+    def check_not_two_neurons_in_name_index(cls, name_index):
+        """
+        Checks if in an index of neuron names as collected from a set of models, two neurons have the same name.
+        :param name_index: a list of tuples of neuron name and the name of the artifact it is declared in.
+        :type name_index: list((str,str))
+        """
+        CoCoNoTwoNeuronsInSetOfCompilationUnits().check_name_index(name_index)
+
     @classmethod
     def check_invariant_type_correct(cls, neuron):
         """
@@ -20,9 +20,8 @@
 import datetime
 import os
 import re
+import threading
 
-from jinja2 import Environment, FileSystemLoader
-from odetoolbox import analysis
 
 from pynestml.utils.ast_helper import ASTHelper
 from pynestml.codegeneration.expressions_pretty_printer import ExpressionsPrettyPrinter
@@ -34,42 +33,62 @@ from pynestml.codegeneration.nest_declarations_helper import NestDeclarationsHel
 from pynestml.codegeneration.nest_names_converter import NestNamesConverter
 from pynestml.codegeneration.nest_printer import NestPrinter
 from pynestml.codegeneration.nest_reference_converter import NESTReferenceConverter
+from pynestml.exceptions.analysis_timeout_exception import AnalysisTimeoutException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_ode_function import ASTOdeFunction
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.meta_model.ast_ode_shape import ASTOdeShape
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.solver.ast_converter import ASTConverter
 from pynestml.solver.solution_transformers import integrate_exact_solution, functional_shapes_to_odes, \
-    integrate_delta_solution
-from pynestml.solver.transformer_base import add_assignment_to_update_block
+    integrate_delta_solution, integrate_delta_numerically
+from pynestml.solver.transformer_base import add_stmts_to_update_block
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
-from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.ode_transformer import OdeTransformer
+from pynestml.utils.profiler import Profiler
+from pynestml.utils.time_budget import TimeBudget
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
-# setup the template environment
-env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest')))
-setup_env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest', 'setup')))
-# setup the cmake template
-template_cmakelists = setup_env.get_template('CMakeLists.jinja2')
-# setup the module class template
-template_module_class = env.get_template('ModuleClass.jinja2')
-# setup the NEST module template
-template_module_header = env.get_template('ModuleHeader.jinja2')
-# setup the SLI_Init file
-template_sli_init = setup_env.get_template('SLI_Init.jinja2')
-# setup the neuron header template
-template_neuron_h_file = env.get_template('NeuronHeader.jinja2')
-# setup the neuron implementation template
-template_neuron_cpp_file = env.get_template('NeuronClass.jinja2')
+# the templates are loaded on first use, such that runs without code generation (e.g., -dry) do not pay for it
+_templates = {}
+
+
+def get_template(name, setup = False):
+    # type: (str,bool) -> Template
+    """
+    Returns the template with the handed over name. Templates are loaded and compiled on first use only.
+    :param name: the name of the template file, e.g., NeuronHeader.jinja2
+    :type name: str
+    :param setup: indicates whether the template is located in the setup directory.
+    :type setup: bool
+    :return: the template
+    :rtype: Template
+    """
+    if (name, setup) not in _templates:
+        from jinja2 import Environment, FileSystemLoader
+        if setup:
+            loader = FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest', 'setup'))
+        else:
+            loader = FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest'))
+        _templates[(name, setup)] = Environment(loader=loader).get_template(name)
+    return _templates[(name, setup)]
+
 
 _printer = ExpressionsPrettyPrinter()
 
+# sympy, as used by ode-toolbox and the solution transformers, is not thread-safe, thus concurrent compilation
+# sessions have to analyse their equations one after another
+_analysis_lock = threading.Lock()
+
 
 def generate_nest_module_code(neurons):
     # type: (list(ASTNeuron)) -> None
@@ -80,42 +99,47 @@ def generate_nest_module_code(neurons):
     """
     namespace = {'neurons': neurons, 'moduleName': FrontendConfiguration.get_module_name(),
                  'now': datetime.datetime.utcnow()}
-    if not os.path.exists(FrontendConfiguration.get_target_path()):
-        os.makedirs(FrontendConfiguration.get_target_path())
-
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                               FrontendConfiguration.get_module_name())) + '.h', 'w+') as f:
-        f.write(str(template_module_header.render(namespace)))
-
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                               FrontendConfiguration.get_module_name())) + '.cpp', 'w+') as f:
-        f.write(str(template_module_class.render(namespace)))
-
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                               'CMakeLists')) + '.txt', 'w+') as f:
-        f.write(str(template_cmakelists.render(namespace)))
-
-    if not os.path.isdir(os.path.realpath(os.path.join(FrontendConfiguration.get_target_path(), 'sli'))):
-        os.makedirs(os.path.realpath(os.path.join(FrontendConfiguration.get_target_path(), 'sli')))
-
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(), 'sli',
-                               FrontendConfiguration.get_module_name() + "-init")) + '.sli', 'w+') as f:
-        f.write(str(template_sli_init.render(namespace)))
+    unit = FrontendConfiguration.get_module_name()
+    with Profiler.measure('template_rendering', unit):
+        module_header = get_template('ModuleHeader.jinja2').render(namespace)
+        module_class = get_template('ModuleClass.jinja2').render(namespace)
+        cmakelists = get_template('CMakeLists.jinja2', setup=True).render(namespace)
+        sli_init = get_template('SLI_Init.jinja2', setup=True).render(namespace)
+
+    with Profiler.measure('file_writing', unit):
+        sink = FrontendConfiguration.get_output_sink()
+        sink.write(FrontendConfiguration.get_module_name() + '.h', str(module_header))
+        sink.write(FrontendConfiguration.get_module_name() + '.cpp', str(module_class))
+        sink.write('CMakeLists.txt', str(cmakelists))
+        sink.write(os.path.join('sli', FrontendConfiguration.get_module_name() + '-init.sli'), str(sli_init))
 
     code, message = Messages.get_module_generated(FrontendConfiguration.get_target_path())
     Logger.log_message(None, code, message, None, LoggingLevel.INFO)
 
 
 def analyse_and_generate_neurons(neurons):
-    # type: (list(ASTNeuron)) -> None
+    # type: (list(ASTNeuron)) -> list(ASTNeuron)
     """
-    Analysis a list of neurons, solves them and generates the corresponding code.
+    Analysis a list of neurons, solves them and generates the corresponding code. If the symbolic analysis of a
+    neuron exceeds its time budget, the neuron is solved numerically instead. Only neurons whose functional shapes
+    could not be transformed to odes in time are not generated, since the numeric solver requires them as odes.
     :param neurons: a list of neurons.
+    :return: the list of generated neurons.
     """
+    generated = list()
     for neuron in neurons:
         if Logger.logging_level == LoggingLevel.INFO:
             print("Generates code for the neuron {}.".format(neuron.get_name()))
-        analyse_and_generate_neuron(neuron)
+        with Profiler.profile_neuron(neuron.get_name(), FrontendConfiguration.get_output_sink()):
+            try:
+                analyse_and_generate_neuron(neuron)
+            except AnalysisTimeoutException as e:
+                # only raised by the transformation of functional shapes, which the numeric solver relies on
+                code, message = Messages.get_analysis_timeout(neuron.get_name(), e.phase, e.budget, False)
+                Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.ERROR)
+                continue
+        generated.append(neuron)
+    return generated
 
 
 def analyse_and_generate_neuron(neuron):
@@ -132,21 +156,26 @@ def analyse_and_generate_neuron(neuron):
     equations_block = ASTHelper.get_equations_block_from_neuron(neuron)
     shape_to_buffers = {}
     if ASTHelper.get_equations_block_from_neuron(neuron) is not None:
-        # extract function names and corresponding incoming buffers
-        convolve_calls = OdeTransformer.get_sum_function_calls(equations_block)
-        for convolve in convolve_calls:
-            shape_to_buffers[str(convolve.get_args()[0])] = str(convolve.get_args()[1])
-        OdeTransformer.refactor_convolve_call(ASTHelper.get_equations_block_from_neuron(neuron))
-        make_functions_self_contained(ASTHelper.get_ode_functions_from_equations_block(equations_block))
-        replace_functions_through_defining_expressions(ASTHelper.get_ode_equations_from_equations_block(equations_block),
-                                                       ASTHelper.get_ode_functions_from_equations_block(equations_block))
-        # transform everything into gsl processable (e.g. no functional shapes) or exact form.
-        transform_shapes_and_odes(neuron, shape_to_buffers)
-        # update the symbol table
-        neuron.accept(ASTSymbolTableVisitor())
+        with Profiler.measure('ode_transformation', neuron.get_name()):
+            # extract function names and corresponding incoming buffers
+            convolve_calls = OdeTransformer.get_sum_function_calls(equations_block)
+            for convolve in convolve_calls:
+                shape_to_buffers[str(convolve.get_args()[0])] = str(convolve.get_args()[1])
+            OdeTransformer.refactor_convolve_call(ASTHelper.get_equations_block_from_neuron(neuron))
+            make_functions_self_contained(ASTHelper.get_ode_functions_from_equations_block(equations_block))
+            replace_functions_through_defining_expressions(
+                ASTHelper.get_ode_equations_from_equations_block(equations_block),
+                ASTHelper.get_ode_functions_from_equations_block(equations_block))
+            # transform everything into gsl processable (e.g. no functional shapes) or exact form.
+            with _analysis_lock, TimeBudget.limit_neuron():
+                transform_shapes_and_odes(neuron, shape_to_buffers)
+        with Profiler.measure('symbol_table_and_cocos', neuron.get_name()):
+            # update the symbol table
+            neuron.accept(ASTSymbolTableVisitor())
     generate_nest_code(neuron)
-    # now store the transformed model
-    store_transformed_model(neuron)
+    with Profiler.measure('file_writing', neuron.get_name()):
+        # now store the transformed model
+        store_transformed_model(neuron)
     # at that point all shapes are transformed into the ODE form and spikes can be applied
     code, message = Messages.get_code_generated(neuron.get_name(), FrontendConfiguration.get_target_path())
     Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
@@ -158,8 +187,6 @@ def generate_nest_code(neuron):
     For a handed over neuron, this method generates the corresponding header and implementation file.
     :param neuron: a single neuron object.
     """
-    if not os.path.isdir(FrontendConfiguration.get_target_path()):
-        os.makedirs(FrontendConfiguration.get_target_path())
     generate_model_h_file(neuron)
     generate_neuron_cpp_file(neuron)
 
@@ -171,9 +198,10 @@ def generate_model_h_file(neuron):
     :param neuron: a single neuron object.
     """
     # print("!!!", neuron)
-    neuron_h_file = template_neuron_h_file.render(setup_generation_helpers(neuron))
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(), neuron.get_name())) + '.h', 'w+') as f:
-        f.write(str(neuron_h_file))
+    with Profiler.measure('template_rendering', neuron.get_name()):
+        neuron_h_file = get_template('NeuronHeader.jinja2').render(setup_generation_helpers(neuron))
+    with Profiler.measure('file_writing', neuron.get_name()):
+        FrontendConfiguration.get_output_sink().write(neuron.get_name() + '.h', str(neuron_h_file))
 
 
 def generate_neuron_cpp_file(neuron):
@@ -182,9 +210,10 @@ def generate_neuron_cpp_file(neuron):
     For a handed over neuron, this method generates the corresponding implementation file.
     :param neuron: a single neuron object.
     """
-    neuron_cpp_file = template_neuron_cpp_file.render(setup_generation_helpers(neuron))
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(), neuron.get_name())) + '.cpp', 'w+') as f:
-        f.write(str(neuron_cpp_file))
+    with Profiler.measure('template_rendering', neuron.get_name()):
+        neuron_cpp_file = get_template('NeuronClass.jinja2').render(setup_generation_helpers(neuron))
+    with Profiler.measure('file_writing', neuron.get_name()):
+        FrontendConfiguration.get_output_sink().write(neuron.get_name() + '.cpp', str(neuron_cpp_file))
 
 
 def setup_generation_helpers(neuron):
@@ -233,11 +262,10 @@ def define_solver_type(neuron, namespace):
     :param neuron: a single neuron
     """
     namespace['useGSL'] = False
-    if ASTHelper.get_equations_block_from_neuron(neuron) is not None and \
-            len(ASTHelper.get_equations_block_from_neuron(neuron).get_declarations()) > 0:
-        if (not is_functional_shape_present(ASTHelper.get_ode_shapes_from_equations_block(
-                ASTHelper.get_equations_block_from_neuron(neuron)))) or \
-                len(ASTHelper.get_ode_equations_from_equations_block(ASTHelper.get_equations_block_from_neuron(neuron))) > 1:
+    equations_block = ASTHelper.get_equations_block_from_neuron(neuron)
+    if equations_block is not None and len(equations_block.get_declarations()) > 0:
+        if (not is_functional_shape_present(ASTHelper.get_ode_shapes_from_equations_block(equations_block))) or \
+                len(ASTHelper.get_ode_equations_from_equations_block(equations_block)) > 1:
             namespace['names'] = GSLNamesConverter()
             namespace['useGSL'] = True
             converter = NESTReferenceConverter(True)
@@ -283,15 +311,26 @@ def transform_shapes_and_odes(neuron, shape_to_buffers):
                 str(ASTHelper.get_ode_shapes_from_equations_block(equations_block)[0].get_expression()).strip().\
                         startswith("delta"):  # assume the model is well formed
             shape = ASTHelper.get_ode_shapes_from_equations_block(equations_block)[0]
-
-            integrate_delta_solution(equations_block, neuron, shape, shape_to_buffers)
+            try:
+                integrate_delta_solution(equations_block, neuron, shape, shape_to_buffers)
+            except AnalysisTimeoutException as e:
+                log_analysis_timeout(neuron, e)
+                integrate_delta_numerically(equations_block, neuron, shape, shape_to_buffers)
             return result
         elif len(ASTHelper.get_ode_equations_from_equations_block(equations_block)) == 1:
             code, message = Messages.get_neuron_analyzed(neuron.get_name())
             Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
-            solver_result = solve_ode_with_shapes(equations_block)
-
-            if solver_result["solver"] is "analytical":
+            try:
+                with Profiler.measure('ode_toolbox', neuron.get_name()):
+                    solver_result = solve_ode_with_shapes(equations_block)
+            except AnalysisTimeoutException as e:
+                log_analysis_timeout(neuron, e)
+                solver_result = None
+
+            if solver_result is None:
+                # the numeric solver only requires the functional shapes to be transformed
+                transform_functional_shapes_to_odes(result, equations_block)
+            elif solver_result["solver"] is "analytical":
                 result = integrate_exact_solution(neuron, solver_result)
                 ASTHelper.remove_equations_block_from_neuron(result)
             elif solver_result["solver"] is "numeric":
@@ -306,19 +345,37 @@ def transform_shapes_and_odes(neuron, shape_to_buffers):
         else:
             code, message = Messages.get_neuron_solved_by_solver(neuron.get_name())
             Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
-            at_least_one_functional_shape = False
-            for shape in ASTHelper.get_ode_shapes_from_equations_block(equations_block):
-                if shape.get_variable().get_differential_order() == 0:
-                    at_least_one_functional_shape = True
-                    break
-            if at_least_one_functional_shape:
-                ode_shapes = solve_functional_shapes(equations_block)
-                functional_shapes_to_odes(result, ode_shapes)
+            transform_functional_shapes_to_odes(result, equations_block)
 
         apply_spikes_from_buffers(result, shape_to_buffers)
     return result
 
 
+def log_analysis_timeout(neuron, exception):
+    # type: (ASTNeuron, AnalysisTimeoutException) -> None
+    """
+    Reports that a phase of the symbolic analysis of the handed over neuron has been cancelled, while the neuron is
+    solved numerically instead.
+    :param neuron: a single neuron instance.
+    :param exception: the exception raised by the cancelled phase.
+    """
+    code, message = Messages.get_analysis_timeout(neuron.get_name(), exception.phase, exception.budget, True)
+    Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.WARNING)
+
+
+def transform_functional_shapes_to_odes(neuron, equations_block):
+    # type: (ASTNeuron, ASTEquationsBlock) -> None
+    """
+    Prepares the handed over neuron to be solved numerically by replacing all functional shapes by odes.
+    :param neuron: a single neuron instance.
+    :param equations_block: the equations block of the neuron.
+    """
+    if is_functional_shape_present(ASTHelper.get_ode_shapes_from_equations_block(equations_block)):
+        with Profiler.measure('ode_toolbox', neuron.get_name()):
+            ode_shapes = solve_functional_shapes(equations_block)
+        functional_shapes_to_odes(neuron, ode_shapes)
+
+
 def apply_spikes_from_buffers(neuron, shape_to_buffers):
     spike_updates = []
     initial_values = ASTHelper.get_initial_values_block_from_neuron(neuron)
@@ -329,21 +386,46 @@ def apply_spikes_from_buffers(neuron, shape_to_buffers):
             buffer_type = neuron.get_scope(). \
                 resolve_to_symbol(shape_to_buffers[shape], SymbolKind.VARIABLE).get_type_symbol()
             if re.match(matcher_computed_shape_odes, str(variable)):
-                assignment_string = variable.get_complete_name() + " += (" + shape_to_buffers[
-                    shape] + '/' + buffer_type.print_nestml_type() + ") * " + \
-                                    _printer.print_expression(declaration.get_expression())
-                spike_updates.append(ModelParser.parse_assignment(assignment_string))
+                buffer = ASTConverter.create_compound_expression(
+                        ASTConverter.create_variable_expression(shape_to_buffers[shape]), 'is_div_op',
+                        ASTConverter.convert_expression(buffer_type.print_nestml_type()), is_encapsulated=True)
+                initial_value = ASTConverter.copy_expression(declaration.get_expression())
+                if _binds_weaker_than_product(initial_value):
+                    initial_value = ASTNodeFactory.create_ast_expression(
+                            is_encapsulated=True, expression=initial_value,
+                            source_position=ASTSourceLocation.get_added_source_position())
+                spike_updates.append(ASTConverter.create_stmt(assignment=ASTConverter.create_assignment(
+                        variable.get_complete_name(),
+                        ASTConverter.create_compound_expression(buffer, 'is_times_op', initial_value),
+                        'is_compound_sum')))
                 # the IV is applied. can be reset
-                declaration.set_expression(ModelParser.parse_expression("0"))
-    for assignment in spike_updates:
-        add_assignment_to_update_block(assignment, neuron)
+                declaration.set_expression(ASTConverter.create_numeric_expression(0))
+    add_stmts_to_update_block(spike_updates, neuron)
+
+
+def _binds_weaker_than_product(expression):
+    # type: (ASTExpression|ASTSimpleExpression) -> bool
+    """
+    Indicates whether the handed over expression has to be put in parentheses when used as a factor.
+    :param expression: a single expression
+    :return: True if the top-level operator binds weaker than a multiplication, otherwise False.
+    """
+    if isinstance(expression, ASTSimpleExpression) or expression.is_encapsulated or \
+            expression.unary_operator is not None:
+        return False
+    if expression.is_compound_expression():
+        operator = expression.get_binary_operator()
+        return not (isinstance(operator, ASTArithmeticOperator) and
+                    (operator.is_times_op or operator.is_div_op or operator.is_modulo_op or operator.is_pow_op))
+    return True
 
 
 def solve_ode_with_shapes(equations_block):
     # type: (ASTEquationsBlock) -> dict[str, list]
     odes_shapes_json = transform_ode_and_shapes_to_json(equations_block)
-
-    return analysis(odes_shapes_json)
+    # ode-toolbox (and thereby sympy) is only imported if an analysis is actually required
+    from odetoolbox import analysis
+    return TimeBudget.run('ode_toolbox', analysis, odes_shapes_json)
 
 
 def transform_ode_and_shapes_to_json(equations_block):
@@ -408,8 +490,9 @@ def transform_ode_and_shapes_to_json(equations_block):
 def solve_functional_shapes(equations_block):
     # type: (ASTEquationsBlock) -> dict[str, list]
     shapes_json = transform_functional_shapes_to_json(equations_block)
-
-    return analysis(shapes_json)
+    # ode-toolbox (and thereby sympy) is only imported if an analysis is actually required
+    from odetoolbox import analysis
+    return TimeBudget.run('ode_toolbox_shapes', analysis, shapes_json)
 
 
 def transform_functional_shapes_to_json(equations_block):
@@ -431,8 +514,6 @@ def transform_functional_shapes_to_json(equations_block):
     return result
 
 
-_variable_matching_template = r'(\b)({})(\b)'
-
 
 def make_functions_self_contained(functions):
     # type: (list(ASTOdeFunction)) -> list(ASTOdeFunction)
@@ -445,10 +526,10 @@ def make_functions_self_contained(functions):
     """
     for source in functions:
         for target in functions:
-            matcher = re.compile(_variable_matching_template.format(source.get_variable_name()))
-            target_definition = str(target.get_expression())
-            target_definition = re.sub(matcher, "(" + str(source.get_expression()) + ")", target_definition)
-            target.expression = ModelParser.parse_expression(target_definition)
+            target.expression = ASTConverter.substitute_variable(target.get_expression(), source.get_variable_name(),
+                                                                 source.get_expression())
+            target.get_expression().set_parent(target)
+            ASTConverter.mark_as_added(target.get_expression())
     return functions
 
 
@@ -464,10 +545,10 @@ def replace_functions_through_defining_expressions(definitions, functions):
     """
     for fun in functions:
         for target in definitions:
-            matcher = re.compile(_variable_matching_template.format(fun.get_variable_name()))
-            target_definition = str(target.get_rhs())
-            target_definition = re.sub(matcher, "(" + str(fun.get_expression()) + ")", target_definition)
-            target.rhs = ModelParser.parse_expression(target_definition)
+            target.rhs = ASTConverter.substitute_variable(target.get_rhs(), fun.get_variable_name(),
+                                                          fun.get_expression())
+            target.get_rhs().set_parent(target)
+            ASTConverter.mark_as_added(target.get_rhs())
     return definitions
 
 
@@ -490,6 +571,4 @@ def transform_functions_json(equations_block):
 
 def store_transformed_model(ast):
     if FrontendConfiguration.store_log:
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report',
-                                   ast.get_name())) + '.txt', 'w+') as f:
-            f.write(str(ast))
+        FrontendConfiguration.get_output_sink().write_report(ast.get_name() + '.txt', str(ast))
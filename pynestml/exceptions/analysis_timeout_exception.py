@@ -0,0 +1,38 @@
+#
+# analysis_timeout_exception.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class AnalysisTimeoutException(Exception):
+    """
+    This exception is thrown whenever a symbolic analysis has been cancelled since it exceeded its time budget.
+    """
+
+    def __init__(self, phase, budget):
+        """
+        Standard constructor.
+        :param phase: the name of the cancelled phase, e.g., ode_toolbox
+        :type phase: str
+        :param budget: the time budget in seconds.
+        :type budget: float
+        """
+        super(AnalysisTimeoutException, self).__init__('Phase \'%s\' exceeded its time budget of %g s!'
+                                                       % (phase, budget))
+        self.phase = phase
+        self.budget = budget
@@ -0,0 +1,239 @@
+#
+# build_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import json
+import os
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.compilation_session import session_state
+
+
+@session_state('stored_manifest', 'manifest')
+class BuildCache(object):
+    """
+    This class stores a manifest in the target directory which maps each generated neuron to a fingerprint of its
+    source model, the toolchain and the relevant options, as well as to the hashes of the generated files. Neurons
+    whose fingerprint and generated files are unchanged do not have to be analysed and generated again.
+    Attributes:
+        manifest_file_name (str): The name of the manifest as stored in the target directory.
+        stored_manifest (dict): The manifest as stored by the previous run.
+        manifest (dict): The manifest of the current run.
+        toolchain_fingerprint (str): A fingerprint of all sources and templates of the toolchain.
+    """
+    manifest_file_name = '.pynestml_manifest.json'
+    stored_manifest = None
+    manifest = None
+    toolchain_fingerprint = None
+
+    @classmethod
+    def load_manifest(cls):
+        """
+        Loads the manifest as stored in the target directory. A missing or broken manifest is regarded as empty.
+        """
+        cls.stored_manifest = {'neurons': {}, 'module': None}
+        cls.manifest = {'neurons': {}, 'module': None}
+        manifest_path = os.path.join(FrontendConfiguration.get_target_path(), cls.manifest_file_name)
+        if os.path.isfile(manifest_path):
+            try:
+                with open(manifest_path, 'r') as f:
+                    cls.stored_manifest = json.load(f)
+            except ValueError:
+                pass
+
+    @classmethod
+    def store_manifest(cls):
+        """
+        Stores the manifest of the current run in the target directory.
+        """
+        if not os.path.isdir(FrontendConfiguration.get_target_path()):
+            os.makedirs(FrontendConfiguration.get_target_path())
+        with open(os.path.join(FrontendConfiguration.get_target_path(), cls.manifest_file_name), 'w+') as f:
+            json.dump(cls.manifest, f, indent=2, sort_keys=True)
+
+    @classmethod
+    def compute_fingerprint(cls, model_file):
+        """
+        Computes the fingerprint of all neurons contained in the handed over file.
+        :param model_file: the path to a model file.
+        :type model_file: str
+        :return: the fingerprint
+        :rtype: str
+        """
+        fingerprint = hashlib.sha1()
+        with open(model_file, 'rb') as f:
+            fingerprint.update(f.read())
+        fingerprint.update(cls.get_toolchain_fingerprint().encode('utf-8'))
+        fingerprint.update(cls.get_options_fingerprint().encode('utf-8'))
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def get_toolchain_fingerprint(cls):
+        """
+        Returns a fingerprint of all python sources and templates of the toolchain, such that every modification
+        of the toolchain invalidates the generated code.
+        :return: the fingerprint
+        :rtype: str
+        """
+        if cls.toolchain_fingerprint is None:
+            fingerprint = hashlib.sha1()
+            toolchain_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+            for directory, sub_directories, file_names in os.walk(toolchain_dir):
+                sub_directories.sort()
+                for file_name in sorted(file_names):
+                    if file_name.endswith('.py') or file_name.endswith('.jinja2'):
+                        fingerprint.update(file_name.encode('utf-8'))
+                        with open(os.path.join(directory, file_name), 'rb') as f:
+                            fingerprint.update(f.read())
+            cls.toolchain_fingerprint = fingerprint.hexdigest()
+        return cls.toolchain_fingerprint
+
+    @classmethod
+    def get_options_fingerprint(cls):
+        """
+        Returns a representation of all options which influence the generated code.
+        :return: the options
+        :rtype: str
+        """
+        return json.dumps({'module_name': FrontendConfiguration.get_module_name(),
+                           'store_log': FrontendConfiguration.store_log}, sort_keys=True)
+
+    @classmethod
+    def is_neuron_up_to_date(cls, neuron_name, fingerprint):
+        """
+        Indicates whether the generated code of a neuron is up to date, i.e., the neuron has been generated with the
+        same fingerprint and the generated files have not been modified since.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :param fingerprint: the fingerprint of the neuron
+        :type fingerprint: str
+        :return: True if up to date, otherwise False.
+        :rtype: bool
+        """
+        entry = cls.stored_manifest['neurons'].get(neuron_name)
+        return entry is not None and entry['fingerprint'] == fingerprint and cls.__files_unchanged(entry['files'])
+
+    @classmethod
+    def register_neuron(cls, neuron_name, fingerprint, file_hashes):
+        """
+        Registers the generated code of a neuron in the manifest of the current run. Only neurons whose code has
+        been generated completely are registered, such that stale or missing files are never regarded as up to date.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :param fingerprint: the fingerprint of the neuron
+        :type fingerprint: str
+        :param file_hashes: a map from the name of each file written for the neuron to the hash of its content.
+        :type file_hashes: dict(str->str)
+        """
+        if all(file_name in file_hashes for file_name in cls.get_neuron_file_names(neuron_name)):
+            cls.manifest['neurons'][neuron_name] = {'fingerprint': fingerprint, 'files': dict(file_hashes)}
+
+    @classmethod
+    def get_neuron_file_names(cls, neuron_name):
+        """
+        Returns the names of the files generated for a neuron, relative to the target directory.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :return: a list of file names.
+        :rtype: list(str)
+        """
+        return [neuron_name + '.h', neuron_name + '.cpp']
+
+    @classmethod
+    def get_neuron_entry(cls, neuron_name):
+        """
+        Returns the entry of a neuron in the manifest of the current run.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :return: the entry
+        :rtype: dict
+        """
+        return cls.manifest['neurons'].get(neuron_name)
+
+    @classmethod
+    def set_neuron_entry(cls, neuron_name, entry):
+        """
+        Sets the entry of a neuron in the manifest of the current run, e.g., as computed by a different process.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :param entry: the entry
+        :type entry: dict
+        """
+        cls.manifest['neurons'][neuron_name] = entry
+
+    @classmethod
+    def retain_neuron(cls, neuron_name):
+        """
+        Takes over the entry of a neuron from the stored manifest into the manifest of the current run, e.g., if the
+        neuron has not been processed in the current run since its model has not been modified.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        """
+        entry = cls.stored_manifest['neurons'].get(neuron_name)
+        if entry is not None:
+            cls.manifest['neurons'][neuron_name] = entry
+
+    @classmethod
+    def is_module_up_to_date(cls, neuron_names):
+        """
+        Indicates whether the generated module code is up to date, i.e., the set of neurons has not changed and
+        the generated files have not been modified since.
+        :param neuron_names: the names of all neurons of the module.
+        :type neuron_names: list(str)
+        :return: True if up to date, otherwise False.
+        :rtype: bool
+        """
+        entry = cls.stored_manifest['module']
+        return (entry is not None and entry['fingerprint'] == cls.__compute_module_fingerprint(neuron_names) and
+                cls.__files_unchanged(entry['files']))
+
+    @classmethod
+    def register_module(cls, neuron_names):
+        """
+        Registers the generated module code in the manifest of the current run.
+        :param neuron_names: the names of all neurons of the module.
+        :type neuron_names: list(str)
+        """
+        module_name = FrontendConfiguration.get_module_name()
+        cls.manifest['module'] = {'fingerprint': cls.__compute_module_fingerprint(neuron_names),
+                                  'files': cls.__hash_files([module_name + '.h', module_name + '.cpp',
+                                                             'CMakeLists.txt',
+                                                             os.path.join('sli', module_name + '-init.sli')])}
+
+    @classmethod
+    def __compute_module_fingerprint(cls, neuron_names):
+        fingerprint = hashlib.sha1()
+        fingerprint.update(json.dumps(sorted(neuron_names)).encode('utf-8'))
+        fingerprint.update(cls.get_toolchain_fingerprint().encode('utf-8'))
+        fingerprint.update(cls.get_options_fingerprint().encode('utf-8'))
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def __hash_files(cls, file_names):
+        ret = {}
+        for file_name in file_names:
+            file_path = os.path.join(FrontendConfiguration.get_target_path(), file_name)
+            if os.path.isfile(file_path):
+                with open(file_path, 'rb') as f:
+                    ret[file_name] = hashlib.sha1(f.read()).hexdigest()
+        return ret
+
+    @classmethod
+    def __files_unchanged(cls, file_hashes):
+        return len(file_hashes) > 0 and cls.__hash_files(file_hashes.keys()) == file_hashes
@@ -0,0 +1,168 @@
+#
+# compile_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import socket
+import threading
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+from pynestml.exceptions.invalid_path_exception import InvalidPathException
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import create_arguments, init_predefined, process
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger
+
+compile_job_arguments = ('path', 'target', 'dry', 'logging_level', 'module_name', 'store_log', 'dev', 'jobs',
+                         'analysis_timeout', 'neuron_timeout', 'ast_cache')
+
+
+class CompileServer(object):
+    """
+    This class represents a long-running compile server which keeps the predefined types, units, functions and
+    variables as well as the templates loaded and processes compile jobs as received on a Unix socket.
+    Each request is a single line containing a JSON object with the same arguments as accepted by to_nest, e.g.,
+        {"path": "models/iaf_psc_alpha.nestml", "target": "target", "module_name": "mymodule"}
+    and is answered by a single line containing a JSON object with the status and the log of the job, e.g.,
+        {"status": "ok", "log": [...]}
+    A request {"command": "shutdown"} stops the server. Each job is processed in a compilation session of its own.
+    Connections are served in threads of their own, while the jobs themselves are processed one after another.
+    Attributes:
+        server (socketserver.UnixStreamServer): The server as currently running.
+        job_lock (threading.Lock): Held while a compile job is processed.
+    """
+    server = None
+    job_lock = threading.Lock()
+
+    @classmethod
+    def serve(cls, socket_path):
+        """
+        Starts the compile server on the handed over socket and blocks until it receives a shutdown request.
+        :param socket_path: the path to the Unix socket.
+        :type socket_path: str
+        """
+        init_predefined()
+        # messages are not printed but handed over to the client
+        Logger.no_print = True
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        cls.server = _ThreadingUnixStreamServer(socket_path, _CompileRequestHandler)
+        try:
+            cls.server.serve_forever()
+        finally:
+            cls.server.server_close()
+            cls.server = None
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    @classmethod
+    def handle_request(cls, line):
+        """
+        Handles a single request as received from a client.
+        :param line: a single line containing the request.
+        :type line: bytes
+        :return: the response
+        :rtype: dict
+        """
+        try:
+            request = json.loads(line.decode('utf-8'))
+        except ValueError as e:
+            return {'status': 'error', 'message': 'Not a valid request: %s' % e}
+        if request.get('command', 'compile') == 'shutdown':
+            # the server waits for this handler to return, thus it has to be stopped from a different thread
+            threading.Thread(target=cls.server.shutdown).start()
+            return {'status': 'ok'}
+        with cls.job_lock:
+            return cls.compile(request)
+
+    @classmethod
+    def compile(cls, request):
+        """
+        Processes a single compile job.
+        :param request: the arguments of the job, cf. to_nest.
+        :type request: dict
+        :return: the response containing the status and the log of the job.
+        :rtype: dict
+        """
+        unknown = [key for key in request.keys() if key not in compile_job_arguments and key != 'command']
+        if len(unknown) > 0:
+            return {'status': 'error', 'message': 'Unknown arguments: %s' % ', '.join(sorted(unknown))}
+        if 'path' not in request:
+            return {'status': 'error', 'message': 'No path provided!'}
+        # each job is processed in a session of its own, which starts with the predefined elements of the server
+        with CompilationSession():
+            try:
+                FrontendConfiguration.parse_config(create_arguments(**dict((key, value) for key, value
+                                                                           in request.items() if key != 'command')))
+            except (InvalidPathException, SystemExit):
+                return {'status': 'error', 'message': 'Not a valid configuration: %s' % json.dumps(request)}
+            if not os.path.exists(FrontendConfiguration.get_path()):
+                return {'status': 'error',
+                        'message': 'Not a valid path to model or directory: "%s"!' % FrontendConfiguration.get_path()}
+            Logger.no_print = True
+            try:
+                process(reuse_predefined=True)
+            except Exception as e:
+                return {'status': 'error', 'message': '%s: %s' % (type(e).__name__, e),
+                        'log': json.loads(Logger.get_json_format())}
+            return {'status': 'ok', 'log': json.loads(Logger.get_json_format())}
+
+    @classmethod
+    def submit(cls, socket_path, **request):
+        """
+        Submits a single job to a running compile server and waits for the response.
+        :param socket_path: the path to the Unix socket of the server.
+        :type socket_path: str
+        :param request: the arguments of the job, cf. to_nest, or command='shutdown'.
+        :return: the response of the server.
+        :rtype: dict
+        """
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(socket_path)
+            client.sendall((json.dumps(request) + '\n').encode('utf-8'))
+            response = client.makefile('r')
+            try:
+                return json.loads(response.readline())
+            finally:
+                response.close()
+        finally:
+            client.close()
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _CompileRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers each line received on a single connection.
+    """
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            self.wfile.write((json.dumps(CompileServer.handle_request(line)) + '\n').encode('utf-8'))
+            self.wfile.flush()
@@ -19,9 +19,15 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 import argparse  # used for parsing of input arguments
 import os
+import tempfile
 
 from pynestml.exceptions.invalid_path_exception import InvalidPathException
+from pynestml.frontend.output_sink import FileSystemSink
+from pynestml.utils.ast_cache import ASTCache
+from pynestml.utils.compilation_session import session_state
 from pynestml.utils.logger import Logger
+from pynestml.utils.profiler import Profiler
+from pynestml.utils.time_budget import TimeBudget
 
 help_path = 'Path to a single file or a directory containing the source models.'
 help_target = 'Path to a target directory where models should be generated to. Standard is "target".'
@@ -34,6 +40,20 @@ help_log = 'Indicates whether a log file containing all messages shall be stored
 help_dev = 'Indicates whether the dev mode should be active, i.e., ' \
            'the whole toolchain executed even though errors in models are present.' \
            ' This option is designed for debug purpose only!'
+help_jobs = 'Indicates the number of processes used to process the models in parallel. Standard is 1.'
+help_profile = 'Indicates that a report of the time spent in the individual phases shall be stored next to the log. ' \
+               'With "cprofile", additionally a cProfile statistics file is stored for each neuron.'
+help_serve = 'Starts a compile server which listens on the handed over Unix socket and processes compile jobs. ' \
+             'Standard socket is "pynestml.sock" in the temporary directory.'
+help_watch = 'Watches the model path and recompiles all modified models. Optionally, the interval between two ' \
+             'checks can be handed over in seconds. Standard is 1.'
+help_analysis_timeout = 'Indicates the time in seconds available to a single phase of the symbolic analysis of a ' \
+                        'neuron. If exceeded, the analysis is cancelled and the neuron is solved numerically. ' \
+                        'Standard is unlimited.'
+help_neuron_timeout = 'Indicates the time in seconds available to the symbolic analysis of a neuron as a whole. ' \
+                      'Standard is unlimited.'
+help_ast_cache = 'Indicates a directory where the ASTs of parsed models are cached, such that unchanged models are ' \
+                 'not parsed again. Standard is no cache.'
 
 qualifier_path_arg = '-path'
 qualifier_target_arg = '-target'
@@ -42,8 +62,18 @@ qualifier_logging_level_arg = '-logging_level'
 qualifier_module_name_arg = '-module_name'
 qualifier_store_log_arg = '-store_log'
 qualifier_dev_arg = '-dev'
+qualifier_jobs_arg = '-jobs'
+qualifier_serve_arg = '-serve'
+qualifier_profile_arg = '-profile'
+qualifier_watch_arg = '-watch'
+qualifier_analysis_timeout_arg = '-analysis_timeout'
+qualifier_neuron_timeout_arg = '-neuron_timeout'
+qualifier_ast_cache_arg = '-ast_cache'
 
 
+@session_state('argument_parser', 'paths_to_compilation_units', 'provided_path', 'logging_level', 'dry_run',
+               'target_path', 'module_name', 'store_log', 'is_debug', 'number_of_jobs', 'arguments',
+               'server_socket_path', 'profile', 'output_sink', 'watch_interval')
 class FrontendConfiguration(object):
     """
     This class encapsulates all settings as handed over to the frontend at start of the toolchain.
@@ -57,6 +87,12 @@ class FrontendConfiguration(object):
     module_name = None
     store_log = False
     is_debug = False
+    number_of_jobs = 1
+    arguments = None
+    server_socket_path = None
+    profile = False
+    output_sink = None
+    watch_interval = None
 
     @classmethod
     def parse_config(cls, args):
@@ -88,7 +124,30 @@ class FrontendConfiguration(object):
                                          help=help_log)
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true',
                                          help=help_dev)
+        cls.argument_parser.add_argument(qualifier_jobs_arg, type=int, nargs='?', default=1,
+                                         help=help_jobs)
+        cls.argument_parser.add_argument(qualifier_profile_arg, type=str, nargs='?', const='report',
+                                         choices=['report', 'cprofile'], help=help_profile)
+        cls.argument_parser.add_argument(qualifier_serve_arg, metavar='Socket', type=str, nargs='?',
+                                         const=os.path.join(tempfile.gettempdir(), 'pynestml.sock'),
+                                         help=help_serve)
+        cls.argument_parser.add_argument(qualifier_watch_arg, metavar='Interval', type=float, nargs='?', const=1.0,
+                                         help=help_watch)
+        cls.argument_parser.add_argument(qualifier_analysis_timeout_arg, metavar='Seconds', type=float,
+                                         help=help_analysis_timeout)
+        cls.argument_parser.add_argument(qualifier_neuron_timeout_arg, metavar='Seconds', type=float,
+                                         help=help_neuron_timeout)
+        cls.argument_parser.add_argument(qualifier_ast_cache_arg, metavar='Directory', type=str,
+                                         help=help_ast_cache)
         parsed_args = cls.argument_parser.parse_args(args)
+        # store the arguments, such that the configuration can be restored in worker processes
+        cls.arguments = list(args)
+        # by default, all artifacts are written to the target directory
+        cls.output_sink = None
+        # in server mode, the models are handed over with the compile jobs
+        cls.server_socket_path = parsed_args.serve
+        if cls.server_socket_path is not None:
+            return
         # get the source path
         cls.__handle_source_path(parsed_args.path[0])
 
@@ -114,6 +173,15 @@ class FrontendConfiguration(object):
             cls.module_name = 'module'
         cls.store_log = parsed_args.store_log
         cls.is_debug = parsed_args.dev
+        cls.number_of_jobs = max(parsed_args.jobs, 1) if parsed_args.jobs is not None else 1
+        cls.watch_interval = parsed_args.watch
+        # initialize the profiler
+        cls.profile = parsed_args.profile is not None
+        Profiler.init_profiler(cls.profile, parsed_args.profile == 'cprofile')
+        # initialize the time budgets of the symbolic analysis
+        TimeBudget.init_time_budget(parsed_args.analysis_timeout, parsed_args.neuron_timeout)
+        # initialize the cache of parsed models
+        ASTCache.init_ast_cache(parsed_args.ast_cache)
         return
 
     @classmethod
@@ -179,6 +247,96 @@ class FrontendConfiguration(object):
         """
         return cls.is_debug
 
+    @classmethod
+    def get_number_of_jobs(cls):
+        """
+        Returns the number of processes which shall be used to process the models.
+        :return: the number of jobs.
+        :rtype: int
+        """
+        return cls.number_of_jobs
+
+    @classmethod
+    def get_arguments(cls):
+        """
+        Returns the arguments as handed over to the frontend.
+        :return: a list of arguments
+        :rtype: list(str)
+        """
+        return cls.arguments
+
+    @classmethod
+    def is_profile(cls):
+        """
+        Returns whether a report of the time spent in the individual phases shall be stored.
+        :return: True if profiling is active, otherwise False.
+        :rtype: bool
+        """
+        return cls.profile
+
+    @classmethod
+    def get_report_path(cls):
+        """
+        Returns the path to the directory where the log and other reports are stored.
+        :return: the report path.
+        :rtype: str
+        """
+        return os.path.join(cls.target_path, '..', 'report')
+
+    @classmethod
+    def get_output_sink(cls):
+        """
+        Returns the sink to which all generated artifacts and reports are written. If none has been set, the target
+        and report directory are used.
+        :return: the output sink
+        :rtype: OutputSink
+        """
+        if cls.output_sink is None:
+            cls.output_sink = FileSystemSink(cls.get_target_path(), cls.get_report_path())
+        return cls.output_sink
+
+    @classmethod
+    def set_output_sink(cls, output_sink):
+        """
+        Updates the sink to which all generated artifacts and reports are written.
+        :param output_sink: a single output sink.
+        :type output_sink: OutputSink
+        """
+        cls.output_sink = output_sink
+
+    @classmethod
+    def get_server_socket_path(cls):
+        """
+        Returns the path to the Unix socket on which the compile server shall listen.
+        :return: the path to the socket, None if no server shall be started.
+        :rtype: str
+        """
+        return cls.server_socket_path
+
+    @classmethod
+    def get_watch_interval(cls):
+        """
+        Returns the interval in seconds between two checks of the model path for modifications.
+        :return: the interval, None if the model path shall not be watched.
+        :rtype: float
+        """
+        return cls.watch_interval
+
+    @classmethod
+    def update_files(cls):
+        """
+        Updates the list of all files to process, e.g., after files have been added to or removed from the handed
+        over directory.
+        """
+        cls.paths_to_compilation_units = list()
+        if os.path.isfile(cls.provided_path):
+            cls.paths_to_compilation_units.append(cls.provided_path)
+        elif os.path.isdir(cls.provided_path):
+            # sort the files in order to process them in a deterministic order
+            for filename in sorted(os.listdir(cls.provided_path)):
+                if filename.endswith(".nestml"):
+                    cls.paths_to_compilation_units.append(os.path.join(cls.provided_path, filename))
+
     @classmethod
     def __handle_target_path(cls, path):
         # check if a target has been selected, otherwise set the buildNest as target
@@ -192,9 +350,6 @@ class FrontendConfiguration(object):
         else:
             pynestml_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
             cls.target_path = os.path.join(pynestml_dir, 'target')
-        # check if the target path dir already exists
-        if not os.path.isdir(cls.target_path):
-            os.makedirs(cls.target_path)
 
     @classmethod
     def __handle_source_path(cls, path):
@@ -203,18 +358,13 @@ class FrontendConfiguration(object):
             # check if the mandatory path arg has been handed over, just terminate
             raise InvalidPathException('Invalid source path!')
         else:
-            cls.paths_to_compilation_units = list()
             if os.path.isabs(path):
                 cls.provided_path = path
             # a relative path, reconstruct it. get the parent dir where models, pynestml etc. is located
             else:
                 pynestml_dir = os.getcwd()
                 cls.provided_path = os.path.join(pynestml_dir, path)
-            if os.path.isfile(cls.provided_path):
-                cls.paths_to_compilation_units.append(cls.provided_path)
-            elif os.path.isdir(cls.provided_path):
-                for filename in os.listdir(cls.provided_path):
-                    if filename.endswith(".nestml"):
-                        cls.paths_to_compilation_units.append(os.path.join(cls.provided_path, filename))
+            if os.path.isfile(cls.provided_path) or os.path.isdir(cls.provided_path):
+                cls.update_files()
             else:
                 cls.paths_to_compilation_units = cls.provided_path
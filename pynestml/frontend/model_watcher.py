@@ -0,0 +1,138 @@
+#
+# model_watcher.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import time
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.build_cache import BuildCache
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined, create_name_index, process_neurons, \
+    generate_outdated_module_code, store_log_to_file, store_profile_to_file
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
+
+
+class ModelWatcher(object):
+    """
+    This class watches the model path as selected in the frontend configuration by polling the modification times
+    of all model files. On each change, only the modified files are parsed and checked again, while only the
+    neurons contained in these files are analysed and generated again. Of all other files, only the names of the
+    neurons are retained.
+    Attributes:
+        interval (float): The interval in seconds between two checks of the model path.
+        stamps (dict): Map from the path of each file to its modification time and size as seen by the last check.
+        name_index (dict): Map from the path of each file to the index of all neurons declared in the file.
+        valid_neurons (dict): Map from the path of each file to body-less copies of its neurons without errors.
+    """
+
+    def __init__(self, interval = 1.0):
+        """
+        Standard constructor.
+        :param interval: the interval in seconds between two checks of the model path.
+        :type interval: float
+        """
+        self.interval = interval
+        self.stamps = dict()
+        self.name_index = dict()
+        self.valid_neurons = dict()
+
+    def watch(self):
+        """
+        Processes all models and subsequently recompiles modified models until interrupted.
+        """
+        init_predefined()
+        try:
+            while True:
+                self.update()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+
+    def poll(self):
+        """
+        Checks the model path for modified, added and removed files.
+        :return: the paths to all modified or added files as well as to all removed files.
+        :rtype: (list(str),list(str))
+        """
+        FrontendConfiguration.update_files()
+        stamps = dict()
+        for model_file in FrontendConfiguration.get_files():
+            try:
+                stat = os.stat(model_file)
+            except OSError:
+                # the file has been removed in the meantime
+                continue
+            stamps[model_file] = (stat.st_mtime, stat.st_size)
+        modified = [model_file for model_file in sorted(stamps.keys())
+                    if self.stamps.get(model_file) != stamps[model_file]]
+        removed = [model_file for model_file in sorted(self.stamps.keys()) if model_file not in stamps.keys()]
+        self.stamps = stamps
+        return modified, removed
+
+    def update(self):
+        """
+        Recompiles all files which have been modified since the last check.
+        :return: True if files have been recompiled, otherwise False.
+        :rtype: bool
+        """
+        modified, removed = self.poll()
+        if len(modified) == 0 and len(removed) == 0:
+            return False
+        # the log and the profile only cover the current recompilation
+        Logger.init_logger(Logger.logging_level)
+        Profiler.init_profiler(Profiler.enabled, Profiler.profile_neurons)
+        code, message = Messages.get_models_changed(modified, removed)
+        Logger.log_message(neuron=None, code=code, message=message, log_level=LoggingLevel.INFO)
+        sink = FrontendConfiguration.get_output_sink()
+        sink.open()
+        for model_file in removed:
+            # files which could not be processed have not been indexed
+            self.name_index.pop(model_file, None)
+            self.valid_neurons.pop(model_file, None)
+        for model_file in modified:
+            self.name_index[model_file] = create_name_index([model_file])
+            self.valid_neurons[model_file] = list()
+        # check if across two files two neurons with same name have been defined
+        CoCosManager.check_not_two_neurons_in_name_index(
+            [entry for model_file in sorted(self.name_index.keys()) for entry in self.name_index[model_file]])
+        if not FrontendConfiguration.is_dry_run() and sink.incremental:
+            BuildCache.load_manifest()
+            # the generated code of unmodified files is retained
+            for model_file in self.valid_neurons.keys():
+                if model_file not in modified:
+                    for neuron in self.valid_neurons[model_file]:
+                        BuildCache.retain_neuron(neuron.get_name())
+        for model_file, neuron in process_neurons(modified):
+            self.valid_neurons[model_file].append(neuron)
+        if not FrontendConfiguration.is_dry_run():
+            generate_outdated_module_code([neuron for model_file in sorted(self.valid_neurons.keys())
+                                           for neuron in self.valid_neurons[model_file]])
+            if sink.incremental:
+                BuildCache.store_manifest()
+        else:
+            code, message = Messages.get_dry_run()
+            Logger.log_message(neuron=None, code=code, message=message, log_level=LoggingLevel.INFO)
+        if FrontendConfiguration.store_log:
+            store_log_to_file()
+        if FrontendConfiguration.is_profile():
+            store_profile_to_file()
+        sink.close()
+        return True
@@ -0,0 +1,180 @@
+#
+# output_sink.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import io
+import os
+import tarfile
+import time
+from abc import ABCMeta, abstractmethod
+
+
+class OutputSink(object):
+    """
+    This class represents the destination of all artifacts created by the toolchain, i.e., the generated code as
+    well as the reports. Artifacts are identified by their path relative to the target directory, e.g.,
+    sli/module-init.sli, respectively relative to the report directory.
+    This class is abstract, thus no instances can be created.
+    Attributes:
+        incremental (bool): Indicates whether artifacts of previous runs are retained, such that the generated code
+                            of unchanged neurons can be reused.
+    """
+    __metaclass__ = ABCMeta
+    incremental = False
+
+    def open(self):
+        """
+        Prepares the sink before any artifacts are written.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, file_name, content):
+        """
+        Writes a single generated artifact.
+        :param file_name: the path relative to the target directory.
+        :type file_name: str
+        :param content: the content
+        :type content: str or bytes
+        """
+        pass
+
+    @abstractmethod
+    def write_report(self, file_name, content):
+        """
+        Writes a single report, e.g., the log.
+        :param file_name: the path relative to the report directory.
+        :type file_name: str
+        :param content: the content
+        :type content: str or bytes
+        """
+        pass
+
+    def close(self):
+        """
+        Finishes the sink after all artifacts have been written.
+        """
+        pass
+
+
+class FileSystemSink(OutputSink):
+    """
+    Writes all artifacts to the target directory and all reports to the report directory. Files whose content has
+    not changed are left untouched.
+    Attributes:
+        written (dict): Map from the path relative to the target directory to the hash of each artifact written
+                        since the sink has been opened.
+    """
+    incremental = True
+
+    def __init__(self, target_path, report_path):
+        self.target_path = target_path
+        self.report_path = report_path
+        self.written = dict()
+
+    def open(self):
+        self.written = dict()
+        for path in (self.target_path, self.report_path):
+            if not os.path.isdir(path):
+                os.makedirs(path)
+
+    def write(self, file_name, content):
+        self.__write(os.path.join(self.target_path, file_name), content)
+        self.written[file_name] = hashlib.sha1(content if isinstance(content, bytes)
+                                               else content.encode('utf-8')).hexdigest()
+
+    def write_report(self, file_name, content):
+        self.__write(os.path.join(self.report_path, file_name), content)
+
+    def get_written_hashes(self, file_names):
+        """
+        Returns the hashes of those of the handed over artifacts which have been written since the sink has been
+        opened.
+        :param file_names: a list of paths relative to the target directory.
+        :type file_names: list(str)
+        :return: a map from the path to the hash of each written artifact.
+        :rtype: dict(str->str)
+        """
+        return dict((file_name, self.written[file_name]) for file_name in file_names if file_name in self.written)
+
+    @classmethod
+    def __write(cls, path, content):
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        # unchanged files are not rewritten, such that their timestamps do not trigger a rebuild of the module
+        if os.path.isfile(path):
+            with open(path, 'rb' if isinstance(content, bytes) else 'r') as f:
+                if f.read() == content:
+                    return
+        with open(path, 'wb' if isinstance(content, bytes) else 'w+') as f:
+            f.write(content)
+
+
+class MemorySink(OutputSink):
+    """
+    Stores all artifacts in memory.
+    Attributes:
+        files (dict): Map from the path relative to the target directory to the content of each artifact.
+        reports (dict): Map from the path relative to the report directory to the content of each report.
+    """
+
+    def __init__(self):
+        self.files = dict()
+        self.reports = dict()
+
+    def write(self, file_name, content):
+        self.files[file_name] = content
+
+    def write_report(self, file_name, content):
+        self.reports[file_name] = content
+
+
+class TarSink(OutputSink):
+    """
+    Streams all artifacts into a tar archive, where reports are stored in the directory report of the archive.
+    Attributes:
+        fileobj: A writable file object to which the archive is streamed.
+        mode (str): The mode as handed over to tarfile, e.g., w|gz for a compressed stream.
+    """
+
+    def __init__(self, fileobj, mode = 'w|'):
+        self.fileobj = fileobj
+        self.mode = mode
+        self.archive = None
+
+    def open(self):
+        if self.archive is None:
+            self.archive = tarfile.open(fileobj=self.fileobj, mode=self.mode)
+
+    def write(self, file_name, content):
+        self.open()
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        info = tarfile.TarInfo(name=file_name)
+        info.size = len(content)
+        info.mtime = time.time()
+        self.archive.addfile(info, io.BytesIO(content))
+
+    def write_report(self, file_name, content):
+        self.write('report/' + file_name, content)
+
+    def close(self):
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
@@ -18,29 +18,61 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+import multiprocessing
 import os
 import sys
 
 from pynestml.cocos.co_cos_manager import CoCosManager
 from pynestml.codegeneration.nest_codegeneration import analyse_and_generate_neurons, generate_nest_module_code
+from pynestml.frontend.build_cache import BuildCache
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, qualifier_dry_arg, \
-    qualifier_target_arg, qualifier_path_arg, qualifier_dev_arg
+    qualifier_target_arg, qualifier_path_arg, qualifier_dev_arg, qualifier_jobs_arg, qualifier_analysis_timeout_arg, \
+    qualifier_neuron_timeout_arg, qualifier_ast_cache_arg
+from pynestml.frontend.output_sink import MemorySink
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.compilation_session import CompilationSession
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.model_installer import install_nest as nest_installer
+from pynestml.utils.profiler import Profiler
 
 
 def to_nest(path, target = None, dry = False, logging_level = 'ERROR', module_name = None, store_log = False,
-            dev = False):
+            dev = False, jobs = 1, session = None, output_sink = None, analysis_timeout = None, neuron_timeout = None,
+            ast_cache = None):
     # if target is not None and not os.path.isabs(target):
     #    print('PyNestML: Please provide absolute target path!')
     #    return
+    # the compilation is processed in the handed over session, otherwise in the active one, such that its
+    # configuration, log and neurons remain accessible after the call as before
+    if session is None:
+        session = CompilationSession.get_current()
+    with session:
+        args = create_arguments(path, target, dry, logging_level, module_name, store_log, dev, jobs,
+                                analysis_timeout, neuron_timeout, ast_cache)
+        FrontendConfiguration.parse_config(args)
+        # the generated code is written to the handed over sink, otherwise to the target directory
+        if output_sink is not None:
+            FrontendConfiguration.set_output_sink(output_sink)
+        process()
+    return session
+
+
+def create_arguments(path, target = None, dry = False, logging_level = 'ERROR', module_name = None,
+                     store_log = False, dev = False, jobs = 1, analysis_timeout = None, neuron_timeout = None,
+                     ast_cache = None):
+    """
+    Creates the list of arguments which corresponds to the handed over settings, cf. to_nest.
+    :return: a list of arguments as handed over to the frontend.
+    :rtype: list(str)
+    """
     args = list()
     args.append(qualifier_path_arg)
     args.append(str(path))
@@ -58,8 +90,19 @@ def to_nest(path, target = None, dry = False, logging_level = 'ERROR', module_na
         args.append(qualifier_store_log_arg)
     if dev:
         args.append(qualifier_dev_arg)
-    FrontendConfiguration.parse_config(args)
-    process()
+    if jobs != 1:
+        args.append(qualifier_jobs_arg)
+        args.append(str(jobs))
+    if analysis_timeout is not None:
+        args.append(qualifier_analysis_timeout_arg)
+        args.append(str(analysis_timeout))
+    if neuron_timeout is not None:
+        args.append(qualifier_neuron_timeout_arg)
+        args.append(str(neuron_timeout))
+    if ast_cache is not None:
+        args.append(qualifier_ast_cache_arg)
+        args.append(str(ast_cache))
+    return args
 
 
 def install_nest(models_path, nest_path):
@@ -80,47 +123,294 @@ def main(args):
     except InvalidPathException:
         print('Not a valid path to model or directory: "%s"!' % FrontendConfiguration.get_path())
         return
+    if FrontendConfiguration.get_server_socket_path() is not None:
+        from pynestml.frontend.compile_server import CompileServer
+        CompileServer.serve(FrontendConfiguration.get_server_socket_path())
+        return
+    if FrontendConfiguration.get_watch_interval() is not None:
+        from pynestml.frontend.model_watcher import ModelWatcher
+        ModelWatcher(FrontendConfiguration.get_watch_interval()).watch()
+        return
     # after all argument have been collected, start the actual processing
     process()
 
 
-def process():
-    # init log dir
-    create_report_dir()
+def process(reuse_predefined = False):
+    """
+    Processes all models as selected in the frontend configuration.
+    :param reuse_predefined: indicates whether the already initialized predefined elements shall be reused.
+    :type reuse_predefined: bool
+    """
+    # init the target and log dir
+    sink = FrontendConfiguration.get_output_sink()
+    sink.open()
+    # if several files and processes are available, distribute the files among worker processes
+    if FrontendConfiguration.get_number_of_jobs() > 1 and len(FrontendConfiguration.get_files()) > 1:
+        process_in_parallel()
+        sink.close()
+        return
     # The handed over parameters seem to be correct, proceed with the main routine
-    init_predefined()
-    # now proceed to parse all models
-    compilation_units = list()
-    for m_file in FrontendConfiguration.get_files():
-        parsed_unit = ModelParser.parse_model(m_file)
-        if parsed_unit is not None:
-            compilation_units.append(parsed_unit)
-    # generate a list of all neurons
-    neurons = list()
-    for compilationUnit in compilation_units:
-        neurons.extend(compilationUnit.get_neuron_list())
+    if not reuse_predefined:
+        init_predefined()
+    # check if across two files two neurons with same name have been defined, only the names are required for this
+    CoCosManager.check_not_two_neurons_in_name_index(create_name_index(FrontendConfiguration.get_files()))
+    # previously generated code can only be reused if the sink retains it
+    if not FrontendConfiguration.is_dry_run() and sink.incremental:
+        BuildCache.load_manifest()
+    # now proceed to process all models neuron by neuron
+    neurons = [neuron for (model_file, neuron) in process_neurons(FrontendConfiguration.get_files())]
+    if not FrontendConfiguration.is_dry_run():
+        generate_outdated_module_code(neurons)
+        if sink.incremental:
+            BuildCache.store_manifest()
+    else:
+        code, message = Messages.get_dry_run()
+        Logger.log_message(neuron=None, code=code, message=message, log_level=LoggingLevel.INFO)
+    if FrontendConfiguration.store_log:
+        store_log_to_file()
+    if FrontendConfiguration.is_profile():
+        store_profile_to_file()
+    sink.close()
+    return
+
+
+def process_in_parallel():
+    """
+    Processes all handed over files in a pool of worker processes. Each worker parses, checks, analyses and generates
+    the neurons of a single file, while the logs and the module-level code are merged in the order of the files.
+    """
+    sink = FrontendConfiguration.get_output_sink()
+    # workers can only write to the target directory directly, all other sinks are fed by the main process
+    pool = multiprocessing.Pool(processes=FrontendConfiguration.get_number_of_jobs(), initializer=init_worker,
+                                initargs=(FrontendConfiguration.get_arguments(), not sink.incremental))
+    try:
+        results = pool.map(process_file_in_worker, FrontendConfiguration.get_files(), chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    name_index = list()
+    generated_neurons = list()
+    if not FrontendConfiguration.is_dry_run() and sink.incremental:
+        BuildCache.load_manifest()
+    for (artifact_name, neuron_names, processed_names, log_records, manifest_entries, profile_records,
+         files, reports) in results:
+        # only the names of the neurons are required for the module-level code, thus a body-less copy is sufficient
+        neurons = dict()
+        for neuron_name in neuron_names:
+            neurons[neuron_name] = create_neuron_stub(neuron_name, artifact_name)
+            name_index.append((neuron_name, artifact_name))
+        for (artifact, neuron_name, log_level, code, error_position, message) in log_records:
+            Logger.log_message(neuron=neurons[neuron_name] if neuron_name in neurons.keys() else None,
+                               code=code, message=message, error_position=error_position, log_level=log_level)
+        generated_neurons.extend(neurons[name] for name in processed_names)
+        for neuron_name, entry in manifest_entries.items():
+            BuildCache.set_neuron_entry(neuron_name, entry)
+        for (unit, phase, wall, cpu, count) in profile_records:
+            Profiler.add_record(unit, phase, wall, cpu, count)
+        for file_name in sorted(files.keys()):
+            sink.write(file_name, files[file_name])
+        for file_name in sorted(reports.keys()):
+            sink.write_report(file_name, reports[file_name])
     # check if across two files two neurons with same name have been defined
-    CoCosManager.check_not_two_neurons_across_units(compilation_units)
-    # now exclude those which are broken, i.e. have errors.
-    if not FrontendConfiguration.is_dev():
-        for neuron in neurons:
-            if Logger.has_errors(neuron):
-                code, message = Messages.get_neuron_contains_errors(neuron.get_name())
-                Logger.log_message(neuron=neuron, code=code, message=message,
-                                   error_position=neuron.get_source_position(),
-                                   log_level=LoggingLevel.INFO)
-                neurons.remove(neuron)
+    CoCosManager.check_not_two_neurons_in_name_index(name_index)
     if not FrontendConfiguration.is_dry_run():
-        analyse_and_generate_neurons(neurons)
-        generate_nest_module_code(neurons)
+        generate_outdated_module_code(generated_neurons)
+        if sink.incremental:
+            BuildCache.store_manifest()
     else:
         code, message = Messages.get_dry_run()
         Logger.log_message(neuron=None, code=code, message=message, log_level=LoggingLevel.INFO)
     if FrontendConfiguration.store_log:
         store_log_to_file()
+    if FrontendConfiguration.is_profile():
+        store_profile_to_file()
     return
 
 
+def init_worker(args, collect_artifacts = False):
+    """
+    Initializes a single worker process by restoring the configuration and the predefined elements.
+    :param args: the arguments as handed over to the frontend.
+    :type args: list(str)
+    :param collect_artifacts: indicates whether generated artifacts shall be handed back to the main process
+            instead of being written to the target directory.
+    :type collect_artifacts: bool
+    """
+    FrontendConfiguration.parse_config(args)
+    if collect_artifacts:
+        FrontendConfiguration.set_output_sink(MemorySink())
+    init_predefined()
+    if not FrontendConfiguration.is_dry_run() and FrontendConfiguration.get_output_sink().incremental:
+        BuildCache.load_manifest()
+
+
+def process_file_in_worker(model_file):
+    """
+    Parses, checks, analyses and generates all neurons of a single file. Used by the worker processes.
+    :param model_file: the path to a single file.
+    :type model_file: str
+    :return: the artifact name, the names of all neurons, the names of all processed neurons, the log records,
+            the manifest entries of all processed neurons, the profile records as well as the collected artifacts
+            and reports.
+    :rtype: (str,list(str),list(str),list(tuple),dict,list(tuple),dict,dict)
+    """
+    # messages are not printed by the workers but collected and printed in order by the main process
+    Logger.init_logger(Logger.logging_level)
+    Logger.no_print = True
+    Profiler.init_profiler(Profiler.enabled, Profiler.profile_neurons)
+    sink = FrontendConfiguration.get_output_sink()
+    if not sink.incremental:
+        sink = MemorySink()
+        FrontendConfiguration.set_output_sink(sink)
+    parsed_unit = ModelParser.parse_model(model_file, collect_comments=not FrontendConfiguration.is_dry_run())
+    if parsed_unit is None:
+        return None, list(), list(), Logger.get_log_records(), dict(), Profiler.get_records(), dict(), dict()
+    # now exclude those which are broken, i.e. have errors.
+    neurons = [neuron for neuron in parsed_unit.get_neuron_list() if not is_excluded(neuron)]
+    manifest_entries = dict()
+    if not FrontendConfiguration.is_dry_run():
+        fingerprint = BuildCache.compute_fingerprint(model_file)
+        neurons = generate_outdated_neurons(neurons, dict((neuron.get_name(), fingerprint) for neuron in neurons))
+        if sink.incremental:
+            for neuron in neurons:
+                manifest_entries[neuron.get_name()] = BuildCache.get_neuron_entry(neuron.get_name())
+    return (parsed_unit.artifact_name, [neuron.get_name() for neuron in parsed_unit.get_neuron_list()],
+            [neuron.get_name() for neuron in neurons], Logger.get_log_records(), manifest_entries,
+            Profiler.get_records(), sink.files if not sink.incremental else dict(),
+            sink.reports if not sink.incremental else dict())
+
+
+def is_excluded(neuron):
+    """
+    Indicates whether the handed over neuron is excluded from the generation since it has errors. Exclusions are
+    reported, while in the dev mode no neuron is excluded.
+    :param neuron: a single neuron instance.
+    :type neuron: ASTNeuron
+    :return: True if excluded, otherwise False
+    :rtype: bool
+    """
+    if FrontendConfiguration.is_dev() or not Logger.has_errors(neuron):
+        return False
+    code, message = Messages.get_neuron_contains_errors(neuron.get_name())
+    Logger.log_message(neuron=neuron, code=code, message=message, error_position=neuron.get_source_position(),
+                       log_level=LoggingLevel.INFO)
+    return True
+
+
+def create_name_index(model_files):
+    """
+    Collects the names of all neurons declared in the handed over files without keeping the models in memory.
+    :param model_files: a list of paths to files.
+    :type model_files: list(str)
+    :return: a list of tuples of neuron name and the name of the artifact it is declared in.
+    :rtype: list((str,str))
+    """
+    name_index = list()
+    for model_file in model_files:
+        for neuron_name in ModelParser.parse_neuron_names(model_file):
+            name_index.append((neuron_name, os.path.basename(model_file)))
+    return name_index
+
+
+def process_neurons(model_files):
+    """
+    Parses, checks, analyses and generates the neurons of the handed over files one after another, such that the
+    generated code of each neuron is written as soon as the neuron has been processed. Neurons with errors or
+    whose code could not be generated are excluded. After a neuron has been processed, only a body-less copy of it
+    is retained.
+    :param model_files: a list of paths to files.
+    :type model_files: list(str)
+    :return: a generator of tuples of file and a body-less copy of each processed neuron.
+    :rtype: generator((str,ASTNeuron))
+    """
+    for model_file in model_files:
+        # comments are only required for the generated code
+        parsed_unit = ModelParser.parse_model(model_file, collect_comments=not FrontendConfiguration.is_dry_run())
+        if parsed_unit is None:
+            continue
+        fingerprint = BuildCache.compute_fingerprint(model_file)
+        for neuron in parsed_unit.get_neuron_list():
+            # now exclude those which are broken, i.e. have errors.
+            excluded = is_excluded(neuron)
+            available = not excluded and (FrontendConfiguration.is_dry_run() or
+                                          len(generate_outdated_neurons([neuron],
+                                                                        {neuron.get_name(): fingerprint})) > 0)
+            # the log must not keep the processed neuron alive
+            neuron_stub = create_neuron_stub(neuron.get_name(), neuron.get_artifact_name())
+            Logger.replace_neuron(neuron, neuron_stub)
+            if available:
+                yield model_file, neuron_stub
+
+
+def create_neuron_stub(neuron_name, artifact_name):
+    """
+    Creates a body-less neuron which only carries the name, e.g., as required for the module-level code.
+    :param neuron_name: the name of the neuron.
+    :type neuron_name: str
+    :param artifact_name: the name of the artifact the neuron is declared in.
+    :type artifact_name: str
+    :return: a new neuron
+    :rtype: ASTNeuron
+    """
+    return ASTNodeFactory.create_ast_neuron(name=neuron_name, body=ASTNodeFactory.create_ast_body(list(), None),
+                                            source_position=ASTSourceLocation.get_added_source_position(),
+                                            artifact_name=artifact_name)
+
+
+def generate_outdated_neurons(neurons, fingerprints):
+    """
+    Analyses and generates all neurons whose generated code is not up to date and registers them in the
+    manifest of the build cache. If the output sink does not retain previously generated code, all neurons are
+    generated.
+    :param neurons: a list of neurons.
+    :type neurons: list(ASTNeuron)
+    :param fingerprints: a map from the name of each neuron to the fingerprint of its model.
+    :type fingerprints: dict(str->str)
+    :return: the list of neurons whose generated code is available.
+    :rtype: list(ASTNeuron)
+    """
+    if not FrontendConfiguration.get_output_sink().incremental:
+        return analyse_and_generate_neurons(neurons)
+    up_to_date = list()
+    outdated = list()
+    for neuron in neurons:
+        if BuildCache.is_neuron_up_to_date(neuron.get_name(), fingerprints[neuron.get_name()]):
+            code, message = Messages.get_neuron_up_to_date(neuron.get_name())
+            Logger.log_message(neuron=neuron, code=code, message=message,
+                               error_position=neuron.get_source_position(), log_level=LoggingLevel.INFO)
+            up_to_date.append(neuron)
+        else:
+            outdated.append(neuron)
+    generated = analyse_and_generate_neurons(outdated)
+    # only neurons whose code has actually been written in this run are registered with the hashes of those files
+    sink = FrontendConfiguration.get_output_sink()
+    for neuron in generated:
+        BuildCache.register_neuron(neuron.get_name(), fingerprints[neuron.get_name()],
+                                   sink.get_written_hashes(BuildCache.get_neuron_file_names(neuron.get_name())))
+    for neuron in up_to_date:
+        BuildCache.retain_neuron(neuron.get_name())
+    return [neuron for neuron in neurons if neuron in up_to_date or neuron in generated]
+
+
+def generate_outdated_module_code(neurons):
+    """
+    Generates the module code for the handed over neurons if it is not up to date and registers it in the manifest
+    of the build cache.
+    :param neurons: a list of neurons.
+    :type neurons: list(ASTNeuron)
+    """
+    if not FrontendConfiguration.get_output_sink().incremental:
+        generate_nest_module_code(neurons)
+        return
+    neuron_names = [neuron.get_name() for neuron in neurons]
+    if BuildCache.is_module_up_to_date(neuron_names):
+        code, message = Messages.get_module_up_to_date(FrontendConfiguration.get_target_path())
+        Logger.log_message(neuron=None, code=code, message=message, log_level=LoggingLevel.INFO)
+    else:
+        generate_nest_module_code(neurons)
+    BuildCache.register_module(neuron_names)
+
+
 def init_predefined():
     # initialize the predefined elements
     PredefinedUnits.register_units()
@@ -129,15 +419,12 @@ def init_predefined():
     PredefinedVariables.register_variables()
 
 
-def create_report_dir():
-    if not os.path.isdir(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report')):
-        os.makedirs(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report'))
+def store_log_to_file():
+    FrontendConfiguration.get_output_sink().write_report('log.txt', str(Logger.get_json_format()))
 
 
-def store_log_to_file():
-    with open(str(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report',
-                               'log')) + '.txt', 'w+') as f:
-        f.write(str(Logger.get_json_format()))
+def store_profile_to_file():
+    FrontendConfiguration.get_output_sink().write_report('profile.json', str(Profiler.get_json_format()))
 
 
 if __name__ == '__main__':
@@ -36,6 +36,8 @@ class ASTArithmeticOperator(ASTNode):
         is_pow_op = False  # type:bool
     """
 
+    __slots__ = ('is_times_op', 'is_div_op', 'is_modulo_op', 'is_plus_op', 'is_minus_op', 'is_pow_op')
+
     def __init__(self, is_times_op, is_div_op, is_modulo_op, is_plus_op, is_minus_op, is_pow_op, source_position):
         # type:(bool,bool,bool,bool,bool,bool,ASTSourcePosition) -> None
         assert ((is_times_op + is_div_op + is_modulo_op + is_plus_op + is_minus_op + is_pow_op) == 1), \
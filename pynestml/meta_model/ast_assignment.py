@@ -43,6 +43,9 @@ class ASTAssignment(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'is_direct_assignment', 'is_compound_sum', 'is_compound_minus', 'is_compound_product',
+                 'is_compound_quotient', 'rhs')
+
     def __init__(self, lhs = None, is_direct_assignment = False, is_compound_sum = False, is_compound_minus = False,
                  is_compound_product = False, is_compound_quotient = False, rhs = None, source_position = None):
         """
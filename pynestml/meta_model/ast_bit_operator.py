@@ -34,6 +34,8 @@ class ASTBitOperator(ASTNode):
         is_bit_shift_right = False
     """
 
+    __slots__ = ('is_bit_shift_right', 'is_bit_shift_left', 'is_bit_or', 'is_bit_xor', 'is_bit_and')
+
     def __init__(self, is_bit_and=False, is_bit_xor=False, is_bit_or=False, is_bit_shift_left=False,
                  is_bit_shift_right=False, source_position=None):
         """
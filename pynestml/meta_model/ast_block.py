@@ -30,6 +30,8 @@ class ASTBlock(ASTNode):
         stmts = None
     """
 
+    __slots__ = ('stmts',)
+
     def __init__(self, stmts, source_position=None):
         """
         Standard constructor.
@@ -63,6 +65,7 @@ class ASTBlock(ASTNode):
         :type stmt: ASTSmallStmt,ASTCompoundStmt
         """
         self.stmts.append(stmt)
+        stmt.set_parent(self)
 
     def delete_stmt(self, stmt):
         """
@@ -73,6 +76,7 @@ class ASTBlock(ASTNode):
         :rtype: bool
         """
         self.stmts.remove(stmt)
+        self.invalidate_index()
 
     def equals(self, other):
         """
@@ -48,6 +48,8 @@ class ASTBlockWithVariables(ASTNode):
         declarations = None
     """
 
+    __slots__ = ('declarations', 'is_internals', 'is_parameters', 'is_initial_values', 'is_state')
+
     def __init__(self, is_state=False, is_parameters=False, is_internals=False, is_initial_values=False,
                  declarations=list(), source_position=None):
         """
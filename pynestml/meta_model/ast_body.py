@@ -32,6 +32,8 @@ class ASTBody(ASTNode):
         bodyElements = None
     """
 
+    __slots__ = ('body_elements',)
+
     def __init__(self, body_elements, source_position):
         """
         Standard constructor.
@@ -37,6 +37,8 @@ class ASTCompoundStmt(ASTNode):
         for_stmt = None
     """
 
+    __slots__ = ('if_stmt', 'while_stmt', 'for_stmt')
+
     def __init__(self, if_stmt=None, while_stmt=None, for_stmt=None, source_position=None):
         """
         Standard constructor.
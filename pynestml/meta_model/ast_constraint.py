@@ -38,6 +38,8 @@ class ASTConstraint(ASTNode):
         right_bound_type: the comparison operator at the right side, e.g., <=
     """
 
+    __slots__ = ('left_bound', 'left_bound_type', 'variable', 'right_bound_type', 'right_bound')
+
     def __init__(self, left_bound, left_bound_type, variable, right_bound_type, right_bound, source_position):
         super(ASTConstraint, self).__init__(source_position)
         self.left_bound = left_bound
@@ -27,6 +27,8 @@ class ASTConstraintsBlock(ASTNode):
         constraintsBlock: 'constraints' BLOCK_OPEN constraint* BLOCK_CLOSE;
     """
 
+    __slots__ = ('constraints',)
+
     def __init__(self, constraints, source_position):
         super(ASTConstraintsBlock, self).__init__(source_position)
         self.constraints = constraints
@@ -45,6 +45,8 @@ class ASTDataType(ASTNode):
         type_symbol = None  # the corresponding type symbol
     """
 
+    __slots__ = ('unit_type', 'is_void', 'is_boolean', 'is_string', 'is_real', 'is_integer', 'type_symbol')
+
     def __init__(self, is_integer = False, is_real = False, is_string = False, is_boolean = False, is_void = False,
                  unit_type = None, source_position = None):
         """
@@ -52,6 +52,8 @@ class ASTDeclaration(ASTNode):
         invariant = None
     """
 
+    __slots__ = ('is_recordable', 'is_function', 'variables', 'data_type', 'size_parameter', 'expression', 'invariant')
+
     def __init__(self, is_recordable=False, is_function=False, _variables=list(), data_type=None, size_parameter=None,
                  expression=None, invariant=None, source_position=None):
         """
@@ -145,6 +147,8 @@ class ASTDeclaration(ASTNode):
     def set_expression(self, expr):
         # type: (ASTExpression) -> None
         self.expression = expr
+        if expr is not None:
+            expr.set_parent(self)
 
     def has_invariant(self):
         """
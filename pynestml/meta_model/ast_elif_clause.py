@@ -30,6 +30,8 @@ class ASTElifClause(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'condition')
+
     def __init__(self, condition, block, source_position):
         """
         Standard constructor.
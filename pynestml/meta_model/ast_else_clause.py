@@ -29,6 +29,8 @@ class ASTElseClause(ASTNode):
         block = None
     """
 
+    __slots__ = ('block',)
+
     def __init__(self, block, source_position):
         """
         Standard constructor.
@@ -42,6 +42,8 @@ class ASTEquationsBlock(ASTNode):
         declarations = None
     """
 
+    __slots__ = ('declarations',)
+
     def __init__(self, declarations, source_position):
         """
         Standard constructor.
@@ -59,6 +59,9 @@ class ASTExpression(ASTExpressionNode):
         simple_expression = None
     """
 
+    __slots__ = ('is_encapsulated', 'is_logical_not', 'unary_operator', 'expression', 'lhs', 'binary_operator', 'rhs',
+                 'condition', 'if_true', 'if_not')
+
     def __init__(self, is_encapsulated = False, unary_operator = None, is_logical_not = False,
                  expression = None, lhs = None, binary_operator = None, rhs = None, condition = None, if_true = None,
                  if_not = None, source_position = None):
@@ -29,12 +29,13 @@ class ASTExpressionNode(ASTNode):
     the source position. This class is abstract, thus no instances can be created.
     """
     # TODO: change the signature, this seems rather bad
-    __type = None
-    __typeEither = None
     __metaclass__ = ABCMeta
 
+    __slots__ = ('__type',)
+
     def __init__(self, source_position, scope=None):
         super(ASTExpressionNode, self).__init__(source_position, scope)
+        self.__type = None
 
     @property
     def type(self):
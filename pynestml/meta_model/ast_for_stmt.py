@@ -35,6 +35,8 @@ class ASTForStmt(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'step', 'end_at', 'start_from', 'variable')
+
     def __init__(self, variable, start_from, end_at, step, block, source_position):
         """
         Standard constructor.
@@ -47,6 +47,8 @@ class ASTFunction(ASTNode, ITypeable):
         type_symbol = None
     """
 
+    __slots__ = ('block', 'return_type', 'parameters', 'name', 'type_symbol')
+
     def __init__(self, name, parameters, return_type, block, source_position):
         """
         Standard constructor.
@@ -33,6 +33,8 @@ class ASTFunctionCall(ASTNode):
         args = None
     """
 
+    __slots__ = ('callee_name', 'args')
+
     def __init__(self, callee_name, args, source_position):
         """
         Standard constructor.
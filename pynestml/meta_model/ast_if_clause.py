@@ -31,6 +31,8 @@ class ASTIfClause(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'condition')
+
     def __init__(self, condition, block, source_position):
         """
         Standard constructor.
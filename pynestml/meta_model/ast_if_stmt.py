@@ -35,6 +35,8 @@ class ASTIfStmt(ASTNode):
         else_clause = None
     """
 
+    __slots__ = ('else_clause', 'if_clause', 'elif_clauses')
+
     def __init__(self, if_clause, elif_clauses=list(), else_clause=None, source_position=None):
         """
         Standard construcotr.
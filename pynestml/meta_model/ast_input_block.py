@@ -41,6 +41,8 @@ class ASTInputBlock(ASTNode):
         input_definitions = None
     """
 
+    __slots__ = ('input_definitions',)
+
     def __init__(self, input_definitions=list(), source_position=None):
         """
         Standard constructor.
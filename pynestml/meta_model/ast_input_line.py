@@ -48,6 +48,8 @@ class ASTInputLine(ASTNode):
         signal_type = None
     """
 
+    __slots__ = ('signal_type', 'input_types', 'size_parameter', 'name', 'data_type')
+
     def __init__(self, name=None, size_parameter=None, data_type=None, input_types=list(), signal_type=None,
                  source_position=None):
         """
@@ -35,6 +35,8 @@ class ASTInputType(ASTNode):
         is_excitatory = False
     """
 
+    __slots__ = ('is_excitatory', 'is_inhibitory')
+
     def __init__(self, is_inhibitory = False, is_excitatory = False, source_position = None):
         """
         Standard constructor.
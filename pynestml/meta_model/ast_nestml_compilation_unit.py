@@ -33,6 +33,8 @@ class ASTNestMLCompilationUnit(ASTNode):
         artifact_name = None
     """
 
+    __slots__ = ('neuron_list', 'artifact_name')
+
     def __init__(self, source_position=None, artifact_name=None):
         """
         Standard constructor of ASTNestMLCompilationUnit.
@@ -60,6 +62,7 @@ class ASTNestMLCompilationUnit(ASTNode):
         assert (neuron is not None and isinstance(neuron, ASTNeuron)), \
             '(PyNestML.AST.CompilationUnit) No or wrong type of neuron provided (%s)!' % type(neuron)
         self.neuron_list.append(neuron)
+        neuron.set_parent(self)
         return
 
     def remove_neuron(self, neuron):
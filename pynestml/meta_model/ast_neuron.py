@@ -18,8 +18,29 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
 from pynestml.meta_model.ast_body import ASTBody
+from pynestml.meta_model.ast_constraints_block import ASTConstraintsBlock
+from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
+from pynestml.meta_model.ast_function import ASTFunction
+from pynestml.meta_model.ast_input_block import ASTInputBlock
 from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_output_block import ASTOutputBlock
+from pynestml.meta_model.ast_update_block import ASTUpdateBlock
+
+# the kinds of body elements as stored in the index, each one is identified by a predicate on the element
+_block_kinds = {
+    'function': lambda elem: isinstance(elem, ASTFunction),
+    'update': lambda elem: isinstance(elem, ASTUpdateBlock),
+    'state': lambda elem: isinstance(elem, ASTBlockWithVariables) and elem.is_state,
+    'parameters': lambda elem: isinstance(elem, ASTBlockWithVariables) and elem.is_parameters,
+    'internals': lambda elem: isinstance(elem, ASTBlockWithVariables) and elem.is_internals,
+    'initial_values': lambda elem: isinstance(elem, ASTBlockWithVariables) and elem.is_initial_values,
+    'equations': lambda elem: isinstance(elem, ASTEquationsBlock),
+    'input': lambda elem: isinstance(elem, ASTInputBlock),
+    'output': lambda elem: isinstance(elem, ASTOutputBlock),
+    'constraints': lambda elem: isinstance(elem, ASTConstraintsBlock),
+}
 
 
 class ASTNeuron(ASTNode):
@@ -34,8 +55,12 @@ class ASTNeuron(ASTNode):
         name = None
         body = None
         artifact_name = None
+    The neuron keeps an index of its nodes by type and of its body elements by kind. It is built lazily on the first
+    request and discarded whenever a node of the neuron is modified, cf. ASTNode.invalidate_index.
     """
 
+    __slots__ = ('name', 'body', 'artifact_name', '_nodes', '_index')
+
     def __init__(self, name, body, source_position = None, artifact_name = None):
         """
         Standard constructor.
@@ -58,6 +83,8 @@ class ASTNeuron(ASTNode):
         self.name = name
         self.body = body
         self.artifact_name = artifact_name
+        self._nodes = None
+        self._index = dict()
 
     def get_name(self):
         """
@@ -83,6 +110,61 @@ class ASTNeuron(ASTNode):
         """
         return self.artifact_name
 
+    def get_nodes_of_type(self, node_type):
+        """
+        Returns all nodes of the handed over type contained in this neuron, including the neuron itself, in the
+        order of a traversal. The returned list is shared with the index and must not be modified.
+        :param node_type: a class of the meta_model
+        :type node_type: type
+        :return: a list of nodes
+        :rtype: list(ASTNode)
+        """
+        if node_type not in self._index:
+            if self._nodes is None:
+                from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+                nodes = list()
+                self.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+                self._nodes = nodes
+            self._index[node_type] = [node for node in self._nodes if isinstance(node, node_type)]
+        return self._index[node_type]
+
+    def get_blocks_of_kind(self, kind):
+        """
+        Returns all body elements of the handed over kind, e.g., 'state' or 'equations', in the order of definition.
+        The returned list is shared with the index and must not be modified.
+        :param kind: the kind of the body element
+        :type kind: str
+        :return: a list of body elements
+        :rtype: list(ASTNode)
+        """
+        if kind not in self._index:
+            predicate = _block_kinds[kind]
+            self._index[kind] = [elem for elem in self.get_body().get_body_elements() if predicate(elem)]
+        return self._index[kind]
+
+    def get_declarations_of_equations_block(self, declaration_type):
+        """
+        Returns all declarations of the handed over type, e.g., ASTOdeShape, in the equations block of this neuron.
+        The returned list is shared with the index and must not be modified.
+        :param declaration_type: the type of the declarations
+        :type declaration_type: type
+        :return: a list of declarations
+        :rtype: list(ASTNode)
+        """
+        key = ('equations', declaration_type)
+        if key not in self._index:
+            blocks = self.get_blocks_of_kind('equations')
+            self._index[key] = [decl for decl in blocks[0].get_declarations()
+                                if isinstance(decl, declaration_type)] if len(blocks) > 0 else []
+        return self._index[key]
+
+    def invalidate_index(self):
+        """
+        Discards the index of nodes and body elements, it is rebuilt on the next request.
+        """
+        self._nodes = None
+        self._index = dict()
+
     def equals(self, other):
         """
         The equals method.
@@ -36,9 +36,16 @@ class ASTNode(object):
         post_comments = list()
         #
         implicit_conversion_factor = None
+        #
+        parent = None
+    Nodes are by far the most numerous objects, thus all classes of the meta_model declare their attributes as slots
+    and the lists of pre and post comments are only allocated for nodes which actually have comments.
     """
     __metaclass__ = ABCMeta
 
+    __slots__ = ('sourcePosition', 'scope', 'comment', '_pre_comments', 'in_comment', '_post_comments',
+                 'implicit_conversion_factor', 'parent')
+
     def __init__(self, source_position, scope=None):
         """
         The standard constructor.
@@ -50,10 +57,41 @@ class ASTNode(object):
         self.sourcePosition = source_position
         self.scope = scope
         self.comment = None
-        self.pre_comments = list()
+        self._pre_comments = None
         self.in_comment = None
-        self.post_comments = list()
+        self._post_comments = None
         self.implicit_conversion_factor = None
+        self.parent = None
+
+    @property
+    def pre_comments(self):
+        """
+        Returns the comments stated before this element, the list is allocated on first access.
+        :return: a list of comments
+        :rtype: list(str)
+        """
+        if self._pre_comments is None:
+            self._pre_comments = list()
+        return self._pre_comments
+
+    @pre_comments.setter
+    def pre_comments(self, comments):
+        self._pre_comments = comments
+
+    @property
+    def post_comments(self):
+        """
+        Returns the comments stated after this element, the list is allocated on first access.
+        :return: a list of comments
+        :rtype: list(str)
+        """
+        if self._post_comments is None:
+            self._post_comments = list()
+        return self._post_comments
+
+    @post_comments.setter
+    def post_comments(self, comments):
+        self._post_comments = comments
 
     def set_implicit_conversion_factor(self, implicit_factor):
         """
@@ -83,6 +121,61 @@ class ASTNode(object):
         assert isinstance(self, ASTExpression) or isinstance(self, ASTSimpleExpression)
         return self.implicit_conversion_factor
 
+    def get_parent(self):
+        """
+        Returns the node which contains this node as a child. The reference is set by the ASTNodeFactory and the
+        helpers which modify the tree, but nodes which are modified directly can hold an outdated one, thus
+        ASTUtils.get_parent should be used to retrieve a verified parent.
+        :return: the parent node or None
+        :rtype: ASTNode
+        """
+        return self.parent
+
+    def set_parent(self, parent):
+        """
+        Updates the node which contains this node as a child.
+        :param parent: the parent node
+        :type parent: ASTNode
+        """
+        self.parent = parent
+        if parent is not None:
+            parent.invalidate_index()
+
+    def invalidate_index(self):
+        """
+        Discards the index of the neuron which contains this node, cf. ASTNeuron.get_nodes_of_type. Has to be called
+        whenever nodes are added to or removed from the tree below this node.
+        """
+        from pynestml.meta_model.ast_neuron import ASTNeuron
+        node = self
+        while node is not None:
+            if isinstance(node, ASTNeuron):
+                node.invalidate_index()
+                return
+            node = node.parent
+
+    def get_children(self):
+        """
+        Returns all nodes which are directly contained in this node, e.g., the operands of an expression.
+        :return: a list of nodes
+        :rtype: list(ASTNode)
+        """
+        ret = list()
+        for name in get_child_slots(type(self)):
+            value = getattr(self, name, None)
+            if isinstance(value, ASTNode):
+                ret.append(value)
+            elif isinstance(value, list):
+                ret.extend(element for element in value if isinstance(element, ASTNode))
+        return ret
+
+    def adopt_children(self):
+        """
+        Sets this node as the parent of all nodes directly contained in it.
+        """
+        for child in self.get_children():
+            child.parent = self
+
     def get_source_position(self):
         """
         Returns the source position of the element.
@@ -185,3 +278,28 @@ class ASTNode(object):
         :rtype: bool
         """
         pass
+
+
+# the slots of each class which can hold child nodes, i.e., all slots except the ones common to all nodes
+_child_slots = {}
+
+
+def get_child_slots(node_type):
+    """
+    Returns the names of all slots of the handed over class of nodes which can hold child nodes.
+    :param node_type: a class of the meta_model
+    :type node_type: type
+    :return: a tuple of attribute names
+    :rtype: tuple(str)
+    """
+    if node_type not in _child_slots:
+        names = list()
+        for cls in node_type.__mro__:
+            if cls is ASTNode or cls is object:
+                continue
+            for name in getattr(cls, '__slots__', ()):
+                # private slots, e.g., the cached type of expressions, are never children
+                if not name.startswith('_') and name != 'type_symbol':
+                    names.append(name)
+        _child_slots[node_type] = tuple(names)
+    return _child_slots[node_type]
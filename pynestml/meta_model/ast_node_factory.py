@@ -66,7 +66,8 @@ from pynestml.meta_model.ast_constraints_block import ASTConstraintsBlock
 
 class ASTNodeFactory(object):
     """
-    An implementation of the factory pattern for an easier initialization of new AST nodes.
+    An implementation of the factory pattern for an easier initialization of new AST nodes. All created nodes are set
+    as the parent of the nodes handed over as their children.
     """
 
     @classmethod
@@ -74,8 +75,8 @@ class ASTNodeFactory(object):
                                        is_plus_op = False,
                                        is_minus_op = False, is_pow_op = False, source_position = None):
         # type:(bool,bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTArithmeticOperator
-        return ASTArithmeticOperator(is_times_op, is_div_op, is_modulo_op, is_plus_op, is_minus_op, is_pow_op,
-                                     source_position)
+        return cls.__adopt(ASTArithmeticOperator(is_times_op, is_div_op, is_modulo_op, is_plus_op, is_minus_op,
+                                                 is_pow_op, source_position))
 
     @classmethod
     def create_ast_assignment(cls, lhs = None,  # type: ASTVariable
@@ -87,49 +88,51 @@ class ASTNodeFactory(object):
                               expression = None,  # type: Union(ASTSimpleExpression,ASTExpression)
                               source_position = None  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTAssignment
-        return ASTAssignment(lhs, is_direct_assignment, is_compound_sum, is_compound_minus, is_compound_product,
-                             is_compound_quotient, expression, source_position)
+        return cls.__adopt(ASTAssignment(lhs, is_direct_assignment, is_compound_sum, is_compound_minus,
+                                         is_compound_product, is_compound_quotient, expression, source_position))
 
     @classmethod
     def create_ast_bit_operator(cls, is_bit_and = False, is_bit_xor = False, is_bit_or = False,
                                 is_bit_shift_left = False,
                                 is_bit_shift_right = False, source_position = None):
         # type: (bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTBitOperator
-        return ASTBitOperator(is_bit_and, is_bit_xor, is_bit_or, is_bit_shift_left, is_bit_shift_right, source_position)
+        return cls.__adopt(ASTBitOperator(is_bit_and, is_bit_xor, is_bit_or, is_bit_shift_left, is_bit_shift_right,
+                                          source_position))
 
     @classmethod
     def create_ast_block(cls, stmts, source_position):
         # type: (list(ASTSmallStmt|ASTCompoundStmt),ASTSourceLocation) -> ASTBlock
-        return ASTBlock(stmts, source_position)
+        return cls.__adopt(ASTBlock(stmts, source_position))
 
     @classmethod
     def create_ast_block_with_variables(cls, is_state = False, is_parameters = False, is_internals = False,
                                         is_initial_values = False, declarations = list(), source_position = None):
         # type: (bool,bool,bool,bool,list(ASTDeclaration),ASTSourceLocation) -> ASTBlockWithVariables
-        return ASTBlockWithVariables(is_state, is_parameters, is_internals, is_initial_values, declarations,
-                                     source_position)
+        return cls.__adopt(ASTBlockWithVariables(is_state, is_parameters, is_internals, is_initial_values, declarations,
+                                                 source_position))
 
     @classmethod
     def create_ast_body(cls, body_elements, source_position):
         # type: (list,ASTSourceLocation) -> ASTBody
-        return ASTBody(body_elements, source_position)
+        return cls.__adopt(ASTBody(body_elements, source_position))
 
     @classmethod
     def create_ast_comparison_operator(cls, is_lt = False, is_le = False, is_eq = False, is_ne = False, is_ne2 = False,
                                        is_ge = False, is_gt = False, source_position = None):
         # type: (bool,bool,bool,bool,bool,bool,bool,ASTSourceLocation) -> ASTComparisonOperator
-        return ASTComparisonOperator(is_lt, is_le, is_eq, is_ne, is_ne2, is_ge, is_gt, source_position)
+        return cls.__adopt(ASTComparisonOperator(is_lt, is_le, is_eq, is_ne, is_ne2, is_ge, is_gt, source_position))
 
     @classmethod
     def create_ast_compound_stmt(cls, if_stmt, while_stmt, for_stmt, source_position):
         # type: (ASTIfStmt,ASTWhileStmt,ASTForStmt,ASTSourceLocation) -> ASTCompoundStmt
-        return ASTCompoundStmt(if_stmt, while_stmt, for_stmt, source_position)
+        return cls.__adopt(ASTCompoundStmt(if_stmt, while_stmt, for_stmt, source_position))
 
     @classmethod
     def create_ast_data_type(cls, is_integer = False, is_real = False, is_string = False, is_boolean = False,
                              is_void = False, is_unit_type = None, source_position = None):
         # type: (bool,bool,bool,bool,bool,ASTUnitType,ASTSourceLocation) -> ASTDataType
-        return ASTDataType(is_integer, is_real, is_string, is_boolean, is_void, is_unit_type, source_position)
+        return cls.__adopt(ASTDataType(is_integer, is_real, is_string, is_boolean, is_void, is_unit_type,
+                                       source_position))
 
     @classmethod
     def create_ast_declaration(cls,
@@ -142,23 +145,23 @@ class ASTNodeFactory(object):
                                invariant = None,  # type: Union(ASTSimpleExpression,ASTExpression)
                                source_position = None  # type: ASTSourceLocation
                                ):  # type: (...) -> ASTDeclaration
-        return ASTDeclaration(is_recordable, is_function, variables, data_type, size_parameter, expression, invariant,
-                              source_position)
+        return cls.__adopt(ASTDeclaration(is_recordable, is_function, variables, data_type, size_parameter, expression,
+                                          invariant, source_position))
 
     @classmethod
     def create_ast_elif_clause(cls, condition, block, source_position = None):
         # type: (ASTExpression|ASTSimpleExpression,ASTBlock,ASTSourceLocation) -> ASTElifClause
-        return ASTElifClause(condition, block, source_position)
+        return cls.__adopt(ASTElifClause(condition, block, source_position))
 
     @classmethod
     def create_ast_else_clause(cls, block, source_position):
         # type: (ASTBlock,ASTSourceLocation) -> ASTElseClause
-        return ASTElseClause(block, source_position)
+        return cls.__adopt(ASTElseClause(block, source_position))
 
     @classmethod
     def create_ast_equations_block(cls, declarations = None, source_position = None):
         # type: (list,ASTSourceLocation) -> ASTEquationsBlock
-        return ASTEquationsBlock(declarations, source_position)
+        return cls.__adopt(ASTEquationsBlock(declarations, source_position))
 
     @classmethod
     def create_ast_expression(cls, is_encapsulated = False, unary_operator = None,
@@ -168,8 +171,9 @@ class ASTNodeFactory(object):
         The factory method used to create rhs which are either encapsulated in parentheses (e.g., (10mV))
         OR have a unary (e.g., ~bitVar), OR are negated (e.g., not logVar), or are simple rhs (e.g., 10mV).
         """
-        return ASTExpression(is_encapsulated=is_encapsulated, unary_operator=unary_operator,
-                             is_logical_not=is_logical_not, expression=expression, source_position=source_position)
+        return cls.__adopt(ASTExpression(is_encapsulated=is_encapsulated, unary_operator=unary_operator,
+                                         is_logical_not=is_logical_not, expression=expression,
+                                         source_position=source_position))
 
     @classmethod
     def create_ast_compound_expression(cls,
@@ -188,7 +192,8 @@ class ASTNodeFactory(object):
                                                  isinstance(binary_operator, ASTLogicalOperator) or
                                                  isinstance(binary_operator, ASTArithmeticOperator))), \
             '(PyNestML.AST.Expression) No or wrong type of binary operator provided (%s)!' % type(binary_operator)
-        return ASTExpression(lhs=lhs, binary_operator=binary_operator, rhs=rhs, source_position=source_position)
+        return cls.__adopt(ASTExpression(lhs=lhs, binary_operator=binary_operator, rhs=rhs,
+                                         source_position=source_position))
 
     @classmethod
     def create_ast_ternary_expression(cls,
@@ -200,7 +205,8 @@ class ASTNodeFactory(object):
         """
         The factory method used to create a ternary operator rhs, e.g., 10mV<V_m?10mV:V_m
         """
-        return ASTExpression(condition=condition, if_true=if_true, if_not=if_not, source_position=source_position)
+        return cls.__adopt(ASTExpression(condition=condition, if_true=if_true, if_not=if_not,
+                                         source_position=source_position))
 
     @classmethod
     def create_ast_for_stmt(cls,
@@ -211,48 +217,49 @@ class ASTNodeFactory(object):
                             block = None,  # type: ASTBlock
                             source_position = None  # type: ASTSourceLocation
                             ):  # type: (...) -> ASTForStmt
-        return ASTForStmt(variable, start_from, end_at, step, block, source_position)
+        return cls.__adopt(ASTForStmt(variable, start_from, end_at, step, block, source_position))
 
     @classmethod
     def create_ast_function(cls, name, parameters, return_type, block, source_position):
         # type: (str,(None|list(ASTParameter)),(ASTDataType|None),ASTBlock,ASTSourceLocation) -> ASTFunction
-        return ASTFunction(name, parameters, return_type, block, source_position)
+        return cls.__adopt(ASTFunction(name, parameters, return_type, block, source_position))
 
     @classmethod
     def create_ast_function_call(cls, callee_name, args, source_position):
         # type: (str,(None|list(ASTExpression|ASTSimpleExpression)),ASTSourceLocation) -> ASTFunctionCall
-        return ASTFunctionCall(callee_name, args, source_position)
+        return cls.__adopt(ASTFunctionCall(callee_name, args, source_position))
 
     @classmethod
     def create_ast_if_clause(cls, condition, block, source_position):
         # type: (ASTSimpleExpression|ASTExpression,ASTBlock,ASTSourceLocation) -> ASTIfClause
-        return ASTIfClause(condition, block, source_position)
+        return cls.__adopt(ASTIfClause(condition, block, source_position))
 
     @classmethod
     def create_ast_if_stmt(cls, if_clause, elif_clauses, else_clause, source_position):
         # type: (ASTIfClause,(None|list(ASTElifClause)),(None|ASTElseClause),ASTSourceLocation) -> ASTIfStmt
-        return ASTIfStmt(if_clause, elif_clauses, else_clause, source_position)
+        return cls.__adopt(ASTIfStmt(if_clause, elif_clauses, else_clause, source_position))
 
     @classmethod
     def create_ast_input_block(cls, input_definitions, source_position):
         # type: (list(ASTInputLine), ASTSourceLocation) -> ASTInputBlock
-        return ASTInputBlock(input_definitions, source_position)
+        return cls.__adopt(ASTInputBlock(input_definitions, source_position))
 
     @classmethod
     def create_ast_input_line(cls, name, size_parameter, data_type, input_types, signal_type, source_position):
         # type:(str,str,(None|ASTDataType),list(ASTInputType),ASTSignalType,ASTSourceLocation) -> ASTInputLine
-        return ASTInputLine(name=name, size_parameter=size_parameter, data_type=data_type, input_types=input_types,
-                            signal_type=signal_type, source_position=source_position)
+        return cls.__adopt(ASTInputLine(name=name, size_parameter=size_parameter, data_type=data_type,
+                                        input_types=input_types, signal_type=signal_type,
+                                        source_position=source_position))
 
     @classmethod
     def create_ast_input_type(cls, is_inhibitory = False, is_excitatory = False, source_position = None):
         # type: (bool,bool,ASTSourceLocation) -> ASTInputType
-        return ASTInputType(is_inhibitory, is_excitatory, source_position)
+        return cls.__adopt(ASTInputType(is_inhibitory, is_excitatory, source_position))
 
     @classmethod
     def create_ast_logical_operator(cls, is_logical_and = False, is_logical_or = False, source_position = None):
         # type: (bool,bool,ASTSourceLocation) -> ASTLogicalOperator
-        return ASTLogicalOperator(is_logical_and, is_logical_or, source_position)
+        return cls.__adopt(ASTLogicalOperator(is_logical_and, is_logical_or, source_position))
 
     @classmethod
     def create_ast_nestml_compilation_unit(cls, list_of_neurons, source_position, artifact_name):
@@ -265,38 +272,38 @@ class ASTNodeFactory(object):
     @classmethod
     def create_ast_neuron(cls, name, body, source_position, artifact_name):
         # type: (str,ASTBody,ASTSourceLocation,str) -> ASTNeuron
-        return ASTNeuron(name, body, source_position, artifact_name)
+        return cls.__adopt(ASTNeuron(name, body, source_position, artifact_name))
 
     @classmethod
     def create_ast_ode_equation(cls, lhs, rhs, source_position):
         # type: (ASTVariable,ASTSimpleExpression|ASTExpression,ASTSourceLocation) -> ASTOdeEquation
-        return ASTOdeEquation(lhs, rhs, source_position)
+        return cls.__adopt(ASTOdeEquation(lhs, rhs, source_position))
 
     @classmethod
     def create_ast_ode_function(cls, variable_name, data_type, expression, source_position, is_recordable = False):
         # type: (str,ASTDataType,ASTExpression|ASTSimpleExpression,ASTSourceLocation,bool) -> ASTOdeFunction
-        return ASTOdeFunction(variable_name=variable_name, data_type=data_type, expression=expression,
-                              source_position=source_position, is_recordable=is_recordable, )
+        return cls.__adopt(ASTOdeFunction(variable_name=variable_name, data_type=data_type, expression=expression,
+                                          source_position=source_position, is_recordable=is_recordable))
 
     @classmethod
     def create_ast_ode_shape(cls, lhs = None, rhs = None, source_position = None):
         # type: (ASTVariable,ASTSimpleExpression|ASTExpression,ASTSourceLocation) -> ASTOdeShape
-        return ASTOdeShape(lhs, rhs, source_position)
+        return cls.__adopt(ASTOdeShape(lhs, rhs, source_position))
 
     @classmethod
     def create_ast_output_block(cls, s_type, source_position):
         # type: (ASTSignalType,ASTSourceLocation) -> ASTOutputBlock
-        return ASTOutputBlock(s_type, source_position)
+        return cls.__adopt(ASTOutputBlock(s_type, source_position))
 
     @classmethod
     def create_ast_parameter(cls, name, data_type, source_position):
         # type: (str,ASTDataType,ASTSourceLocation) -> ASTParameter
-        return ASTParameter(name=name, data_type=data_type, source_position=source_position)
+        return cls.__adopt(ASTParameter(name=name, data_type=data_type, source_position=source_position))
 
     @classmethod
     def create_ast_return_stmt(cls, expression = None, source_position = None):
         # type: (ASTSimpleExpression|ASTExpression,ASTSourceLocation) -> ASTReturnStmt
-        return ASTReturnStmt(expression, source_position)
+        return cls.__adopt(ASTReturnStmt(expression, source_position))
 
     @classmethod
     def create_ast_simple_expression(cls, function_call = None,  # type: Union(ASTFunctionCall,None)
@@ -307,8 +314,8 @@ class ASTNodeFactory(object):
                                      string = None,  # type: Union(str,None)
                                      source_position = None  # type: ASTSourceLocation
                                      ):  # type: (...) -> ASTSimpleExpression
-        return ASTSimpleExpression(function_call, boolean_literal, numeric_literal, is_inf, variable, string,
-                                   source_position)
+        return cls.__adopt(ASTSimpleExpression(function_call, boolean_literal, numeric_literal, is_inf, variable,
+                                               string, source_position))
 
     @classmethod
     def create_ast_small_stmt(cls,
@@ -318,13 +325,13 @@ class ASTNodeFactory(object):
                               return_stmt = None,  # type: ASTReturnStmt
                               source_position = None  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTSmallStmt
-        return ASTSmallStmt(assignment, function_call, declaration, return_stmt, source_position)
+        return cls.__adopt(ASTSmallStmt(assignment, function_call, declaration, return_stmt, source_position))
 
     @classmethod
     def create_ast_unary_operator(cls, is_unary_plus = False, is_unary_minus = False, is_unary_tilde = False,
                                   source_position = None):
         # type: (bool,bool,bool,ASTSourceLocation) -> ASTUnaryOperator
-        return ASTUnaryOperator(is_unary_plus, is_unary_minus, is_unary_tilde, source_position)
+        return cls.__adopt(ASTUnaryOperator(is_unary_plus, is_unary_minus, is_unary_tilde, source_position))
 
     @classmethod
     def create_ast_unit_type(cls,
@@ -340,18 +347,18 @@ class ASTNodeFactory(object):
                              unit = None,  # type: str
                              source_position = None  # type: ASTSourceLocation
                              ):  # type: (...) -> ASTUnitType
-        return ASTUnitType(is_encapsulated, compound_unit, base, is_pow, exponent, lhs, rhs, is_div,
-                           is_times, unit, source_position)
+        return cls.__adopt(ASTUnitType(is_encapsulated, compound_unit, base, is_pow, exponent, lhs, rhs, is_div,
+                                       is_times, unit, source_position))
 
     @classmethod
     def create_ast_update_block(cls, block, source_position):
         # type: (ASTBlock,ASTSourceLocation) -> ASTUpdateBlock
-        return ASTUpdateBlock(block, source_position)
+        return cls.__adopt(ASTUpdateBlock(block, source_position))
 
     @classmethod
     def create_ast_variable(cls, name, differential_order = 0, source_position = None):
         # type: (str,int,ASTSourceLocation) -> ASTVariable
-        return ASTVariable(name, differential_order, source_position)
+        return cls.__adopt(ASTVariable(name, differential_order, source_position))
 
     @classmethod
     def create_ast_while_stmt(cls,
@@ -359,20 +366,26 @@ class ASTNodeFactory(object):
                               block,  # type: ASTBlock
                               source_position  # type: ASTSourceLocation
                               ):  # type: (...) -> ASTWhileStmt
-        return ASTWhileStmt(condition, block, source_position)
+        return cls.__adopt(ASTWhileStmt(condition, block, source_position))
 
     @classmethod
     def create_ast_stmt(cls, small_stmt = None, compound_stmt = None, source_position = None):
         # type: (ASTSmallStmt,ASTCompoundStmt,ASTSourceLocation) -> ASTStmt
-        return ASTStmt(small_stmt, compound_stmt, source_position)
+        return cls.__adopt(ASTStmt(small_stmt, compound_stmt, source_position))
 
     @classmethod
     def create_ast_constraint(cls, left_bound = None, left_bound_type = None,
                               variable = None, right_bound_type = None, right_bound = None, source_position = None):
         # type: (ASTExpression,ASTComparisonOperator, ASTVariable, ASTComparisonOperator,ASTExpression) -> ASTConstraint
-        return ASTConstraint(left_bound, left_bound_type, variable, right_bound_type, right_bound, source_position)
+        return cls.__adopt(ASTConstraint(left_bound, left_bound_type, variable, right_bound_type, right_bound,
+                                         source_position))
 
     @classmethod
     def create_ast_constraint_block(cls, constraints = list(), source_position = None):
         # type: (list(ASTConstraint),ASTSourceLocation) -> ASTConstraintsBlock
-        return ASTConstraintsBlock(constraints, source_position)
+        return cls.__adopt(ASTConstraintsBlock(constraints, source_position))
+
+    @classmethod
+    def __adopt(cls, node):
+        node.adopt_children()
+        return node
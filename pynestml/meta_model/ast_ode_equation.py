@@ -36,6 +36,8 @@ class ASTOdeEquation(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'rhs')
+
     def __init__(self, lhs, rhs, source_position = None):
         """
         Standard constructor.
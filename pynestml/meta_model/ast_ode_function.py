@@ -35,6 +35,8 @@ class ASTOdeFunction(ASTNode):
         expression = None
     """
 
+    __slots__ = ('is_recordable', 'variable_name', 'data_type', 'expression')
+
     def __init__(self, is_recordable=False, variable_name=None, data_type=None, expression=None, source_position=None):
         """
         Standard constructor.
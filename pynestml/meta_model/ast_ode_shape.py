@@ -31,6 +31,8 @@ class ASTOdeShape(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'rhs')
+
     def __init__(self, lhs, rhs, source_position):
         """
         Standard constructor of ASTOdeShape.
@@ -35,6 +35,8 @@ class ASTOutputBlock(ASTNode):
         type = None
     """
 
+    __slots__ = ('type',)
+
     def __init__(self, o_type, source_position):
         # type: (ASTSignalType,ASTSourceLocation) -> None
         """
@@ -36,6 +36,8 @@ class ASTParameter(ASTNode):
         data_type (ASTDataType): The data type of the parameter.
     """
 
+    __slots__ = ('data_type', 'name')
+
     def __init__(self, name=None, data_type=None, source_position=None):
         """
         Standard constructor.
@@ -35,6 +35,8 @@ class ASTReturnStmt(ASTNode):
           expression (ASTSimpleExpression or ASTExpression): An rhs representing the returned value.
     """
 
+    __slots__ = ('expression',)
+
     def __init__(self, expression=None, source_position=None):
         """
         Standard constructor.
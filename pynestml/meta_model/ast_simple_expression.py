@@ -45,6 +45,9 @@ class ASTSimpleExpression(ASTExpressionNode):
 
     """
 
+    __slots__ = ('function_call', 'is_boolean_true', 'is_boolean_false', 'numeric_literal', 'is_inf_literal',
+                 'variable', 'string')
+
     def __init__(self, function_call = None, boolean_literal = None, numeric_literal = None, is_inf = False,
                  variable = None, string = None, source_position = None):
         """
@@ -172,6 +175,8 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (variable is None or isinstance(variable, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of variable provided (%s)!' % type(variable)
         self.variable = variable
+        if variable is not None:
+            variable.set_parent(self)
         return
 
     def set_function_call(self, function_call):
@@ -183,6 +188,8 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (function_call is None or isinstance(function_call, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of function call provided (%s)!' % type(function_call)
         self.function_call = function_call
+        if function_call is not None:
+            function_call.set_parent(self)
         return
 
     def equals(self, other):
@@ -30,6 +30,8 @@ class ASTSourceLocation(object):
         end_column = 0
     """
 
+    __slots__ = ('start_line', 'start_column', 'end_line', 'end_column')
+
     def __init__(self, start_line, start_column, end_line, end_column):
         """
         Standard constructor.
@@ -32,6 +32,8 @@ class ASTStmt(ASTNode):
         compound_stmt = None
     """
 
+    __slots__ = ('small_stmt', 'compound_stmt')
+
     def __init__(self, small_stmt, compound_stmt, source_position):
         # type: (ASTSmallStmt,ASTCompoundStmt) -> None
         super(ASTStmt, self).__init__(source_position)
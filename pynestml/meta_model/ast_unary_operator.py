@@ -32,6 +32,8 @@ class ASTUnaryOperator(ASTNode):
         is_unary_tilde = False
     """
 
+    __slots__ = ('is_unary_plus', 'is_unary_minus', 'is_unary_tilde')
+
     def __init__(self, is_unary_plus = False, is_unary_minus = False, is_unary_tilde = False, source_position = None):
         """
         Standard constructor.
@@ -53,6 +53,9 @@ class ASTUnitType(ASTNode, ITypeable):
         type_symbol = None
     """
 
+    __slots__ = ('is_encapsulated', 'compound_unit', 'base', 'is_pow', 'exponent', 'lhs', 'is_times', 'is_div', 'rhs',
+                 'unit', 'type_symbol')
+
     def __init__(self, is_encapsulated = False, compound_unit = None, base = None, is_pow = False,
                  exponent = None, lhs = None, rhs = None, is_div = False, is_times = False, _unit = None,
                  source_position = None):
@@ -43,6 +43,8 @@ class ASTUpdateBlock(ASTNode):
         block = None
     """
 
+    __slots__ = ('block',)
+
     def __init__(self, block, source_position):
         """
         Standard constructor.
@@ -41,6 +41,8 @@ class ASTVariable(ASTNode, ITypeable):
         type_symbol = None
     """
 
+    __slots__ = ('name', 'differential_order', 'type_symbol')
+
     def __init__(self, name, differential_order = 0, source_position = None):
         """
         Standard constructor.
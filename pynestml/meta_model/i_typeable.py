@@ -25,9 +25,12 @@ from pynestml.utils.either import Either
 class ITypeable(object):
     """
     This interface indicates that an AST element can store a corresponding type symbol, e.g., a variable
-    with a respective type.
+    with a respective type. The type_symbol slot has to be declared by the implementing classes, since only one
+    base class of a node can have a non-empty instance layout.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         self.type_symbol = None
 
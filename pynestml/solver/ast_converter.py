@@ -0,0 +1,505 @@
+#
+# ast_converter.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import re
+
+from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
+from pynestml.meta_model.ast_bit_operator import ASTBitOperator
+from pynestml.meta_model.ast_comparison_operator import ASTComparisonOperator
+from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+# the tokens of the python expression syntax as printed by sympy and the ode-toolbox, the longer alternatives come
+# first, all other characters, e.g., of bit operators or attributes, are not supported
+_token_pattern = re.compile(r'''
+    (?P<ws>[ \t]+)
+  | (?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)
+  | (?P<name>[a-zA-Z_][a-zA-Z_0-9]*)
+  | (?P<op>\*\*|[<>=!+\-*/]=|[*/%+\-~<>=(),])
+''', re.VERBOSE)
+
+# the keywords of python which can not be used as names
+_keywords = frozenset(('False', 'None', 'True', 'and', 'as', 'assert', 'async', 'await', 'break', 'class', 'continue',
+                       'def', 'del', 'elif', 'else', 'except', 'exec', 'finally', 'for', 'from', 'global', 'if',
+                       'import', 'in', 'is', 'lambda', 'nonlocal', 'not', 'or', 'pass', 'print', 'raise', 'return',
+                       'try', 'while', 'with', 'yield'))
+
+# binding power of the binary operators and the operand of the unary operators, higher binds tighter
+_binary_operators = {'<': 1, '<=': 1, '==': 1, '!=': 1, '>=': 1, '>': 1, '+': 2, '-': 2, '*': 3, '/': 3, '%': 3,
+                     '**': 5}
+_unary_binding = 4
+
+
+class ASTConverter(object):
+    """
+    Converts the results of the solver, i.e., sympy expressions and the strings contained in the ode-toolbox output,
+    directly into meta_model nodes. Both use the Python expression syntax, thus they are read by a hand-written
+    parser of this syntax, which retains all parentheses of the source, and the corresponding nodes are created by
+    the ASTNodeFactory, without printing or parsing NESTML source text. Constructs which are not supported are handed
+    over to the ModelParser. All created nodes are marked as added by the solver.
+    """
+    arithmetic_operators = {'+': 'is_plus_op', '-': 'is_minus_op', '*': 'is_times_op', '/': 'is_div_op',
+                            '%': 'is_modulo_op', '**': 'is_pow_op'}
+    unary_operators = {'+': 'is_unary_plus', '-': 'is_unary_minus', '~': 'is_unary_tilde'}
+    comparison_operators = {'<': 'is_lt', '<=': 'is_le', '==': 'is_eq', '!=': 'is_ne', '>=': 'is_ge', '>': 'is_gt'}
+    compound_assignments = {'+=': 'is_compound_sum', '-=': 'is_compound_minus', '*=': 'is_compound_product',
+                            '/=': 'is_compound_quotient'}
+
+    @classmethod
+    def convert_expression(cls, expression):
+        """
+        Converts the handed over sympy expression or expression string to a meta_model expression.
+        :param expression: a sympy expression or a string in the Python expression syntax
+        :type expression: str or sympy.Expr
+        :return: a new expression
+        :rtype: ASTExpression or ASTSimpleExpression
+        """
+        string = str(expression)
+        try:
+            return _Converter(string).read_expression()
+        except ValueError:
+            return ModelParser.parse_expression(string)
+
+    @classmethod
+    def convert_stmt(cls, stmt):
+        """
+        Converts the handed over update instruction, e.g., "V_m = P * V_m" or "V_m += I_e", to a meta_model statement.
+        :param stmt: a single update instruction
+        :type stmt: str
+        :return: a new statement
+        :rtype: ASTStmt
+        """
+        return cls.convert_stmts([stmt])[0]
+
+    @classmethod
+    def convert_stmts(cls, stmts):
+        """
+        Converts the handed over list of update instructions, i.e., assignments and function calls, to a list of
+        meta_model statements, which can be spliced into a block at once. Only instructions which are not supported
+        are handed over to the model parser.
+        :param stmts: a list of update instructions, one statement each
+        :type stmts: list(str)
+        :return: a list of new statements, in the same order
+        :rtype: list(ASTStmt)
+        """
+        ret = list()
+        for stmt in stmts:
+            line = str(stmt).strip()
+            try:
+                ret.append(_Converter(line).read_stmt())
+            except ValueError:
+                ret.append(ModelParser.parse_stmt(line))
+        return ret
+
+    @classmethod
+    def create_stmt(cls, declaration=None, assignment=None, function_call=None):
+        """
+        Wraps the handed over declaration, assignment or function call into a new statement.
+        :param declaration: a single declaration
+        :type declaration: ASTDeclaration
+        :param assignment: a single assignment
+        :type assignment: ASTAssignment
+        :param function_call: a single function call
+        :type function_call: ASTFunctionCall
+        :return: a new statement
+        :rtype: ASTStmt
+        """
+        small_stmt = ASTNodeFactory.create_ast_small_stmt(declaration=declaration, assignment=assignment,
+                                                          function_call=function_call,
+                                                          source_position=cls.__position())
+        return ASTNodeFactory.create_ast_stmt(small_stmt=small_stmt, source_position=cls.__position())
+
+    @classmethod
+    def create_variable(cls, name):
+        """
+        Creates a variable as added by the solver, e.g., "V_m" or "g_ex'".
+        :param name: the name of the variable, derivatives are indicated by trailing quotes
+        :type name: str
+        :return: a new variable
+        :rtype: ASTVariable
+        """
+        stripped = name.rstrip('\'')
+        return ASTNodeFactory.create_ast_variable(name=stripped, differential_order=len(name) - len(stripped),
+                                                  source_position=cls.__position())
+
+    @classmethod
+    def create_variable_expression(cls, name):
+        """
+        Creates a simple expression referencing a single variable.
+        :param name: the name of the variable
+        :type name: str
+        :return: a new simple expression
+        :rtype: ASTSimpleExpression
+        """
+        return ASTNodeFactory.create_ast_simple_expression(variable=cls.create_variable(name),
+                                                           source_position=cls.__position())
+
+    @classmethod
+    def create_numeric_expression(cls, value):
+        """
+        Creates a simple expression representing a single numeric literal.
+        :param value: the value of the literal
+        :type value: int or float
+        :return: a new simple expression
+        :rtype: ASTSimpleExpression
+        """
+        return ASTNodeFactory.create_ast_simple_expression(numeric_literal=value, source_position=cls.__position())
+
+    @classmethod
+    def create_compound_expression(cls, lhs, operator, rhs, is_encapsulated=False):
+        """
+        Creates a compound arithmetic expression, e.g., "lhs * rhs".
+        :param lhs: the left-hand side
+        :type lhs: ASTExpression or ASTSimpleExpression
+        :param operator: the name of the flag of the arithmetic operator, e.g., is_times_op
+        :type operator: str
+        :param rhs: the right-hand side
+        :type rhs: ASTExpression or ASTSimpleExpression
+        :param is_encapsulated: indicates whether the expression is put in parentheses
+        :type is_encapsulated: bool
+        :return: a new expression
+        :rtype: ASTExpression
+        """
+        binary_operator = ASTNodeFactory.create_ast_arithmetic_operator(source_position=cls.__position(),
+                                                                        **{operator: True})
+        ret = ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=binary_operator, rhs=rhs,
+                                                            source_position=cls.__position())
+        if is_encapsulated:
+            ret = ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=ret,
+                                                       source_position=cls.__position())
+        return ret
+
+    @classmethod
+    def create_declaration(cls, name, expression, unit=None, size_parameter=None):
+        """
+        Creates a declaration of a single variable, e.g., "__h ms = resolution()".
+        :param name: the name of the declared variable
+        :type name: str
+        :param expression: the initial value
+        :type expression: ASTExpression or ASTSimpleExpression
+        :param unit: the name of the unit of the variable, if None the type is real
+        :type unit: str or None
+        :param size_parameter: the size parameter of a vector variable
+        :type size_parameter: str or None
+        :return: a new declaration
+        :rtype: ASTDeclaration
+        """
+        if unit is not None:
+            unit_type = ASTNodeFactory.create_ast_unit_type(unit=unit, source_position=cls.__position())
+            data_type = ASTNodeFactory.create_ast_data_type(is_unit_type=unit_type, source_position=cls.__position())
+        else:
+            data_type = ASTNodeFactory.create_ast_data_type(is_real=True, source_position=cls.__position())
+        data_type.accept(ASTDataTypeVisitor())
+        return ASTNodeFactory.create_ast_declaration(variables=[cls.create_variable(name)], data_type=data_type,
+                                                     size_parameter=size_parameter, expression=expression,
+                                                     source_position=cls.__position())
+
+    @classmethod
+    def create_assignment(cls, name, expression, operator='is_direct_assignment'):
+        """
+        Creates an assignment to a single variable, e.g., "V_m += I_syn".
+        :param name: the name of the assigned variable
+        :type name: str
+        :param expression: the assigned expression
+        :type expression: ASTExpression or ASTSimpleExpression
+        :param operator: the name of the flag of the assignment operator, e.g., is_compound_sum
+        :type operator: str
+        :return: a new assignment
+        :rtype: ASTAssignment
+        """
+        return ASTNodeFactory.create_ast_assignment(lhs=cls.create_variable(name), expression=expression,
+                                                    source_position=cls.__position(), **{operator: True})
+
+    @classmethod
+    def create_ode_shape(cls, name, expression):
+        """
+        Creates a shape defined by an ode, e.g., "shape g_ex' = -g_ex / tau_syn_ex".
+        :param name: the name of the shape variable
+        :type name: str
+        :param expression: the right-hand side of the ode
+        :type expression: ASTExpression or ASTSimpleExpression
+        :return: a new ode shape
+        :rtype: ASTOdeShape
+        """
+        return ASTNodeFactory.create_ast_ode_shape(lhs=cls.create_variable(name + '\''), rhs=expression,
+                                                   source_position=cls.__position())
+
+    @classmethod
+    def copy_expression(cls, expression):
+        """
+        Returns a copy of the handed over expression which is marked as added. In contrast to a deep copy, neither
+        scopes nor symbols are copied, thus the copy can be placed in an arbitrary context.
+        :param expression: a single expression
+        :type expression: ASTExpression or ASTSimpleExpression
+        :return: a copy of the expression
+        :rtype: ASTExpression or ASTSimpleExpression
+        """
+        pos = cls.__position()
+        if isinstance(expression, ASTSimpleExpression):
+            if expression.is_boolean_true or expression.is_boolean_false:
+                boolean_literal = expression.is_boolean_true
+            else:
+                boolean_literal = None
+            return ASTNodeFactory.create_ast_simple_expression(
+                    function_call=(cls.__copy_function_call(expression.function_call)
+                                   if expression.function_call is not None else None),
+                    boolean_literal=boolean_literal, numeric_literal=expression.numeric_literal,
+                    is_inf=expression.is_inf_literal,
+                    variable=(ASTNodeFactory.create_ast_variable(expression.variable.get_name(),
+                                                                 expression.variable.get_differential_order(), pos)
+                              if expression.variable is not None else None),
+                    string=expression.string, source_position=pos)
+        if expression.is_compound_expression():
+            return ASTNodeFactory.create_ast_compound_expression(
+                    lhs=cls.copy_expression(expression.lhs),
+                    binary_operator=cls.__copy_operator(expression.binary_operator),
+                    rhs=cls.copy_expression(expression.rhs), source_position=pos)
+        if expression.is_ternary_operator():
+            return ASTNodeFactory.create_ast_ternary_expression(condition=cls.copy_expression(expression.condition),
+                                                                if_true=cls.copy_expression(expression.if_true),
+                                                                if_not=cls.copy_expression(expression.if_not),
+                                                                source_position=pos)
+        return ASTNodeFactory.create_ast_expression(
+                is_encapsulated=expression.is_encapsulated,
+                unary_operator=(cls.__copy_operator(expression.unary_operator)
+                                if expression.unary_operator is not None else None),
+                is_logical_not=expression.is_logical_not, expression=cls.copy_expression(expression.expression),
+                source_position=pos)
+
+    @classmethod
+    def substitute_variable(cls, expression, name, definition):
+        """
+        Replaces all references to the variable with the handed over name by a copy of its defining expression put
+        in parentheses, e.g., "a + b" with b = "c * d" becomes "a + (c * d)".
+        :param expression: the expression to modify
+        :type expression: ASTExpression or ASTSimpleExpression
+        :param name: the name of the replaced variable
+        :type name: str
+        :param definition: the defining expression of the variable
+        :type definition: ASTExpression or ASTSimpleExpression
+        :return: the modified expression, a new one if the expression itself references the variable
+        :rtype: ASTExpression or ASTSimpleExpression
+        """
+        if cls.__is_reference(expression, name):
+            return ASTNodeFactory.create_ast_expression(is_encapsulated=True,
+                                                        expression=cls.copy_expression(definition),
+                                                        source_position=cls.__position())
+        if isinstance(expression, ASTSimpleExpression):
+            if expression.function_call is not None:
+                args = expression.function_call.args
+                for i in range(len(args)):
+                    args[i] = cls.substitute_variable(args[i], name, definition)
+                    args[i].set_parent(expression.function_call)
+            return expression
+        for attribute in ('expression', 'lhs', 'rhs', 'condition', 'if_true', 'if_not'):
+            if getattr(expression, attribute) is not None:
+                setattr(expression, attribute, cls.substitute_variable(getattr(expression, attribute), name,
+                                                                       definition))
+                getattr(expression, attribute).set_parent(expression)
+        return expression
+
+    @classmethod
+    def mark_as_added(cls, node):
+        """
+        Marks the handed over node and all its children as added by the solver.
+        :param node: a single node
+        :type node: ASTNode
+        """
+        node.accept(ASTHigherOrderVisitor(lambda _node: _node.set_source_position(cls.__position())))
+
+    @classmethod
+    def __is_reference(cls, expression, name):
+        return (isinstance(expression, ASTSimpleExpression) and expression.variable is not None and
+                expression.numeric_literal is None and expression.variable.get_name() == name and
+                expression.variable.get_differential_order() == 0)
+
+    @classmethod
+    def __copy_function_call(cls, function_call):
+        return ASTNodeFactory.create_ast_function_call(callee_name=function_call.get_name(),
+                                                       args=[cls.copy_expression(arg)
+                                                             for arg in function_call.get_args()],
+                                                       source_position=cls.__position())
+
+    @classmethod
+    def __copy_operator(cls, operator):
+        pos = cls.__position()
+        if isinstance(operator, ASTArithmeticOperator):
+            return ASTNodeFactory.create_ast_arithmetic_operator(operator.is_times_op, operator.is_div_op,
+                                                                 operator.is_modulo_op, operator.is_plus_op,
+                                                                 operator.is_minus_op, operator.is_pow_op, pos)
+        if isinstance(operator, ASTComparisonOperator):
+            return ASTNodeFactory.create_ast_comparison_operator(operator.is_lt, operator.is_le, operator.is_eq,
+                                                                 operator.is_ne, operator.is_ne2, operator.is_ge,
+                                                                 operator.is_gt, pos)
+        if isinstance(operator, ASTLogicalOperator):
+            return ASTNodeFactory.create_ast_logical_operator(operator.is_logical_and, operator.is_logical_or, pos)
+        if isinstance(operator, ASTBitOperator):
+            return ASTNodeFactory.create_ast_bit_operator(operator.is_bit_and, operator.is_bit_xor, operator.is_bit_or,
+                                                          operator.is_bit_shift_left, operator.is_bit_shift_right,
+                                                          pos)
+        return ASTNodeFactory.create_ast_unary_operator(operator.is_unary_plus, operator.is_unary_minus,
+                                                        operator.is_unary_tilde, pos)
+
+    @classmethod
+    def __position(cls):
+        return ASTSourceLocation.get_added_source_position()
+
+
+class _Converter(object):
+    """
+    Reads a single expression or update instruction in the Python syntax by precedence climbing and creates the
+    corresponding nodes. In contrast to Python's ast module, the parentheses of the source are retained and the result
+    does not depend on the version of Python. A ValueError is raised for all unsupported constructs.
+    """
+
+    def __init__(self, source):
+        self.tokens = self.tokenize(source)
+        self.position = 0
+
+    @classmethod
+    def tokenize(cls, source):
+        tokens = list()
+        position = 0
+        while position < len(source):
+            match = _token_pattern.match(source, position)
+            if match is None:
+                raise ValueError(source)
+            position = match.end()
+            if match.lastgroup != 'ws':
+                tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        return tokens
+
+    def read_expression(self):
+        ret = self.parse_expression(0)
+        self.expect_end()
+        return ret
+
+    def read_stmt(self):
+        if self.tokens[1:2] == [('op', '(')]:
+            expression = self.read_expression()
+            if not isinstance(expression, ASTSimpleExpression) or not expression.is_function_call():
+                raise ValueError('expected a function call')
+            return ASTConverter.create_stmt(function_call=expression.get_function_call())
+        return ASTConverter.create_stmt(assignment=self.read_assignment())
+
+    def read_assignment(self):
+        kind, name = self.next()
+        operator = self.next()
+        if kind != 'name' or name in _keywords or operator[0] != 'op' or \
+                (operator[1] != '=' and operator[1] not in ASTConverter.compound_assignments):
+            raise ValueError(name)
+        expression = self.read_expression()
+        if operator[1] == '=':
+            return ASTConverter.create_assignment(name, expression)
+        return ASTConverter.create_assignment(name, expression, ASTConverter.compound_assignments[operator[1]])
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise ValueError('unexpected end of expression')
+        self.position += 1
+        return token
+
+    def expect(self, text):
+        if self.next() != ('op', text):
+            raise ValueError('expected %s' % text)
+
+    def expect_end(self):
+        if self.position != len(self.tokens):
+            raise ValueError('unexpected token %s' % self.peek()[1])
+
+    def parse_expression(self, binding):
+        lhs = self.parse_prefix(binding)
+        # comparisons can not be chained, e.g., a < b < c
+        is_comparison = False
+        while True:
+            kind, text = self.peek()
+            if kind != 'op' or text not in _binary_operators or _binary_operators[text] < binding:
+                return lhs
+            if text in ASTConverter.comparison_operators:
+                if is_comparison:
+                    raise ValueError('chained comparison')
+                is_comparison = True
+            self.position += 1
+            # the power operator is right associative
+            rhs = self.parse_expression(_binary_operators[text] + (0 if text == '**' else 1))
+            pos = ASTSourceLocation.get_added_source_position()
+            if text in ASTConverter.comparison_operators:
+                binary_operator = ASTNodeFactory.create_ast_comparison_operator(
+                        source_position=pos, **{ASTConverter.comparison_operators[text]: True})
+            else:
+                binary_operator = ASTNodeFactory.create_ast_arithmetic_operator(
+                        source_position=pos, **{ASTConverter.arithmetic_operators[text]: True})
+            lhs = ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=binary_operator, rhs=rhs,
+                                                                source_position=pos)
+
+    def parse_prefix(self, binding):
+        pos = ASTSourceLocation.get_added_source_position()
+        kind, text = self.next()
+        if kind == 'op' and text == '(':
+            term = self.parse_expression(0)
+            self.expect(')')
+            return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=term, source_position=pos)
+        if kind == 'op' and text in ASTConverter.unary_operators:
+            unary_operator = ASTNodeFactory.create_ast_unary_operator(
+                    source_position=pos, **{ASTConverter.unary_operators[text]: True})
+            term = self.parse_expression(_unary_binding)
+            return ASTNodeFactory.create_ast_expression(unary_operator=unary_operator, expression=term,
+                                                        source_position=pos)
+        # the logical not binds weaker than all binary operators, thus it can not be one of their operands
+        if kind == 'name' and text == 'not' and binding == 0:
+            return ASTNodeFactory.create_ast_expression(is_logical_not=True, expression=self.parse_expression(0),
+                                                        source_position=pos)
+        if kind == 'number':
+            # in contrast to the NESTML lexer, exponents with leading zeros as printed by python, e.g., 5e-05, are
+            # read correctly
+            if any(char in text for char in '.eE'):
+                return ASTConverter.create_numeric_expression(float(text))
+            return ASTConverter.create_numeric_expression(int(text))
+        if kind == 'name' and text in ('True', 'False', 'true', 'false'):
+            return ASTNodeFactory.create_ast_simple_expression(boolean_literal=text in ('True', 'true'),
+                                                               source_position=pos)
+        if kind == 'name' and text == 'inf':
+            return ASTNodeFactory.create_ast_simple_expression(is_inf=True, source_position=pos)
+        if kind == 'name' and text not in _keywords:
+            if self.peek() == ('op', '('):
+                function_call = self.parse_function_call(text)
+                return ASTNodeFactory.create_ast_simple_expression(function_call=function_call, source_position=pos)
+            return ASTConverter.create_variable_expression(text)
+        raise ValueError('unexpected token %s' % text)
+
+    def parse_function_call(self, name):
+        self.expect('(')
+        args = list()
+        while self.peek() != ('op', ')'):
+            args.append(self.parse_expression(0))
+            if self.peek() != ('op', ','):
+                break
+            self.position += 1
+        self.expect(')')
+        return ASTNodeFactory.create_ast_function_call(callee_name=name, args=args,
+                                                       source_position=ASTSourceLocation.get_added_source_position())
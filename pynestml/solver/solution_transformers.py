@@ -19,19 +19,75 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 import re
 
-from sympy import Symbol, diff, exp, simplify
-from sympy.parsing.sympy_parser import parse_expr
-
+from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.meta_model.ast_ode_shape import ASTOdeShape
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.solver.ast_converter import ASTConverter
 from pynestml.solver.transformer_base import add_declarations_to_initial_values, add_declarations_to_internals, \
     add_state_updates, compute_state_shape_variables_declarations, compute_state_shape_variables_updates, \
     replace_integrate_call
+from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.utils.ast_helper import ASTHelper
-from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.time_budget import TimeBudget
 
 
 def integrate_delta_solution(equations_block, neuron, shape, shape_to_buffers):
+    ode_lhs = str(ASTHelper.get_ode_equations_from_equations_block(equations_block)[0].get_lhs().get_name())
+    ode_rhs = str(ASTHelper.get_ode_equations_from_equations_block(equations_block)[0].get_rhs())
+    shape_name = shape.get_variable().get_name()
+    # tau is passed as the second argument of the 'delta' function
+    tau_constant = str(shape.get_expression().get_function_call().get_args()[1])
+    # the symbolic part is cancelled if it exceeds its time budget
+    ode_var_update_instructions = TimeBudget.run('delta_solution', compute_delta_solution, ode_lhs, ode_rhs,
+                                                 shape_name, tau_constant)
+    for k in shape_to_buffers:
+        ode_var_update_instructions.append(str(ode_lhs) + " += " + shape_to_buffers[k])
+    ASTHelper.add_to_internal_block(neuron, create_resolution_declaration())
+    replace_integrate_call(neuron, ode_var_update_instructions)
+    return neuron
+
+
+def integrate_delta_numerically(equations_block, neuron, shape, shape_to_buffers):
+    # type: (ASTEquationsBlock, ASTNeuron, ASTOdeShape, map(str, str)) -> ASTNeuron
+    """
+    Prepares a neuron whose ode is driven by a delta shape to be solved numerically, e.g., if the computation of
+    the exact solution has been cancelled. The delta shape is removed from the ode, which is then integrated by the
+    numeric solver, while the incoming spikes are added to the variable of the ode after each integration step as
+    done by the exact solution.
+    :param equations_block: the equations block of the neuron.
+    :param neuron: a single neuron instance.
+    :param shape: the delta shape.
+    :param shape_to_buffers: map of shape names to buffers to which they were connected.
+    :return: the modified neuron
+    """
+    ode_equation = ASTHelper.get_ode_equations_from_equations_block(equations_block)[0]
+    ode_lhs = str(ode_equation.get_lhs().get_name())
+    ode_equation.rhs = ASTConverter.substitute_variable(ode_equation.get_rhs(), shape.get_variable().get_name(),
+                                                        ASTConverter.create_numeric_expression(0))
+    ode_equation.rhs.set_parent(ode_equation)
+    equations_block.get_declarations().remove(shape)
+    neuron.invalidate_index()
+    replace_integrate_call(neuron, [PredefinedFunctions.INTEGRATE_ODES + '()'] +
+                           [ode_lhs + ' += ' + shape_to_buffers[k] for k in shape_to_buffers])
+    return neuron
+
+
+def compute_delta_solution(ode_lhs, ode_rhs, shape_name, tau_constant):
+    # type: (str, str, str, str) -> list(str)
+    """
+    Computes the update instructions of an ode driven by a delta shape.
+    :param ode_lhs: the name of the variable of the ode
+    :param ode_rhs: the right hand side of the ode
+    :param shape_name: the name of the delta shape
+    :param tau_constant: the time constant as handed over to the delta function
+    :return: a list of update instructions
+    """
+    # sympy is only imported if a delta shape is actually processed
+    from sympy import Symbol, diff, exp, simplify
+    from sympy.parsing.sympy_parser import parse_expr
+
     def ode_is_lin_const_coeff(ode_symbol, ode_definition, shapes):
         """
         TODO: improve the original code: the function should take a list of shape names, not objects
@@ -59,9 +115,6 @@ def integrate_delta_solution(equations_block, neuron, shape, shape_to_buffers):
                     return False
         return True
 
-    ode_lhs = str(ASTHelper.get_ode_equations_from_equations_block(equations_block)[0].get_lhs().get_name())
-    ode_rhs = str(ASTHelper.get_ode_equations_from_equations_block(equations_block)[0].get_rhs())
-    shape_name = shape.get_variable().get_name()
     if not (ode_is_lin_const_coeff(ode_lhs, ode_rhs, [shape_name])):
         raise Exception("Cannot handle delta shape in a not linear constant coefficient ODE.")
     ode_lhs = parse_expr(ode_lhs)
@@ -73,17 +126,23 @@ def integrate_delta_solution(equations_block, neuron, shape, shape_to_buffers):
     c1 = diff(ode_rhs, ode_lhs)
     # The symbol must be declared again. Otherwise, the right hand side will be used for the derivative
     c2 = diff(ode_rhs, parse_expr(shape_name))
-    # tau is passed as the second argument of the 'delta' function
-    tau_constant = parse_expr(str(shape.get_expression().get_function_call().get_args()[1]))
+    tau_constant = parse_expr(tau_constant)
     ode_var_factor = exp(-Symbol('__h') / tau_constant)
-    ode_var_update_instructions = [
-        str(ode_lhs) + " = " + str(ode_var_factor * ode_lhs),
-        str(ode_lhs) + " += " + str(simplify(c2 / c1 * (exp(Symbol('__h') * c1) - 1)) * const_input)]
-    for k in shape_to_buffers:
-        ode_var_update_instructions.append(str(ode_lhs) + " += " + shape_to_buffers[k])
-    ASTHelper.add_to_internal_block(neuron, ModelParser.parse_declaration('__h ms = resolution()'))
-    replace_integrate_call(neuron, ode_var_update_instructions)
-    return neuron
+    return [str(ode_lhs) + " = " + str(ode_var_factor * ode_lhs),
+            str(ode_lhs) + " += " + str(simplify(c2 / c1 * (exp(Symbol('__h') * c1) - 1)) * const_input)]
+
+
+def create_resolution_declaration():
+    # type: () -> ASTDeclaration
+    """
+    Creates the declaration of the step size as used by the propagators, i.e., "__h ms = resolution()".
+    :return: a new declaration
+    """
+    resolution = ASTNodeFactory.create_ast_function_call(callee_name='resolution', args=[],
+                                                         source_position=ASTSourceLocation.get_added_source_position())
+    expression = ASTNodeFactory.create_ast_simple_expression(
+            function_call=resolution, source_position=ASTSourceLocation.get_added_source_position())
+    return ASTConverter.create_declaration('__h', expression, unit='ms')
 
 
 def integrate_exact_solution(neuron, exact_solution):
@@ -94,7 +153,7 @@ def integrate_exact_solution(neuron, exact_solution):
     :param exact_solution: exact solution
     :return: a modified neuron with integrated exact solution and without equations block
     """
-    ASTHelper.add_to_internal_block(neuron, ModelParser.parse_declaration('__h ms = resolution()'))
+    ASTHelper.add_to_internal_block(neuron, create_resolution_declaration())
     neuron = add_declarations_to_internals(neuron, exact_solution["propagator"])
 
     state_shape_variables_declarations = compute_state_shape_variables_declarations(exact_solution)
@@ -127,6 +186,7 @@ def functional_shapes_to_odes(neuron, transformed_shapes):
                 shapes_to_delete.append(declaration)
     for declaration in shapes_to_delete:
         ASTHelper.get_equations_block_from_neuron(neuron).get_declarations().remove(declaration)
+    neuron.invalidate_index()
 
     state_shape_variables_declarations = {}
     for shape_name in shape_names:
@@ -138,7 +198,7 @@ def functional_shapes_to_odes(neuron, transformed_shapes):
         for variable, shape_state_ode in zip(
                 shape_name_to_shape_state_variables[shape_name],
                 shape_state_variable_to_ode[shape_name]):
-            ode_shape = ModelParser.parse_ode_shape("shape " + variable + "' = " + shape_state_ode)
+            ode_shape = ASTConverter.create_ode_shape(variable, ASTConverter.convert_expression(shape_state_ode))
             ASTHelper.add_shape(neuron, ode_shape)
 
     neuron = add_declarations_to_initial_values(neuron, state_shape_variables_declarations)
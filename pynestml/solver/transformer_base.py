@@ -19,16 +19,15 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 import re as re
 
-from pynestml.codegeneration.expressions_pretty_printer import ExpressionsPrettyPrinter
 from pynestml.meta_model.ast_block import ASTBlock
 from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.meta_model.ast_small_stmt import ASTSmallStmt
 from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.solver.ast_converter import ASTConverter
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.utils.ast_utils import ASTUtils
-from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.ode_transformer import OdeTransformer
 from pynestml.utils.ast_helper import ASTHelper
 
@@ -55,15 +54,11 @@ def add_declaration_to_internals(neuron, variable_name, init_expression):
     :return: the neuron extended by the variable
     """
     try:
-        tmp = ModelParser.parse_expression(init_expression)
-        vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
-
-        declaration_string = variable_name + ' real' + (
-            '[' + vector_variable.get_vector_parameter() + ']'
-            if vector_variable is not None and vector_variable.has_vector_parameter() else '') + ' = ' + init_expression
-        ast_declaration = ModelParser.parse_declaration(declaration_string)
-        if vector_variable is not None:
-            ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
+        expression = ASTConverter.convert_expression(init_expression)
+        vector_variable = ASTUtils.get_vectorized_variable(expression, neuron.get_scope())
+        ast_declaration = ASTConverter.create_declaration(
+                variable_name, expression,
+                size_parameter=(vector_variable.get_vector_parameter() if vector_variable is not None else None))
         ASTHelper.add_to_internal_block(neuron, ast_declaration)
         return neuron
     except:
@@ -93,15 +88,11 @@ def add_declaration_to_initial_values(neuron, variable, initial_value):
     :return: a modified neuron
     """
     try:
-
-        tmp = ModelParser.parse_expression(initial_value)
-        vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
-        declaration_string = variable + ' real' + (
-            '[' + vector_variable.get_vector_parameter() + ']'
-            if vector_variable is not None and vector_variable.has_vector_parameter() else '') + ' = ' + initial_value
-        ast_declaration = ModelParser.parse_declaration(declaration_string)
-        if vector_variable is not None:
-            ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
+        expression = ASTConverter.convert_expression(initial_value)
+        vector_variable = ASTUtils.get_vectorized_variable(expression, neuron.get_scope())
+        ast_declaration = ASTConverter.create_declaration(
+                variable, expression,
+                size_parameter=(vector_variable.get_vector_parameter() if vector_variable is not None else None))
         ASTHelper.add_to_initial_values_block(neuron, ast_declaration)
         return neuron
     except:
@@ -172,13 +163,17 @@ def replace_integrate_call(neuron, update_instructions):
         small_statement = ASTUtils.get_parent(neuron, integrate_call)
         assert (small_statement is not None and isinstance(small_statement, ASTSmallStmt))
 
-        block = ASTUtils.get_parent(neuron, (ASTUtils.get_parent(neuron, small_statement)))
+        stmt = ASTUtils.get_parent(neuron, small_statement)
+        block = ASTUtils.get_parent(neuron, stmt)
         assert (block is not None and isinstance(block, ASTBlock))
 
         for i in range(0, len(block.get_stmts())):
-            if block.get_stmts()[i].equals(ASTUtils.get_parent(neuron, small_statement)):
-                del block.get_stmts()[i]
-                block.get_stmts()[i:i] = list((ModelParser.parse_stmt(prop) for prop in update_instructions))
+            if block.get_stmts()[i] is stmt:
+                # all instructions are converted at once and spliced into the block in place of the integrate call
+                stmts = ASTConverter.convert_stmts(update_instructions)
+                block.get_stmts()[i:i + 1] = stmts
+                for new_stmt in stmts:
+                    new_stmt.set_parent(block)
                 break
     return neuron
 
@@ -194,7 +189,6 @@ def apply_incoming_spikes(neuron):
     assert (neuron is not None and isinstance(neuron, ASTNeuron)), \
         '(PyNestML.Solver.BaseTransformer) No or wrong type of neuron provided (%s)!' % type(neuron)
     conv_calls = OdeTransformer.get_sum_function_calls(neuron)
-    printer = ExpressionsPrettyPrinter()
     spikes_updates = list()
     for convCall in conv_calls:
         shape = convCall.get_args()[0].get_variable().get_complete_name()
@@ -207,12 +201,13 @@ def apply_incoming_spikes(neuron):
             for variable in astDeclaration.get_variables():
                 if re.match(shape + "[\']*", variable.get_complete_name()) or re.match(shape + '__[\\d]+$',
                                                                                        variable.get_complete_name()):
-                    spikes_updates.append(ModelParser.parse_assignment(
-                            variable.get_complete_name() + " += " + buffer + " * " + printer.print_expression(
-                                    astDeclaration.get_expression())))
-    for update in spikes_updates:
-        add_assignment_to_update_block(update, neuron)
-    return neuron
+                    spikes_updates.append(ASTConverter.create_stmt(assignment=ASTConverter.create_assignment(
+                            variable.get_complete_name(),
+                            ASTConverter.create_compound_expression(
+                                    ASTConverter.create_variable_expression(buffer), 'is_times_op',
+                                    ASTConverter.copy_expression(astDeclaration.get_expression())),
+                            'is_compound_sum')))
+    return add_stmts_to_update_block(spikes_updates, neuron)
 
 
 def add_assignment_to_update_block(assignment, neuron):
@@ -227,7 +222,7 @@ def add_assignment_to_update_block(assignment, neuron):
                                                       source_position=ASTSourceLocation.get_added_source_position())
     stmt = ASTNodeFactory.create_ast_stmt(small_stmt=small_stmt,
                                           source_position=ASTSourceLocation.get_added_source_position())
-    ASTHelper.get_update_block_from_neuron(neuron).get_block().get_stmts().append(stmt)
+    ASTHelper.get_update_block_from_neuron(neuron).get_block().add_stmt(stmt)
     return neuron
 
 
@@ -244,7 +239,7 @@ def add_declaration_to_update_block(declaration, neuron):
                                                       source_position=ASTSourceLocation.get_added_source_position())
     stmt = ASTNodeFactory.create_ast_stmt(small_stmt=small_stmt,
                                           source_position=ASTSourceLocation.get_added_source_position())
-    ASTHelper.get_update_block_from_neuron(neuron).get_block().get_stmts().append(stmt)
+    ASTHelper.get_update_block_from_neuron(neuron).get_block().add_stmt(stmt)
     return neuron
 
 
@@ -256,9 +251,26 @@ def add_state_updates(state_shape_variables_updates, neuron):
     :param neuron: a single neuron
     :return: a modified version of the neuron
     """
+    stmts = list()
     for variable in state_shape_variables_updates:
-        declaration_statement = variable + '__tmp real = ' + state_shape_variables_updates[variable]
-        add_declaration_to_update_block(ModelParser.parse_declaration(declaration_statement), neuron)
+        stmts.append(ASTConverter.create_stmt(declaration=ASTConverter.create_declaration(
+                variable + '__tmp', ASTConverter.convert_expression(state_shape_variables_updates[variable]))))
     for variable in state_shape_variables_updates:
-        add_assignment_to_update_block(ModelParser.parse_assignment(variable + ' = ' + variable + '__tmp'), neuron)
+        stmts.append(ASTConverter.create_stmt(assignment=ASTConverter.create_assignment(
+                variable, ASTConverter.create_variable_expression(variable + '__tmp'))))
+    return add_stmts_to_update_block(stmts, neuron)
+
+
+def add_stmts_to_update_block(stmts, neuron):
+    # type: (list(ASTStmt), ASTNeuron) -> ASTNeuron
+    """
+    Adds a list of statements to the end of the update block of the handed over neuron.
+    :param stmts: a list of statements
+    :param neuron: a single neuron instance
+    :return: a modified neuron
+    """
+    block = ASTHelper.get_update_block_from_neuron(neuron).get_block()
+    block.get_stmts().extend(stmts)
+    for stmt in stmts:
+        stmt.set_parent(block)
     return neuron
@@ -18,8 +18,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.utils.compilation_session import session_state
 
 
+@session_state('name2neuron_scope', 'source_location')
 class SymbolTable(object):
     """
     This class is used to store a single symbol table, consisting of scope and symbols.
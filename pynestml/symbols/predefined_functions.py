@@ -19,8 +19,10 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.symbols.function_symbol import FunctionSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.compilation_session import session_state
 
 
+@session_state('name2function', inherit=True)
 class PredefinedFunctions(object):
     """
     This class is used to represent all predefined functions of NESTML.
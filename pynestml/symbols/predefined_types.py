@@ -24,12 +24,14 @@ from astropy.units.quantity import Quantity
 
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.utils.compilation_session import session_state
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.utils.type_dictionary import TypeDictionary
 from pynestml.utils.unit_type import UnitType
 
 
+@session_state('name2type', inherit=True)
 class PredefinedTypes(object):
     """
     This class represents all types which are predefined in the system.
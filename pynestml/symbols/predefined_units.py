@@ -19,11 +19,13 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from astropy import units as u
 
+from pynestml.utils.compilation_session import session_state
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.unit_type import UnitType
 
 
+@session_state('name2unit', 'prefixless_units', 'prefixes', inherit=True)
 class PredefinedUnits(object):
     """
     This class represents a collection of physical units. Units can be retrieved by means of get_unit(name).
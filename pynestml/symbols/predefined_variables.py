@@ -19,8 +19,10 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.variable_symbol import VariableSymbol, BlockType, VariableType
+from pynestml.utils.compilation_session import session_state
 
 
+@session_state('name2variable', inherit=True)
 class PredefinedVariables(object):
     """
     This class is used to store all predefined variables as generally available. 
@@ -0,0 +1,140 @@
+#
+# ast_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import errno
+import hashlib
+import os
+import pickle
+import tempfile
+
+import pynestml
+from pynestml.utils.compilation_session import session_state
+
+
+@session_state('cache_path')
+class ASTCache(object):
+    """
+    This class stores the ASTs of parsed models in a cache directory, such that unchanged models do not have to be
+    lexed and parsed again. The ASTs are stored as created by the AST builder, i.e., before the symbol tables are
+    constructed, and are keyed by the content of the model, the version of the grammar and the version of PyNestML.
+    Only models which have been parsed without warnings and errors are stored, such that a cached AST is equivalent
+    to a freshly parsed one.
+    Attributes:
+        cache_path           The path to the cache directory, None if caching is disabled.
+        grammar_fingerprint  A fingerprint of the serialized ATNs of the generated lexer and parser.
+    """
+    cache_path = None
+    grammar_fingerprint = None
+
+    @classmethod
+    def init_ast_cache(cls, cache_path = None):
+        """
+        Initializes the cache.
+        :param cache_path: the path to the cache directory, None if caching is disabled.
+        :type cache_path: str
+        """
+        cls.cache_path = cache_path
+
+    @classmethod
+    def is_enabled(cls):
+        """
+        Indicates whether ASTs shall be cached.
+        :return: True if enabled, otherwise False.
+        :rtype: bool
+        """
+        return cls.cache_path is not None
+
+    @classmethod
+    def compute_key(cls, model):
+        """
+        Computes the key of the handed over model file.
+        :param model: the path to a model file.
+        :type model: str
+        :return: the key
+        :rtype: str
+        """
+        key = hashlib.sha1()
+        with open(model, 'rb') as f:
+            key.update(f.read())
+        key.update(cls.get_grammar_fingerprint().encode('utf-8'))
+        key.update(pynestml.__version__.encode('utf-8'))
+        return key.hexdigest()
+
+    @classmethod
+    def get_grammar_fingerprint(cls):
+        """
+        Returns a fingerprint of the grammar, such that every regeneration of the parser invalidates the cache.
+        :return: the fingerprint
+        :rtype: str
+        """
+        if cls.grammar_fingerprint is None:
+            from pynestml.generated import PyNestMLLexer, PyNestMLParser
+            fingerprint = hashlib.sha1()
+            fingerprint.update(PyNestMLLexer.serializedATN().encode('utf-8'))
+            fingerprint.update(PyNestMLParser.serializedATN().encode('utf-8'))
+            cls.grammar_fingerprint = fingerprint.hexdigest()
+        return cls.grammar_fingerprint
+
+    @classmethod
+    def load(cls, key):
+        """
+        Loads the AST stored under the handed over key. Missing or broken entries are regarded as cache misses.
+        :param key: the key of a model.
+        :type key: str
+        :return: the compilation unit if cached, otherwise None.
+        :rtype: ASTNestMLCompilationUnit
+        """
+        entry_path = os.path.join(cls.cache_path, key + '.ast')
+        if not os.path.isfile(entry_path):
+            return None
+        try:
+            with open(entry_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    @classmethod
+    def store(cls, key, ast):
+        """
+        Stores the handed over AST under the handed over key. The entry is written to a temporary file first, such
+        that concurrent processes never read partially written entries.
+        :param key: the key of a model.
+        :type key: str
+        :param ast: the compilation unit as created by the AST builder.
+        :type ast: ASTNestMLCompilationUnit
+        """
+        # the cache is only an optimization, thus an unusable cache directory does not stop the processing
+        try:
+            os.makedirs(cls.cache_path)
+        except OSError as e:
+            # the directory might have been created by a concurrent process in the meantime
+            if e.errno != errno.EEXIST:
+                return
+        try:
+            (handle, temp_path) = tempfile.mkstemp(dir=cls.cache_path, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                pickle.dump(ast, f, pickle.HIGHEST_PROTOCOL)
+            # renaming is atomic on posix systems, elsewhere an existing entry makes it fail and is kept
+            os.rename(temp_path, os.path.join(cls.cache_path, key + '.ast'))
+        except (OSError, pickle.PicklingError, RuntimeError):
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
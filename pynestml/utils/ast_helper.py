@@ -20,7 +20,6 @@
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
-from pynestml.meta_model.ast_constraints_block import ASTConstraintsBlock
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_function import ASTFunction
@@ -253,11 +252,7 @@ class ASTHelper(object):
         :return: a list of all ode equations.
         :rtype: list(ASTOdeEquations)
         """
-        ret = list()
-        for decl in equations_block.get_declarations():
-            if isinstance(decl, ASTOdeEquation):
-                ret.append(decl)
-        return ret
+        return cls.__get_declarations_of_type(equations_block, ASTOdeEquation)
 
     @classmethod
     def get_ode_functions_from_equations_block(cls, equations_block):
@@ -268,11 +263,7 @@ class ASTHelper(object):
         :return: a list of all ode shapes.
         :rtype: list(ASTOdeShape)
         """
-        ret = list()
-        for decl in equations_block.get_declarations():
-            if isinstance(decl, ASTOdeFunction):
-                ret.append(decl)
-        return ret
+        return cls.__get_declarations_of_type(equations_block, ASTOdeFunction)
 
     @classmethod
     def get_ode_shapes_from_equations_block(cls, equations_block):
@@ -283,11 +274,27 @@ class ASTHelper(object):
         :return: a list of all ode shapes.
         :rtype: list(ASTOdeShape)
         """
-        ret = list()
-        for decl in equations_block.get_declarations():
-            if isinstance(decl, ASTOdeShape):
-                ret.append(decl)
-        return ret
+        return cls.__get_declarations_of_type(equations_block, ASTOdeShape)
+
+    @classmethod
+    def __get_declarations_of_type(cls, equations_block, declaration_type):
+        """
+        Returns all declarations of the handed over type in the equations block. If the block is the equations block
+        of a neuron, the declarations are retrieved from the index of the neuron.
+        :param equations_block: a single equations block
+        :type equations_block: ASTEquationsBlock
+        :param declaration_type: the type of the declarations
+        :type declaration_type: type
+        :return: a list of declarations
+        :rtype: list(ASTOdeEquation) or list(ASTOdeFunction) or list(ASTOdeShape)
+        """
+        body = equations_block.get_parent()
+        neuron = body.get_parent() if body is not None else None
+        if isinstance(neuron, ASTNeuron):
+            blocks = neuron.get_blocks_of_kind('equations')
+            if len(blocks) > 0 and blocks[0] is equations_block:
+                return list(neuron.get_declarations_of_equations_block(declaration_type))
+        return [decl for decl in equations_block.get_declarations() if isinstance(decl, declaration_type)]
 
     @classmethod
     def get_variables_from_expression(cls, expression):
@@ -345,6 +352,20 @@ class ASTHelper(object):
         expression.accept(ASTHigherOrderVisitor(visit_funcs=local_get_function_call))
         return ret
 
+    @classmethod
+    def __get_block_of_kind(cls, neuron, kind):
+        """
+        Returns the first body element of the handed over kind as stored in the index of the neuron.
+        :param neuron: a single neuron instance
+        :type neuron: ASTNeuron
+        :param kind: the kind of the body element, e.g., 'state'
+        :type kind: str
+        :return: a single body element or None
+        :rtype: ASTNode
+        """
+        blocks = neuron.get_blocks_of_kind(kind)
+        return blocks[0] if len(blocks) > 0 else None
+
     @classmethod
     def get_functions_from_neuron(cls, neuron):
         """
@@ -354,12 +375,7 @@ class ASTHelper(object):
         :return: a list of function declarations.
         :rtype: list(ASTFunction)
         """
-        ret = list()
-        from pynestml.meta_model.ast_function import ASTFunction
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTFunction):
-                ret.append(elem)
-        return ret
+        return list(neuron.get_blocks_of_kind('function'))
 
     @classmethod
     def get_update_block_from_neuron(cls, neuron):
@@ -370,9 +386,7 @@ class ASTHelper(object):
         :return: an update-block
         :rtype: ASTUpdateBlock
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTUpdateBlock):
-                return elem
+        return cls.__get_block_of_kind(neuron, 'update')
 
     @classmethod
     def get_state_block_from_neuron(cls, neuron):
@@ -383,9 +397,7 @@ class ASTHelper(object):
         :return: a state-block
         :rtype: ASTBlockWithVariables
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTBlockWithVariables) and elem.is_state:
-                return elem
+        return cls.__get_block_of_kind(neuron, 'state')
 
     @classmethod
     def get_initial_block_from_neuron(cls, neuron):
@@ -396,9 +408,7 @@ class ASTHelper(object):
         :return: an initial-block
         :rtype: ASTBlockWithVariables
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTBlockWithVariables) and elem.is_initial_values:
-                return elem
+        return cls.__get_block_of_kind(neuron, 'initial_values')
 
     @classmethod
     def get_parameter_block_from_neuron(cls, neuron):
@@ -409,9 +419,7 @@ class ASTHelper(object):
         :return: a parameters-block.
         :rtype: ASTBlockWithVariables
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTBlockWithVariables) and elem.is_parameters:
-                return elem
+        return cls.__get_block_of_kind(neuron, 'parameters')
 
     @classmethod
     def get_internals_block_from_neuron(cls, neuron):
@@ -422,9 +430,7 @@ class ASTHelper(object):
         :return: an internals-block
         :rtype: ASTBlockWithVariables
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTBlockWithVariables) and elem.is_internals:
-                return elem
+        return cls.__get_block_of_kind(neuron, 'internals')
 
     @classmethod
     def get_equations_block_from_neuron(cls, neuron):
@@ -435,9 +441,7 @@ class ASTHelper(object):
         :return: an equations-block
         :rtype: ASTEquationsBlock
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTEquationsBlock):
-                return elem
+        return cls.__get_block_of_kind(neuron, 'equations')
 
     @classmethod
     def remove_equations_block_from_neuron(cls, neuron):
@@ -449,6 +453,7 @@ class ASTHelper(object):
         for elem in neuron.get_body().get_body_elements():
             if isinstance(elem, ASTEquationsBlock):
                 neuron.get_body().get_body_elements().remove(elem)
+        neuron.invalidate_index()
 
     @classmethod
     def get_initial_values_declarations_from_neuron(cls, neuron):
@@ -487,9 +492,7 @@ class ASTHelper(object):
         :return: an input-block
         :rtype: ASTInputBlock
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTInputBlock):
-                return elem
+        return cls.__get_block_of_kind(neuron, 'input')
 
     @classmethod
     def get_input_buffers_from_neuron(cls, neuron):
@@ -633,9 +636,7 @@ class ASTHelper(object):
         :return: a list of defined output-blocks.
         :rtype: list(ASTOutputBlock)
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTOutputBlock):
-                return elem
+        return cls.__get_block_of_kind(neuron, 'output')
 
     @classmethod
     def neuron_is_multisynapse_spikes(cls, neuron):
@@ -683,9 +684,7 @@ class ASTHelper(object):
         :return: a single constraint block
         :rtype: ASTConstraintBlock
         """
-        for block in neuron.get_body().get_body_elements():
-            if isinstance(block, ASTConstraintsBlock):
-                return block
+        return cls.__get_block_of_kind(neuron, 'constraints')
 
     @classmethod
     def get_parameter_non_alias_symbols_from_neuron(cls, neuron):
@@ -773,9 +772,7 @@ class ASTHelper(object):
         :return: a list of initial-blocks.
         :rtype: ASTBlockWithVariables
         """
-        for elem in neuron.get_body().get_body_elements():
-            if isinstance(elem, ASTBlockWithVariables) and elem.is_initial_values:
-                return elem
+        return cls.__get_block_of_kind(neuron, 'initial_values')
 
     @classmethod
     def remove_initial_blocks_from_neuron(cls, neuron):
@@ -788,6 +785,7 @@ class ASTHelper(object):
         for elem in neuron.get_body().get_body_elements():
             if isinstance(elem, ASTBlockWithVariables) and elem.is_initial_values:
                 neuron.get_body().get_body_elements().remove(elem)
+        neuron.invalidate_index()
 
     @classmethod
     def get_function_initial_values_symbols_from_neuron(cls, neuron):
@@ -898,6 +896,7 @@ class ASTHelper(object):
         if ASTHelper.get_internals_block_from_neuron(neuron) is None:
             ASTUtils.create_internal_block(neuron)
             ASTHelper.get_internals_block_from_neuron(neuron).get_declarations().append(declaration)
+            declaration.set_parent(ASTHelper.get_internals_block_from_neuron(neuron))
         return
 
     @classmethod
@@ -913,6 +912,7 @@ class ASTHelper(object):
         if ASTHelper.get_initial_block_from_neuron(neuron) is None:
             ASTUtils.create_initial_values_block(neuron)
         ASTHelper.get_initial_block_from_neuron(neuron).get_declarations().append(declaration)
+        declaration.set_parent(ASTHelper.get_initial_block_from_neuron(neuron))
         return
 
     @classmethod
@@ -926,6 +926,7 @@ class ASTHelper(object):
         """
         assert ASTHelper.get_equations_block_from_neuron(neuron) is not None
         ASTHelper.get_equations_block_from_neuron(neuron).get_declarations().append(shape)
+        shape.set_parent(ASTHelper.get_equations_block_from_neuron(neuron))
 
     """
     The following print methods are used by the backend and represent the comments as stored at the corresponding 
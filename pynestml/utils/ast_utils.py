@@ -282,6 +282,16 @@ class ASTUtils(object):
         :return: a list of all meta_model of the specified type
         :rtype: list[ASTNode]
         """
+        from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
+        from pynestml.meta_model.ast_neuron import ASTNeuron
+        # neurons keep an index of their nodes, thus only the remaining trees have to be traversed
+        if isinstance(ast, ASTNeuron):
+            return list(ast.get_nodes_of_type(node_type))
+        if isinstance(ast, ASTNestMLCompilationUnit):
+            ret = [ast] if isinstance(ast, node_type) else list()
+            for neuron in ast.get_neuron_list():
+                ret.extend(neuron.get_nodes_of_type(node_type))
+            return ret
         from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
         ret = list()
 
@@ -379,6 +389,7 @@ class ASTUtils(object):
             internal = ASTNodeFactory.create_ast_block_with_variables(False, False, True, False, list(),
                                                                       ASTSourcePosition.get_added_source_position())
             neuron.get_body().get_body_elements().append(internal)
+            internal.set_parent(neuron.get_body())
         return neuron
 
     @classmethod
@@ -397,6 +408,7 @@ class ASTUtils(object):
             state = ASTNodeFactory.create_ast_block_with_variables(True, False, False, False, list(),
                                                                    ASTSourcePosition.get_added_source_position())
             neuron.get_body().get_body_elements().append(state)
+            state.set_parent(neuron.get_body())
         return neuron
 
     @classmethod
@@ -416,6 +428,7 @@ class ASTUtils(object):
                 create_ast_block_with_variables(False, False, False, True, list(),
                                                 ASTSourcePosition.get_added_source_position())
             neuron.get_body().get_body_elements().append(initial_values)
+            initial_values.set_parent(neuron.get_body())
         return neuron
 
     @classmethod
@@ -449,6 +462,7 @@ class ASTUtils(object):
         if ASTHelper.get_state_block_from_neuron(neuron) is None:
             ASTUtils.create_state_block(neuron)
         ASTHelper.get_state_block_from_neuron(neuron).get_declarations().append(declaration)
+        declaration.set_parent(ASTHelper.get_state_block_from_neuron(neuron))
         return
 
     @classmethod
@@ -666,15 +680,21 @@ class ASTUtils(object):
     @classmethod
     def get_parent(cls, root, child_node):
         """
-        Returns the parent of child_node. Here, the root has to be the node object, to start a traversal of the ast
-        correctly. Preferably the neuron root, i.e., ASTNeuron.
+        Returns the parent of child_node. The parent reference stored in the node is used if it is still valid,
+        otherwise, e.g., after the tree has been modified directly, the references of all nodes below the root are
+        restored first. Here, the root has to be the node object, to start a traversal of the ast correctly.
+        Preferably the neuron root, i.e., ASTNeuron.
         :param root: a single neuron instance
         :type root: ASTNode
         :param child_node: a single child node
         :type child_node: ASTNode
         :return: ASTNode
         """
-        from pynestml.visitors.ast_parent_collector_visitor import ASTParentCollectorVisitor
-        visitor = ASTParentCollectorVisitor(to_find=child_node)
-        root.accept(visitor)
-        return visitor.parent
+        parent = child_node.get_parent()
+        if parent is None or not any(child is child_node for child in parent.get_children()):
+            from pynestml.visitors.ast_parent_visitor import ASTParentVisitor
+            root.accept(ASTParentVisitor())
+            parent = child_node.get_parent()
+            if parent is None or not any(child is child_node for child in parent.get_children()):
+                return None
+        return parent
@@ -0,0 +1,138 @@
+#
+# compilation_session.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import threading
+from copy import copy
+
+
+class CompilationSession(object):
+    """
+    This class represents the state of a single compilation, i.e., the configuration, the log, the symbol table as
+    well as the registries of predefined types, units, functions and variables. The state is accessed as before
+    through the attributes of the respective classes, e.g., Logger.log, which refer to the session which is active in
+    the current thread. Sessions are activated by means of a with-statement:
+        with CompilationSession() as session:
+            ...
+    If no session is active in a thread, the default session of the process is used. Thus, several sessions can be
+    processed concurrently in different threads, while a single session must not be active in two threads at once.
+    A new session starts with the default values of all attributes, except for the registries of predefined
+    elements, which are shallow copies of those of the default session. Thereby, the predefined symbols are shared,
+    while elements registered during a compilation are only visible in the respective session.
+    Attributes:
+        default_session  The session which is used if no other session is active.
+        local            Stores the stack of active sessions for each thread.
+    """
+    default_session = None
+    local = threading.local()
+
+    def __init__(self):
+        self.__states = {}
+
+    def __enter__(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = list()
+        self.local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.local.stack.pop()
+        return False
+
+    @classmethod
+    def get_current(cls):
+        """
+        Returns the session which is active in the current thread.
+        :return: the active session
+        :rtype: CompilationSession
+        """
+        stack = getattr(cls.local, 'stack', None)
+        if stack:
+            return stack[-1]
+        return cls.default_session
+
+    def get_state(self, owner):
+        """
+        Returns the state of the handed over class in this session, and creates it if not yet available.
+        :param owner: a class decorated with session_state.
+        :type owner: type
+        :return: a dict from attribute name to value
+        :rtype: dict
+        """
+        state = self.__states.get(owner)
+        if state is None:
+            state = dict()
+            for name, default in owner.session_defaults.items():
+                if owner.session_inherit and self is not self.default_session:
+                    state[name] = copy(self.default_session.get_state(owner)[name])
+                else:
+                    state[name] = copy(default)
+            state = self.__states.setdefault(owner, state)
+        return state
+
+
+CompilationSession.default_session = CompilationSession()
+
+
+class SessionAttribute(object):
+    """
+    A descriptor which redirects the access to a class attribute to the state of the currently active session.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.owner = None
+
+    def __get__(self, cls, metaclass = None):
+        return CompilationSession.get_current().get_state(self.owner)[self.name]
+
+    def __set__(self, cls, value):
+        CompilationSession.get_current().get_state(self.owner)[self.name] = value
+
+    def __delete__(self, cls):
+        del CompilationSession.get_current().get_state(self.owner)[self.name]
+
+
+def session_state(*attributes, **kwargs):
+    """
+    Class decorator which turns the handed over class attributes into attributes which are stored separately for
+    each compilation session. The values as stated in the class body are used as default values.
+    :param attributes: the names of the attributes.
+    :type attributes: str
+    :param inherit: indicates whether new sessions shall start with copies of the values of the default session.
+    :type inherit: bool
+    :return: the decorator
+    """
+    inherit = kwargs.get('inherit', False)
+
+    def decorate(cls):
+        namespace = dict(cls.__dict__)
+        namespace.pop('__dict__', None)
+        namespace.pop('__weakref__', None)
+        defaults = dict((name, namespace.pop(name)) for name in attributes)
+        descriptors = dict((name, SessionAttribute(name)) for name in attributes)
+        # descriptors of the metaclass take precedence over the attributes of the class
+        metaclass = type(cls.__name__ + 'State', (type(cls),), descriptors)
+        decorated = metaclass(cls.__name__, cls.__bases__, namespace)
+        decorated.session_defaults = defaults
+        decorated.session_inherit = inherit
+        for descriptor in descriptors.values():
+            descriptor.owner = decorated
+        return decorated
+
+    return decorate
@@ -0,0 +1,202 @@
+#
+# fast_expression_parser.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import re
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+
+# the tokens of the subset, floats and integers are defined as in the lexer, the longer alternatives come first
+_token_pattern = re.compile(r'''
+    (?P<ws>[ \t]+)
+  | (?P<float>(?:(?:[1-9][0-9]*|0)?\.[0-9]+|(?:[1-9][0-9]*|0)\.|[1-9][0-9]*)[eE][+-]?(?:[1-9][0-9]*|0)
+             |(?:[1-9][0-9]*|0)?\.[0-9]+|(?:[1-9][0-9]*|0)\.)
+  | (?P<integer>[1-9][0-9]*|0)
+  | (?P<name>[a-zA-Z_$][a-zA-Z_0-9$]*)
+  | (?P<op>\*\*|[*/%+\-(),'])
+''', re.VERBOSE)
+
+# all keywords of the grammar, these are lexed as keywords instead of names
+_keywords = frozenset(literal[1:-1] for literal in PyNestMLLexer.literalNames[1:]) | \
+    frozenset(('true', 'True', 'false', 'False', 'end'))
+
+# binding power of the binary operators and the operand of the unary operators, higher binds tighter
+_binary_operators = {'**': 4, '*': 2, '/': 2, '%': 2, '+': 1, '-': 1}
+_arithmetic_operators = {'**': 'is_pow_op', '*': 'is_times_op', '/': 'is_div_op', '%': 'is_modulo_op',
+                         '+': 'is_plus_op', '-': 'is_minus_op'}
+_unary_operators = {'+': 'is_unary_plus', '-': 'is_unary_minus'}
+_unary_binding = 3
+
+
+class FastExpressionParser(object):
+    """
+    A hand-written parser for the arithmetic subset of the expression rule, i.e., parentheses, the arithmetic
+    operators +, -, *, /, % and **, the unary operators + and -, as well as variables, numeric literals with an
+    optional unit, inf, boolean literals and function calls. It builds the same nodes as the ASTBuilderVisitor,
+    but avoids the overhead of the ANTLR lexer and parser. For all other expressions, e.g., comparisons, logical
+    operators, comments or syntax errors, None is returned, such that the ANTLR parser can be used instead.
+    """
+
+    @classmethod
+    def parse(cls, string):
+        # type: (str) -> Union(ASTExpression,ASTSimpleExpression,None)
+        """
+        Parses the handed over expression if it is part of the supported subset.
+        :param string: a single expression
+        :type string: str
+        :return: a new expression or None if the expression is not supported
+        :rtype: ASTExpression or ASTSimpleExpression or None
+        """
+        tokens = tokenize(string)
+        if tokens is None or len(tokens) == 0:
+            return None
+        parser = _Parser(tokens)
+        try:
+            ret = parser.parse_expression(0)
+        except ValueError:
+            return None
+        # the ANTLR parser might stop before the end of the input, such cases are left to it
+        return ret if parser.position == len(tokens) else None
+
+
+def tokenize(string):
+    # type: (str) -> Union(list((str,str)),None)
+    """
+    Splits the handed over expression into tokens of the subset.
+    :param string: a single expression
+    :type string: str
+    :return: a list of tuples of kind and text, or None if the expression contains other tokens
+    :rtype: list((str,str)) or None
+    """
+    tokens = list()
+    position = 0
+    while position < len(string):
+        match = _token_pattern.match(string, position)
+        if match is None:
+            return None
+        position = match.end()
+        kind = match.lastgroup
+        if kind == 'ws':
+            continue
+        text = match.group(kind)
+        if kind == 'name' and text in _keywords:
+            if text == 'inf':
+                kind = 'inf'
+            elif text in ('true', 'True', 'false', 'False'):
+                kind = 'boolean'
+            else:
+                return None
+        tokens.append((kind, text))
+    return tokens
+
+
+class _Parser(object):
+    """
+    Parses a list of tokens by precedence climbing. A ValueError is raised on all unexpected tokens.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise ValueError('unexpected end of expression')
+        self.position += 1
+        return token
+
+    def expect(self, text):
+        if self.next() != ('op', text):
+            raise ValueError('expected %s' % text)
+
+    def parse_expression(self, binding):
+        lhs = self.parse_prefix()
+        while True:
+            kind, text = self.peek()
+            if kind != 'op' or text not in _binary_operators or _binary_operators[text] < binding:
+                return lhs
+            self.position += 1
+            # the power operator is right associative
+            rhs = self.parse_expression(_binary_operators[text] + (0 if text == '**' else 1))
+            binary_operator = ASTNodeFactory.create_ast_arithmetic_operator(
+                    source_position=_position(), **{_arithmetic_operators[text]: True})
+            lhs = ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=binary_operator, rhs=rhs,
+                                                                source_position=_position())
+
+    def parse_prefix(self):
+        kind, text = self.next()
+        if kind == 'op' and text == '(':
+            term = self.parse_expression(0)
+            self.expect(')')
+            return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=term,
+                                                        source_position=_position())
+        if kind == 'op' and text in _unary_operators:
+            unary_operator = ASTNodeFactory.create_ast_unary_operator(source_position=_position(),
+                                                                      **{_unary_operators[text]: True})
+            term = self.parse_expression(_unary_binding)
+            return ASTNodeFactory.create_ast_expression(unary_operator=unary_operator, expression=term,
+                                                        source_position=_position())
+        if kind == 'inf':
+            return ASTNodeFactory.create_ast_simple_expression(is_inf=True, source_position=_position())
+        if kind == 'boolean':
+            return ASTNodeFactory.create_ast_simple_expression(boolean_literal=text in ('true', 'True'),
+                                                               source_position=_position())
+        if kind in ('integer', 'float'):
+            numeric_literal = int(text) if kind == 'integer' else float(text)
+            # a numeric literal can be followed by a unit, e.g., 10 mV
+            variable = self.parse_variable() if self.peek()[0] == 'name' else None
+            return ASTNodeFactory.create_ast_simple_expression(numeric_literal=numeric_literal, variable=variable,
+                                                               source_position=_position())
+        if kind == 'name':
+            if self.peek() == ('op', '('):
+                return ASTNodeFactory.create_ast_simple_expression(function_call=self.parse_function_call(text),
+                                                                   source_position=_position())
+            self.position -= 1
+            return ASTNodeFactory.create_ast_simple_expression(variable=self.parse_variable(),
+                                                               source_position=_position())
+        raise ValueError('unexpected token %s' % text)
+
+    def parse_variable(self):
+        kind, name = self.next()
+        differential_order = 0
+        while self.peek() == ('op', '\''):
+            self.position += 1
+            differential_order += 1
+        return ASTNodeFactory.create_ast_variable(name=name, differential_order=differential_order,
+                                                  source_position=_position())
+
+    def parse_function_call(self, name):
+        self.expect('(')
+        args = list()
+        if self.peek() != ('op', ')'):
+            args.append(self.parse_expression(0))
+            while self.peek() == ('op', ','):
+                self.position += 1
+                args.append(self.parse_expression(0))
+        self.expect(')')
+        return ASTNodeFactory.create_ast_function_call(callee_name=name, args=args, source_position=_position())
+
+
+def _position():
+    return ASTSourceLocation.get_added_source_position()
@@ -0,0 +1,285 @@
+#
+# grammar_profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+"""
+This module represents a developer command which reports how the decisions of the grammar behave during parsing, e.g.,
+    python -m pynestml.utils.grammar_profiler models
+such that changes to PyNestML.g4 can be measured against the parse speed on a corpus of models.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from antlr4 import CommonTokenStream, FileStream, InputStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.dfa.DFA import DFA
+from antlr4.PredictionContext import PredictionContextCache
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+
+prediction_modes = OrderedDict([('ll', PredictionMode.LL), ('sll', PredictionMode.SLL),
+                                ('exact', PredictionMode.LL_EXACT_AMBIG_DETECTION)])
+
+
+class DecisionInfo(object):
+    """
+    This class stores the statistics of a single decision of the parser, i.e., a point in the grammar where the
+    parser has to predict which alternative to take by means of adaptive prediction.
+    Attributes:
+        decision                The number of the decision in the ATN.
+        rule_name               The name of the rule which contains the decision.
+        invocations             The number of predictions made for this decision.
+        time_in_prediction      The time in seconds spent in the prediction.
+        sll_total_look          The sum of the lookahead depths of all predictions in SLL mode.
+        sll_max_look            The maximal lookahead depth of a prediction in SLL mode.
+        sll_atn_transitions     The number of SLL steps which had to be computed from the ATN, i.e., DFA cache misses.
+        sll_dfa_transitions     The number of SLL steps which were taken from the DFA cache.
+        ll_fallback             The number of predictions which required a fallback to full LL mode.
+        ll_total_look           The sum of the lookahead depths of all predictions in full LL mode.
+        ll_max_look             The maximal lookahead depth of a prediction in full LL mode.
+        ll_atn_transitions      The number of steps made in full LL mode.
+        context_sensitivities   The number of predictions which could only be resolved by the full context.
+        ambiguities             The number of ambiguities detected, only reported in all cases in the exact mode.
+    """
+
+    def __init__(self, decision, rule_name):
+        self.decision = decision
+        self.rule_name = rule_name
+        self.invocations = 0
+        self.time_in_prediction = 0.0
+        self.sll_total_look = 0
+        self.sll_max_look = 0
+        self.sll_atn_transitions = 0
+        self.sll_dfa_transitions = 0
+        self.ll_fallback = 0
+        self.ll_total_look = 0
+        self.ll_max_look = 0
+        self.ll_atn_transitions = 0
+        self.context_sensitivities = 0
+        self.ambiguities = 0
+
+    def to_dict(self):
+        """
+        Returns the statistics of this decision as an ordered map from name to value.
+        :return: a map of all attributes
+        :rtype: OrderedDict
+        """
+        return OrderedDict((name, getattr(self, name)) for name in (
+            'decision', 'rule_name', 'invocations', 'time_in_prediction', 'sll_total_look', 'sll_max_look',
+            'sll_atn_transitions', 'sll_dfa_transitions', 'll_fallback', 'll_total_look', 'll_max_look',
+            'll_atn_transitions', 'context_sensitivities', 'ambiguities'))
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """
+    The Python runtime of ANTLR does not provide the profiling of the Java runtime (Parser.setProfile), thus this
+    simulator collects the same statistics by hooking into the adaptive prediction of the parser.
+    """
+
+    def __init__(self, parser, decision_infos, decision_to_dfa, shared_context_cache):
+        super(ProfilingATNSimulator, self).__init__(parser, parser.atn, decision_to_dfa, shared_context_cache)
+        self.decision_infos = decision_infos
+        self.current_decision = None
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+
+    def adaptivePredict(self, input, decision, outerContext):
+        # predicates can trigger nested predictions, thus the state of the current one is restored afterwards
+        outer_state = (self.current_decision, self.sll_stop_index, self.ll_stop_index)
+        self.current_decision = self.decision_infos[decision]
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+        start_index = input.index
+        start = time.perf_counter()
+        try:
+            return super(ProfilingATNSimulator, self).adaptivePredict(input, decision, outerContext)
+        finally:
+            info = self.current_decision
+            info.time_in_prediction += time.perf_counter() - start
+            info.invocations += 1
+            if self.sll_stop_index >= 0:
+                look = self.sll_stop_index - start_index + 1
+                info.sll_total_look += look
+                info.sll_max_look = max(info.sll_max_look, look)
+            if self.ll_stop_index >= 0:
+                look = self.ll_stop_index - start_index + 1
+                info.ll_total_look += look
+                info.ll_max_look = max(info.ll_max_look, look)
+            self.current_decision, self.sll_stop_index, self.ll_stop_index = outer_state
+
+    def getExistingTargetState(self, previousD, t):
+        self.sll_stop_index = self._input.index
+        existing = super(ProfilingATNSimulator, self).getExistingTargetState(previousD, t)
+        if existing is not None:
+            self.current_decision.sll_dfa_transitions += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self.ll_stop_index = self._input.index
+            self.current_decision.ll_atn_transitions += 1
+        else:
+            self.current_decision.sll_atn_transitions += 1
+        return super(ProfilingATNSimulator, self).computeReachSet(closure, t, fullCtx)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        self.current_decision.ll_fallback += 1
+        super(ProfilingATNSimulator, self).reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex,
+                                                                       stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self.current_decision.context_sensitivities += 1
+        super(ProfilingATNSimulator, self).reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.current_decision.ambiguities += 1
+        super(ProfilingATNSimulator, self).reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+class GrammarProfiler(object):
+    """
+    This class parses models with a profiling parser and collects the statistics of all decisions. All models
+    parsed by a single profiler share a DFA cache of their own, thus the results do not depend on models parsed
+    before in the same process, and the cache of the toolchain is not affected.
+    Attributes:
+        prediction_mode  The prediction mode of the parser, i.e., LL, SLL or LL with exact ambiguity detection.
+        decision_infos   The list of statistics, one for each decision of the grammar.
+        parse_time       The total time in seconds spent by the parser.
+        syntax_errors    The number of syntax errors reported by the parser.
+    """
+
+    def __init__(self, prediction_mode = PredictionMode.LL):
+        self.prediction_mode = prediction_mode
+        atn = PyNestMLParser.atn
+        self.decision_infos = [DecisionInfo(decision, PyNestMLParser.ruleNames[state.ruleIndex])
+                               for decision, state in enumerate(atn.decisionToState)]
+        self.decision_to_dfa = [DFA(state, decision) for decision, state in enumerate(atn.decisionToState)]
+        self.shared_context_cache = PredictionContextCache()
+        self.parse_time = 0.0
+        self.syntax_errors = 0
+
+    def profile_model(self, model, from_string = False):
+        """
+        Parses the handed over model by the profiling parser and adds the statistics of its decisions.
+        :param model: the path to the model file or the model itself.
+        :type model: str
+        :param from_string: indicates whether the model is handed over as a string.
+        :type from_string: bool
+        """
+        lexer = PyNestMLLexer(InputStream(model) if from_string else FileStream(model))
+        lexer.removeErrorListeners()
+        stream = CommonTokenStream(lexer)
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        parser.removeErrorListeners()
+        parser._interp = ProfilingATNSimulator(parser, self.decision_infos, self.decision_to_dfa,
+                                               self.shared_context_cache)
+        parser._interp.predictionMode = self.prediction_mode
+        start = time.perf_counter()
+        parser.nestMLCompilationUnit()
+        self.parse_time += time.perf_counter() - start
+        self.syntax_errors += parser.getNumberOfSyntaxErrors()
+
+    def get_decision_infos(self):
+        """
+        Returns the statistics of all decisions which have been invoked, the most expensive one first.
+        :return: a list of decision statistics
+        :rtype: list(DecisionInfo)
+        """
+        return sorted((info for info in self.decision_infos if info.invocations > 0),
+                      key=lambda info: info.time_in_prediction, reverse=True)
+
+    def get_json_format(self):
+        """
+        Returns the collected statistics in a format which can be stored to a file.
+        :return: a str containing the report
+        :rtype: str
+        """
+        return json.dumps(OrderedDict([('parse_time', self.parse_time), ('syntax_errors', self.syntax_errors),
+                                       ('decisions', [info.to_dict() for info in self.get_decision_infos()])]),
+                          indent=2)
+
+    def get_table_format(self):
+        """
+        Returns the collected statistics as a table which can be printed to the console.
+        :return: a str containing the report
+        :rtype: str
+        """
+        header = ('rule', 'decision', 'invocations', 'time [ms]', 'SLL look', 'SLL max', 'SLL ATN', 'LL fallback',
+                  'LL look', 'LL max', 'LL ATN', 'ctx sensitive', 'ambiguities')
+        rows = [header]
+        for info in self.get_decision_infos():
+            rows.append((info.rule_name, str(info.decision), str(info.invocations),
+                         '%.2f' % (info.time_in_prediction * 1000), str(info.sll_total_look), str(info.sll_max_look),
+                         str(info.sll_atn_transitions), str(info.ll_fallback), str(info.ll_total_look),
+                         str(info.ll_max_look), str(info.ll_atn_transitions), str(info.context_sensitivities),
+                         str(info.ambiguities)))
+        widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+        lines = ['  '.join(cell.ljust(width) if column == 0 else cell.rjust(width)
+                           for column, (cell, width) in enumerate(zip(row, widths))) for row in rows]
+        lines.append('Total parse time: %.2f ms, syntax errors: %d' % (self.parse_time * 1000, self.syntax_errors))
+        return '\n'.join(lines)
+
+
+def collect_models(paths):
+    """
+    Returns all model files contained in the handed over files and directories.
+    :param paths: a list of paths to model files or directories.
+    :type paths: list(str)
+    :return: a sorted list of model files
+    :rtype: list(str)
+    """
+    models = list()
+    for path in paths:
+        if os.path.isdir(path):
+            models.extend(sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.nestml')))
+        else:
+            models.append(path)
+    return models
+
+
+def main(args):
+    argument_parser = argparse.ArgumentParser(
+            description='Parses NESTML models with a profiling parser and reports for each decision of the grammar '
+                        'the number of invocations, the lookahead depth, the fallbacks to full LL prediction and '
+                        'the ambiguities.')
+    argument_parser.add_argument('paths', nargs='+', help='Model files or directories containing models.')
+    argument_parser.add_argument('-mode', choices=list(prediction_modes.keys()), default='ll',
+                                 help='The prediction mode of the parser, "exact" reports all ambiguities.')
+    argument_parser.add_argument('-json', action='store_true', help='Prints the report in the JSON format.')
+    argument_parser.add_argument('-output', type=str, help='Stores the report in the handed over file.')
+    parsed_args = argument_parser.parse_args(args)
+    profiler = GrammarProfiler(prediction_modes[parsed_args.mode])
+    for model in collect_models(parsed_args.paths):
+        profiler.profile_model(model)
+    report = profiler.get_json_format() if parsed_args.json else profiler.get_table_format()
+    if parsed_args.output is not None:
+        with open(parsed_args.output, 'w') as output:
+            output.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
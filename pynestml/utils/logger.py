@@ -22,7 +22,10 @@ from collections import OrderedDict
 
 from enum import Enum
 
+from pynestml.utils.compilation_session import session_state
 
+
+@session_state('log', 'curr_message', 'logging_level', 'current_neuron', 'no_print', 'neuron_messages')
 class Logger(object):
     """
     This class represents a logger which can be used to print messages to the screen depending on the logging 
@@ -40,12 +43,14 @@ class Logger(object):
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_neuron The currently processed model. This enables to retrieve all messages belonging to a certain model
+        neuron_messages Map from the id of each neuron referenced by the log to the numbers of its messages.
     """
     log = {}
     curr_message = None
     logging_level = None
     current_neuron = None
     no_print = False
+    neuron_messages = {}
 
     @classmethod
     def init_logger(cls, logging_level):
@@ -57,6 +62,7 @@ class Logger(object):
         cls.logging_level = logging_level
         cls.curr_message = 0
         cls.log = {}
+        cls.neuron_messages = {}
         return
 
     @classmethod
@@ -77,6 +83,38 @@ class Logger(object):
         """
         cls.log = log
         cls.curr_message = counter
+        cls.neuron_messages = {}
+        for message_nr in sorted(log.keys()):
+            if log[message_nr][1] is not None:
+                cls.neuron_messages.setdefault(id(log[message_nr][1]), list()).append(message_nr)
+
+    @classmethod
+    def checkpoint(cls):
+        """
+        Returns a checkpoint of the log, i.e., the number of the next message, such that all messages logged
+        afterwards can be discarded by means of rollback.
+        :return: a checkpoint
+        :rtype: int
+        """
+        if cls.curr_message is None:
+            cls.init_logger(LoggingLevel.INFO)
+        return cls.curr_message
+
+    @classmethod
+    def rollback(cls, checkpoint):
+        """
+        Discards all messages which have been logged after the handed over checkpoint. In contrast to storing and
+        restoring a copy of the log, this does not copy the neurons referenced by the messages.
+        :param checkpoint: a checkpoint as returned by checkpoint
+        :type checkpoint: int
+        """
+        for message_nr in range(checkpoint, cls.curr_message):
+            entry = cls.log.pop(message_nr, None)
+            if entry is not None and entry[1] is not None:
+                messages = cls.neuron_messages.get(id(entry[1]))
+                if messages and messages[-1] == message_nr:
+                    messages.pop()
+        cls.curr_message = checkpoint
 
     @classmethod
     def log_message(cls, neuron = None, code = None, message = None, error_position = None, log_level = None):
@@ -111,6 +149,8 @@ class Logger(object):
         else:
             cls.log[cls.curr_message] = ('GLOBAL', cls.current_neuron,
                                          log_level, code, error_position, message)
+        if cls.log[cls.curr_message][1] is not None:
+            cls.neuron_messages.setdefault(id(cls.log[cls.curr_message][1]), list()).append(cls.curr_message)
         cls.curr_message += 1
         if cls.no_print:
             return
@@ -166,6 +206,29 @@ class Logger(object):
         """
         cls.current_neuron = neuron
 
+    @classmethod
+    def replace_neuron(cls, neuron, replacement):
+        """
+        Replaces all references to the handed over neuron in the log, e.g., by a lightweight copy, such that the
+        neuron can be released after it has been processed.
+        :param neuron: a single neuron instance
+        :type neuron: ASTNeuron
+        :param replacement: the neuron which replaces the handed over one
+        :type replacement: ASTNeuron
+        """
+        # only the messages of the neuron are visited, not the whole log
+        replaced = list()
+        for message_nr in cls.neuron_messages.pop(id(neuron), list()):
+            entry = cls.log.get(message_nr)
+            if entry is not None and entry[1] is neuron:
+                (artifact_name, neuron_i, log_level, code, error_position, message) = entry
+                cls.log[message_nr] = (artifact_name, replacement, log_level, code, error_position, message)
+                replaced.append(message_nr)
+        if len(replaced) > 0:
+            cls.neuron_messages.setdefault(id(replacement), list()).extend(replaced)
+        if cls.current_neuron is neuron:
+            cls.current_neuron = replacement
+
     @classmethod
     def get_all_messages_of_level_and_or_neuron(cls, neuron, level):
         """
@@ -234,6 +297,21 @@ class Logger(object):
         """
         return len(cls.get_all_messages_of_level_and_or_neuron(neuron, LoggingLevel.ERROR)) > 0
 
+    @classmethod
+    def get_log_records(cls):
+        """
+        Returns the log as a list of records which do not reference any AST nodes, thus can be handed over
+        between processes. The structure of a record is: (ARTIFACT,NEURON_NAME,LEVEL,CODE,POSITION,MESSAGE)
+        :return: a list of records ordered by the message number.
+        :rtype: list(str,str,LoggingLevel,MessageCode,ASTSourceLocation,str)
+        """
+        ret = list()
+        for message_nr in sorted(cls.log.keys()):
+            (artifact_name, neuron, log_level, code, error_position, message) = cls.log[message_nr]
+            ret.append((artifact_name, neuron.get_name() if neuron is not None else None, log_level, code,
+                        error_position, message))
+        return ret
+
     @classmethod
     def get_json_format(cls):
         """
@@ -17,6 +17,8 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+
 from enum import Enum
 
 
@@ -309,6 +311,77 @@ class Messages(object):
         message = 'Dry mode selected with -dry parameter, no models generated!'
         return MessageCode.DRY_RUN, message
 
+    @classmethod
+    def get_neuron_up_to_date(cls, neuron_name):
+        """
+        Returns a message indicating that the generated code of a neuron is up to date and not regenerated.
+        :param neuron_name: the name of the neuron.
+        :type neuron_name: str
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (neuron_name is not None and isinstance(neuron_name, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(neuron_name)
+        message = 'Generated code of neuron \'' + neuron_name + '\' is up to date, generation skipped!'
+        return MessageCode.NEURON_UP_TO_DATE, message
+
+    @classmethod
+    def get_module_up_to_date(cls, path):
+        """
+        Returns a message indicating that the generated module code is up to date and not regenerated.
+        :param path: the path to the generated module
+        :type path: str
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (path is not None and isinstance(path, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(path)
+        message = 'NEST module code in \'' + path + '\' is up to date, generation skipped!'
+        return MessageCode.MODULE_UP_TO_DATE, message
+
+    @classmethod
+    def get_models_changed(cls, modified, removed):
+        """
+        Returns a message indicating that model files have been modified or removed and are recompiled.
+        :param modified: the paths to all modified or added files
+        :type modified: list(str)
+        :param removed: the paths to all removed files
+        :type removed: list(str)
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (modified is not None and isinstance(modified, list)), \
+            '(PyNestML.Utils.Message) Not a list provided (%s)!' % type(modified)
+        assert (removed is not None and isinstance(removed, list)), \
+            '(PyNestML.Utils.Message) Not a list provided (%s)!' % type(removed)
+        message = 'Models changed (modified: %s, removed: %s), recompiling!' % (
+            ', '.join(os.path.basename(path) for path in modified) if len(modified) > 0 else '-',
+            ', '.join(os.path.basename(path) for path in removed) if len(removed) > 0 else '-')
+        return MessageCode.MODELS_CHANGED, message
+
+    @classmethod
+    def get_analysis_timeout(cls, neuron_name, phase, budget, fallback):
+        """
+        Returns a message indicating that the symbolic analysis of a neuron has been cancelled since it exceeded its
+        time budget.
+        :param neuron_name: the name of the neuron
+        :type neuron_name: str
+        :param phase: the name of the cancelled phase
+        :type phase: str
+        :param budget: the time budget in seconds
+        :type budget: float
+        :param fallback: indicates whether the neuron is solved numerically instead, otherwise it is not generated.
+        :type fallback: bool
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (neuron_name is not None and isinstance(neuron_name, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(neuron_name)
+        message = 'Symbolic analysis \'%s\' of neuron \'%s\' exceeded its time budget of %g s and has been ' \
+                  'cancelled, ' % (phase, neuron_name, budget)
+        message += 'falling back to the numeric solver (GSL)!' if fallback else 'neuron is not generated!'
+        return MessageCode.ANALYSIS_TIMEOUT, message
+
     @classmethod
     def get_variable_used_before_declaration(cls, variable_name):
         """
@@ -1322,3 +1395,7 @@ class MessageCode(Enum):
     SAT_CHECK_NOT_POSSIBLE = 64
     VOID_FUNCTION_IN_EXPR = 65
     CONDITION_NOT_BOOL = 66
+    NEURON_UP_TO_DATE = 67
+    MODULE_UP_TO_DATE = 68
+    MODELS_CHANGED = 69
+    ANALYSIS_TIMEOUT = 70
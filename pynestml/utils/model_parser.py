@@ -17,9 +17,14 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-import copy
+import os
+import threading
+from collections import OrderedDict
 
 from antlr4 import *
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 
 from pynestml.frontend.nestml_error_listener import NestMLErrorListener
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
@@ -66,10 +71,14 @@ from pynestml.meta_model.ast_update_block import ASTUpdateBlock
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.ast_cache import ASTCache
 from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.fast_expression_parser import FastExpressionParser
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
@@ -80,13 +89,16 @@ class ModelParser(object):
     """
 
     @classmethod
-    def parse_model(cls, model = None, from_string = False):
+    def parse_model(cls, model = None, from_string = False, collect_comments = True):
         """
         Parses a handed over model and returns the meta_model representation of it.
         :param model: the path to the file which shall be parsed.
         :type model: str
         :param from_string: indicates whether the model shall be parsed from string directly
         :type from_string: bool
+        :param collect_comments: indicates whether comments shall be attached to the nodes, e.g., not required
+                                 for dry runs. Models parsed without comments are not stored in the AST cache.
+        :type collect_comments: bool
         :return: a new ASTNESTMLCompilationUnit object.
         :rtype: ASTNestMLCompilationUnit
         """
@@ -101,23 +113,47 @@ class ModelParser(object):
         code, message = Messages.get_start_processing_file(model if isinstance(model, FileStream)
                                                            else 'model from string')
         Logger.log_message(neuron=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
-        # create a lexer and hand over the input
-        lexer = PyNestMLLexer(input_file)
-        set_up_lexer_error_reporting(lexer)
-        # create a token stream
-        stream = CommonTokenStream(lexer)
-        stream.fill()
-        # parse the file
-        parser = PyNestMLParser(stream)
-        set_up_parser_error_reporting(parser)
-        compilation_unit = parser.nestMLCompilationUnit()
-        # create a new visitor and return the new AST
-        ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
-        ast = ast_builder_visitor.visit(compilation_unit)
+        unit = 'model from string' if from_string else os.path.basename(model)
+        ast = None
+        cache_key = None
+        if not from_string and ASTCache.is_enabled():
+            with Profiler.measure('ast_cache', unit):
+                cache_key = ASTCache.compute_key(model)
+                ast = ASTCache.load(cache_key)
+        if ast is not None:
+            with Profiler.measure('ast_cache', unit):
+                # the builder registers all units used in data types and sets the last neuron as the current one
+                for data_type in ASTUtils.get_all(ast, ASTDataType):
+                    data_type.accept(ASTDataTypeVisitor())
+                for neuron in ast.get_neuron_list():
+                    Logger.set_current_neuron(neuron)
+        else:
+            first_message = Logger.curr_message
+            with Profiler.measure('lexing', unit):
+                # create a lexer and hand over the input
+                lexer = PyNestMLLexer(input_file)
+                set_up_lexer_error_reporting(lexer)
+                # create a token stream
+                stream = CommonTokenStream(lexer)
+                stream.fill()
+            with Profiler.measure('parsing', unit):
+                # parse the file
+                parser = PyNestMLParser(stream)
+                set_up_parser_error_reporting(parser)
+                compilation_unit = parse_rule(parser, parser.nestMLCompilationUnit)
+            with Profiler.measure('ast_building', unit):
+                # create a new visitor and return the new AST
+                ast_builder_visitor = ASTBuilderVisitor(stream.tokens, collect_comments)
+                ast = ast_builder_visitor.visit(compilation_unit)
+            # only models without warnings and errors are cached, since these messages would be lost otherwise
+            if cache_key is not None and collect_comments and \
+                    all(Logger.get_log()[message_nr][2] == LoggingLevel.INFO
+                        for message_nr in range(first_message, Logger.curr_message)):
+                with Profiler.measure('ast_cache', unit):
+                    ASTCache.store(cache_key, ast)
         # create and update the corresponding symbol tables
         SymbolTable.initialize_symbol_table(ast.get_source_position())
-        log_to_restore = copy.deepcopy(Logger.get_log())
-        counter = Logger.curr_message
+        checkpoint = Logger.checkpoint()
         # replace all derived variables through a computer processable names: e.g. g_in''' -> g_in__ddd
         restore_differential_order = []
         for ode in ASTUtils.get_all(ast, ASTOdeEquation):
@@ -141,344 +177,425 @@ class ModelParser(object):
         # now also equations have no ' at lhs. replace every occurrence of last d to ' to compensate
         for ode_variable in restore_differential_order:
             ode_variable.differential_order = 1
-        Logger.set_log(log_to_restore, counter)
+        Logger.rollback(checkpoint)
         for neuron in ast.get_neuron_list():
-            neuron.accept(ASTSymbolTableVisitor())
+            with Profiler.measure('symbol_table_and_cocos', neuron.get_name()):
+                neuron.accept(ASTSymbolTableVisitor())
             SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
         return ast
 
+    @classmethod
+    def parse_neuron_names(cls, model):
+        """
+        Returns the names of all neurons declared in the handed over model. Only the lexer is executed, such that
+        the names of all neurons can be collected up front without keeping the models in memory.
+        :param model: the path to the file which shall be scanned.
+        :type model: str
+        :return: a list of neuron names in the order of declaration.
+        :rtype: list(str)
+        """
+        try:
+            input_file = FileStream(model)
+        except IOError:
+            return list()
+        with Profiler.measure('name_index', os.path.basename(model)):
+            lexer = PyNestMLLexer(input_file)
+            # errors are reported as soon as the model is parsed
+            lexer.removeErrorListeners()
+            tokens = [token for token in lexer.getAllTokens() if token.channel == Token.DEFAULT_CHANNEL]
+        ret = list()
+        for index in range(len(tokens) - 1):
+            if tokens[index].text == 'neuron' and tokens[index + 1].type == PyNestMLLexer.NAME:
+                ret.append(tokens[index + 1].text)
+        return ret
+
     @classmethod
     def parse_expression(cls, string):
         # type: (str) -> ASTExpression
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.expression())
+        # simple arithmetic expressions are parsed by hand, all others by ANTLR
+        ret = FastExpressionParser.parse(string)
+        if ret is None:
+            ret = FragmentParser.parse(string, 'expression')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_declaration(cls, string):
         # type: (str) -> ASTDeclaration
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.declaration())
+        ret = FragmentParser.parse(string, 'declaration')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_stmt(cls, string):
         # type: (str) -> ASTStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmt())
+        ret = FragmentParser.parse(string, 'stmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_assignment(cls, string):
         # type: (str) -> ASTAssignment
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.assignment())
+        ret = FragmentParser.parse(string, 'assignment')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_bit_operator(cls, string):
         # type: (str) -> ASTArithmeticOperator
-        builder, parser = tokenize(string)
-        ret = builder.visit(parser.bitOperator())
+        ret = FragmentParser.parse(string, 'bitOperator')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_block(cls, string):
         # type: (str) -> ASTBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.block())
+        ret = FragmentParser.parse(string, 'block')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_block_with_variables(cls, string):
         # type: (str) -> ASTBlockWithVariables
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.blockWithVariables())
+        ret = FragmentParser.parse(string, 'blockWithVariables')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_body(cls, string):
         # type: (str) -> ASTBody
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.body())
+        ret = FragmentParser.parse(string, 'body')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_comparison_operator(cls, string):
         # type: (str) -> ASTComparisonOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.comparisonOperator())
+        ret = FragmentParser.parse(string, 'comparisonOperator')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_compound_stmt(cls, string):
         # type: (str) -> ASTCompoundStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.compoundStmt())
+        ret = FragmentParser.parse(string, 'compoundStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_data_type(cls, string):
         # type: (str) -> ASTDataType
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.dataType())
+        ret = FragmentParser.parse(string, 'dataType')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_elif_clause(cls, string):
         # type: (str) -> ASTElifClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elifClause())
+        ret = FragmentParser.parse(string, 'elifClause')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_else_clause(cls, string):
         # type: (str) -> ASTElseClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elseClause())
+        ret = FragmentParser.parse(string, 'elseClause')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_equations_block(cls, string):
         # type: (str) -> ASTEquationsBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.equationsBlock())
+        ret = FragmentParser.parse(string, 'equationsBlock')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_for_stmt(cls, string):
         # type: (str) -> ASTForStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.forStmt())
+        ret = FragmentParser.parse(string, 'forStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_function(cls, string):
         # type: (str) -> ASTFunction
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.function())
+        ret = FragmentParser.parse(string, 'function')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_function_call(cls, string):
         # type: (str) -> ASTFunctionCall
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.functionCall())
+        ret = FragmentParser.parse(string, 'functionCall')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_if_clause(cls, string):
         # type: (str) -> ASTIfClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifClause())
+        ret = FragmentParser.parse(string, 'ifClause')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_if_stmt(cls, string):
         # type: (str) -> ASTIfStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifStmt())
+        ret = FragmentParser.parse(string, 'ifStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_input_block(cls, string):
         # type: (str) -> ASTInputBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputBlock())
+        ret = FragmentParser.parse(string, 'inputBlock')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_input_line(cls, string):
         # type: (str) -> ASTInputLine
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputLine())
+        ret = FragmentParser.parse(string, 'inputLine')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_input_type(cls, string):
         # type: (str) -> ASTInputType
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputType())
+        ret = FragmentParser.parse(string, 'inputType')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_logic_operator(cls, string):
         # type: (str) -> ASTLogicalOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.logicalOperator())
+        ret = FragmentParser.parse(string, 'logicalOperator')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_nestml_compilation_unit(cls, string):
         # type: (str) -> ASTNestMLCompilationUnit
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.nestMLCompilationUnit())
+        ret = FragmentParser.parse(string, 'nestMLCompilationUnit')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_neuron(cls, string):
         # type: (str) -> ASTNeuron
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.neuron())
+        ret = FragmentParser.parse(string, 'neuron')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_ode_equation(cls, string):
         # type: (str) -> ASTOdeEquation
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeEquation())
+        ret = FragmentParser.parse(string, 'odeEquation')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_ode_function(cls, string):
         # type: (str) -> ASTOdeFunction
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeFunction())
+        ret = FragmentParser.parse(string, 'odeFunction')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_ode_shape(cls, string):
         # type: (str) -> ASTOdeShape
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeShape())
+        ret = FragmentParser.parse(string, 'odeShape')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_output_block(cls, string):
         # type: (str) -> ASTOutputBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.outputBlock())
+        ret = FragmentParser.parse(string, 'outputBlock')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_parameter(cls, string):
         # type: (str) -> ASTParameter
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.parameter())
+        ret = FragmentParser.parse(string, 'parameter')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_return_stmt(cls, string):
         # type: (str) -> ASTReturnStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.returnStmt())
+        ret = FragmentParser.parse(string, 'returnStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_simple_expression(cls, string):
         # type: (str) -> ASTSimpleExpression
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.simpleExpression())
+        ret = FragmentParser.parse(string, 'simpleExpression')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_small_stmt(cls, string):
         # type: (str) -> ASTSmallStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.smallStmt())
+        ret = FragmentParser.parse(string, 'smallStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_unary_operator(cls, string):
         # type: (str) -> ASTUnaryOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unaryOperator())
+        ret = FragmentParser.parse(string, 'unaryOperator')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_unit_type(cls, string):
         # type: (str) -> ASTUnitType
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unitType())
+        ret = FragmentParser.parse(string, 'unitType')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_update_block(cls, string):
         # type: (str) -> ASTUpdateBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.updateBlock())
+        ret = FragmentParser.parse(string, 'updateBlock')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_variable(cls, string):
         # type: (str) -> ASTVariable
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.variable())
+        ret = FragmentParser.parse(string, 'variable')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_while_stmt(cls, string):
         # type: (str) -> ASTWhileStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.whileStmt())
+        ret = FragmentParser.parse(string, 'whileStmt')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_constraint(cls, string):
         # type: (str) -> ASTConstraint
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.constraint())
+        ret = FragmentParser.parse(string, 'constraint')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_constraint_block(cls, string):
         # type: (str) -> ASTConstraintsBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.constraintsBlock())
+        ret = FragmentParser.parse(string, 'constraintsBlock')
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
 
-def tokenize(string):
-    # type: (str) -> (ASTBuilderVisitor,PyNestMLParser)
-    lexer = PyNestMLLexer(InputStream(string))
-    set_up_lexer_error_reporting(lexer)
-    # create a token stream
-    stream = CommonTokenStream(lexer)
-    stream.fill()
-    parser = PyNestMLParser(stream)
-    set_up_parser_error_reporting(parser)
-    builder = ASTBuilderVisitor(stream.tokens)
-    return builder, parser
+class FragmentParser(object):
+    """
+    This class parses fragments of models, e.g., expressions or declarations as created during the transformation of
+    neurons. Instead of creating a new lexer, token stream and parser for each fragment, a single instance of each is
+    kept per thread and reset to the new input, while the ATN and DFA caches are shared by all parsers anyway.
+    Additionally, the parse trees of fragments which have been parsed without errors are memorized, such that
+    recurring fragments only have to be built again, which creates new AST nodes each time. The parse trees are only
+    read by the AST builder, thus the memo is shared by all sessions and threads and only its updates are locked.
+    Attributes:
+        local      Stores the lexer, token stream and parser of each thread.
+        memo       Map from rule and fragment to the parse tree and the tokens of the fragment.
+        memo_lock  Guards the memo against concurrent modifications.
+        memo_size  The maximal number of memorized parse trees.
+    """
+    local = threading.local()
+    memo = OrderedDict()
+    memo_lock = threading.Lock()
+    memo_size = 4096
+
+    @classmethod
+    def parse(cls, string, rule_name):
+        # type: (str,str) -> ASTNode
+        """
+        Parses the handed over fragment by the handed over rule and returns the corresponding AST.
+        :param string: a fragment of a model
+        :type string: str
+        :param rule_name: the name of the rule of the parser, e.g., expression
+        :type rule_name: str
+        :return: a new AST
+        :rtype: ASTNode
+        """
+        key = (rule_name, string)
+        with cls.memo_lock:
+            entry = cls.memo.get(key)
+        if entry is None:
+            first_message = Logger.curr_message
+            parser = cls.get_parser(string)
+            tree = parse_rule(parser, getattr(parser, rule_name))
+            entry = (tree, parser.getTokenStream().tokens)
+            # fragments with syntax errors are not memorized, such that the errors are reported each time
+            if first_message is not None and Logger.curr_message == first_message:
+                with cls.memo_lock:
+                    cls.memo[key] = entry
+                    if len(cls.memo) > cls.memo_size:
+                        cls.memo.popitem(last=False)
+        (tree, tokens) = entry
+        return ASTBuilderVisitor(tokens).visit(tree)
+
+    @classmethod
+    def get_parser(cls, string):
+        # type: (str) -> PyNestMLParser
+        """
+        Returns the parser of the current thread with a filled token stream of the handed over fragment.
+        :param string: a fragment of a model
+        :type string: str
+        :return: the parser of the current thread
+        :rtype: PyNestMLParser
+        """
+        parser = getattr(cls.local, 'parser', None)
+        if parser is None:
+            lexer = PyNestMLLexer(InputStream(string))
+            set_up_lexer_error_reporting(lexer)
+            parser = PyNestMLParser(CommonTokenStream(lexer))
+            set_up_parser_error_reporting(parser)
+            cls.local.parser = parser
+        stream = parser.getTokenStream()
+        stream.tokenSource.inputStream = InputStream(string)
+        stream.setTokenSource(stream.tokenSource)
+        stream.fill()
+        parser.setTokenStream(stream)
+        return parser
+
+
+def parse_rule(parser, rule):
+    # type: (PyNestMLParser,function) -> ParserRuleContext
+    """
+    Parses the input of the handed over parser by the handed over rule in two stages: first, the much cheaper SLL
+    prediction mode is used, which stops at the first syntax error without reporting it. Only if this stage fails,
+    the input is parsed again in full LL mode, which reports all syntax errors to the registered error listeners.
+    For valid input, the second stage is therefore usually not required.
+    :param parser: a parser with a filled token stream.
+    :type parser: PyNestMLParser
+    :param rule: the rule of the parser which shall be invoked, e.g., parser.expression
+    :type rule: function
+    :return: the parse tree
+    :rtype: ParserRuleContext
+    """
+    listeners = parser._listeners
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        tree = rule()
+    except ParseCancellationException:
+        tree = None
+    # restore the default configuration of the parser
+    parser._listeners = listeners
+    parser._errHandler = DefaultErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.LL
+    if tree is None:
+        parser.reset()
+        tree = rule()
+    return tree
 
 
 def log_set_added_source_position(node):
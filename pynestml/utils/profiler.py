@@ -0,0 +1,154 @@
+#
+# profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from pynestml.utils.compilation_session import session_state
+
+
+@session_state('enabled', 'profile_neurons', 'records')
+class Profiler(object):
+    """
+    This class collects the wall-clock and CPU time spent in the individual phases of the toolchain, e.g., parsing
+    or template rendering, separately for each processed unit, i.e., each file or neuron. Phases can be nested, in
+    which case the time of the inner phase is also contained in the time of the outer one.
+    Attributes:
+        enabled          Indicates whether timings shall be collected.
+        profile_neurons  Indicates whether a cProfile statistics file shall be stored for each processed neuron.
+        records          Map from unit to phase to the accumulated wall-clock time, CPU time and number of calls.
+    """
+    enabled = False
+    profile_neurons = False
+    records = OrderedDict()
+
+    @classmethod
+    def init_profiler(cls, enabled, profile_neurons = False):
+        """
+        Initializes the profiler.
+        :param enabled: indicates whether timings shall be collected.
+        :type enabled: bool
+        :param profile_neurons: indicates whether a cProfile statistics file shall be stored for each neuron.
+        :type profile_neurons: bool
+        """
+        cls.enabled = enabled
+        cls.profile_neurons = enabled and profile_neurons
+        cls.records = OrderedDict()
+
+    @classmethod
+    @contextmanager
+    def measure(cls, phase, unit):
+        """
+        Measures the time spent in the enclosed block and adds it to the handed over phase and unit.
+        :param phase: the name of the phase, e.g., parsing
+        :type phase: str
+        :param unit: the name of the processed file or neuron
+        :type unit: str
+        """
+        if not cls.enabled:
+            yield
+            return
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            cls.add_record(unit, phase, time.perf_counter() - wall_start, time.process_time() - cpu_start, 1)
+
+    @classmethod
+    @contextmanager
+    def profile_neuron(cls, neuron_name, output_sink):
+        """
+        Profiles the enclosed block with cProfile and stores the statistics as report <neuron_name>.pstats in the
+        handed over output sink, if profiling of neurons has been selected.
+        :param neuron_name: the name of the processed neuron
+        :type neuron_name: str
+        :param output_sink: the sink to which the statistics shall be written.
+        :type output_sink: OutputSink
+        """
+        if not cls.profile_neurons:
+            yield
+            return
+        import cProfile
+        import marshal
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            # the same format as written by dump_stats, thus readable by pstats
+            profile.create_stats()
+            output_sink.write_report(neuron_name + '.pstats', marshal.dumps(profile.stats))
+
+    @classmethod
+    def add_record(cls, unit, phase, wall, cpu, count):
+        """
+        Adds a measurement to the records.
+        :param unit: the name of the processed file or neuron
+        :type unit: str
+        :param phase: the name of the phase
+        :type phase: str
+        :param wall: the wall-clock time in seconds
+        :type wall: float
+        :param cpu: the CPU time in seconds
+        :type cpu: float
+        :param count: the number of measurements
+        :type count: int
+        """
+        if unit not in cls.records:
+            cls.records[unit] = OrderedDict()
+        if phase not in cls.records[unit]:
+            cls.records[unit][phase] = [0.0, 0.0, 0]
+        record = cls.records[unit][phase]
+        record[0] += wall
+        record[1] += cpu
+        record[2] += count
+
+    @classmethod
+    def get_records(cls):
+        """
+        Returns all records as a list of tuples, which can be handed over between processes.
+        :return: a list of records in the form (UNIT,PHASE,WALL,CPU,COUNT)
+        :rtype: list((str,str,float,float,int))
+        """
+        return [(unit, phase, wall, cpu, count) for unit, phases in cls.records.items()
+                for phase, (wall, cpu, count) in phases.items()]
+
+    @classmethod
+    def get_json_format(cls):
+        """
+        Returns the collected timings per unit as well as the totals per phase in a format which can be stored to a
+        file.
+        :return: a str containing the report
+        :rtype: str
+        """
+        units = OrderedDict()
+        total = OrderedDict()
+        for unit, phase, wall, cpu, count in cls.get_records():
+            units.setdefault(unit, OrderedDict())[phase] = OrderedDict([('wall', wall), ('cpu', cpu),
+                                                                        ('count', count)])
+            if phase not in total:
+                total[phase] = OrderedDict([('wall', 0.0), ('cpu', 0.0), ('count', 0)])
+            total[phase]['wall'] += wall
+            total[phase]['cpu'] += cpu
+            total[phase]['count'] += count
+        return json.dumps(OrderedDict([('units', units), ('total', total)]), indent=2)
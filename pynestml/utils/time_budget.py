@@ -0,0 +1,198 @@
+#
+# time_budget.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import pickle
+import select
+import signal
+import sys
+import time
+from contextlib import contextmanager
+
+from pynestml.exceptions.analysis_timeout_exception import AnalysisTimeoutException
+from pynestml.utils.compilation_session import session_state
+from pynestml.utils.logger import Logger
+
+# python 2 does not provide a monotonic clock
+_clock = getattr(time, 'monotonic', time.time)
+
+
+@session_state('phase_budget', 'neuron_budget', 'neuron_deadline')
+class TimeBudget(object):
+    """
+    This class limits the time spent in the symbolic analysis of the models. If a budget has been set, each phase
+    of the analysis is executed in a forked worker process which is killed as soon as the budget is exhausted, such
+    that the analysis is cancelled even if it does not return control, e.g., inside of sympy.
+    The process might run further threads, e.g., those of the compile server or of the pool of -jobs. A forked worker
+    only continues the forking thread, thus locks held by other threads at the time of the fork are never released in
+    the worker. The analyses of all sessions are therefore executed one after another (cf. nest_codegeneration), and
+    the worker writes its output through streams of its own instead of the inherited sys.stdout and sys.stderr. A
+    worker which nevertheless blocks on such a lock is killed as soon as the budget is exhausted, like a slow analysis.
+    Attributes:
+        phase_budget     The time in seconds available to a single phase of the analysis, None if unlimited.
+        neuron_budget    The time in seconds available to all phases of the analysis of a neuron, None if unlimited.
+        neuron_deadline  The point in time at which the budget of the currently processed neuron is exhausted.
+    """
+    phase_budget = None
+    neuron_budget = None
+    neuron_deadline = None
+
+    @classmethod
+    def init_time_budget(cls, phase_budget = None, neuron_budget = None):
+        """
+        Initializes the time budgets.
+        :param phase_budget: the time in seconds available to a single phase, None if unlimited.
+        :type phase_budget: float
+        :param neuron_budget: the time in seconds available to all phases of a neuron, None if unlimited.
+        :type neuron_budget: float
+        """
+        cls.phase_budget = phase_budget
+        cls.neuron_budget = neuron_budget
+        cls.neuron_deadline = None
+
+    @classmethod
+    @contextmanager
+    def limit_neuron(cls):
+        """
+        Limits the time available to all phases executed in the enclosed block to the budget of a neuron.
+        """
+        if cls.neuron_budget is None:
+            yield
+            return
+        cls.neuron_deadline = _clock() + cls.neuron_budget
+        try:
+            yield
+        finally:
+            cls.neuron_deadline = None
+
+    @classmethod
+    def get_budget(cls):
+        """
+        Returns the time available to the next phase, i.e., the budget of a phase limited by the remaining budget of
+        the currently processed neuron.
+        :return: the time in seconds, None if unlimited.
+        :rtype: float
+        """
+        budget = cls.phase_budget
+        if cls.neuron_deadline is not None:
+            remaining = max(cls.neuron_deadline - _clock(), 0.0)
+            budget = remaining if budget is None else min(budget, remaining)
+        return budget
+
+    @classmethod
+    def run(cls, phase, function, *args):
+        """
+        Executes the handed over function within the budget of a phase. Since the worker is forked, only the result
+        has to be picklable, while modifications of the arguments are not visible to the caller. Messages logged by the
+        function are handed over and logged again by the caller, unless the budget is exhausted. Without a budget or
+        on platforms which do not support fork, the function is executed directly.
+        :param phase: the name of the phase, e.g., ode_toolbox
+        :type phase: str
+        :param function: the function which shall be executed.
+        :type function: function
+        :return: the result of the function.
+        :rtype: object
+        :raises AnalysisTimeoutException: if the budget has been exhausted.
+        """
+        budget = cls.get_budget()
+        if budget is None or not hasattr(os, 'fork'):
+            return function(*args)
+        return cls.__run_in_worker(phase, budget, function, args)
+
+    @classmethod
+    def __run_in_worker(cls, phase, budget, function, args):
+        # the analyses are based on sympy, which is thus imported before the fork instead of by each worker again
+        import sympy
+        # buffered output would otherwise be printed by both processes
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # the worker hands over the result or the raised exception and exits without any clean-up
+            try:
+                os.close(read_fd)
+                # the locks of the inherited streams might be held by a thread which does not exist in the worker
+                try:
+                    sys.stdout = os.fdopen(os.dup(1), 'w')
+                    sys.stderr = os.fdopen(os.dup(2), 'w')
+                except OSError:
+                    pass
+                # messages are not printed by the worker but handed over and logged by the caller
+                checkpoint = Logger.checkpoint()
+                Logger.no_print = True
+                try:
+                    success, result = True, function(*args)
+                except Exception as e:
+                    success, result = False, e
+                records = cls.__get_log_records(checkpoint)
+                try:
+                    data = pickle.dumps((success, result, records))
+                except Exception:
+                    data = pickle.dumps((False, Exception(repr(result)), records))
+                with os.fdopen(write_fd, 'wb') as f:
+                    f.write(data)
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        deadline = _clock() + budget
+        chunks = list()
+        try:
+            while True:
+                remaining = deadline - _clock()
+                if remaining <= 0 or len(select.select([read_fd], [], [], remaining)[0]) == 0:
+                    os.kill(pid, signal.SIGKILL)
+                    raise AnalysisTimeoutException(phase, budget)
+                chunk = os.read(read_fd, 65536)
+                if len(chunk) == 0:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+        if len(chunks) == 0:
+            raise RuntimeError('(PyNestML.TimeBudget) Worker of phase \'%s\' terminated unexpectedly!' % phase)
+        (success, result, records) = pickle.loads(b''.join(chunks))
+        cls.__log_records(records)
+        if not success:
+            raise result
+        return result
+
+    @classmethod
+    def __get_log_records(cls, checkpoint):
+        # the neurons are referenced by their ids, which are the same in the worker and the caller since the
+        # referenced neurons exist before the fork
+        records = list()
+        for message_nr in range(checkpoint, Logger.curr_message):
+            (artifact_name, neuron, log_level, code, error_position, message) = Logger.get_log()[message_nr]
+            records.append((id(neuron) if neuron is not None else None, log_level, code, error_position, message))
+        return records
+
+    @classmethod
+    def __log_records(cls, records):
+        if len(records) == 0:
+            return
+        neurons = dict((id(entry[1]), entry[1]) for entry in Logger.get_log().values() if entry[1] is not None)
+        if Logger.current_neuron is not None:
+            neurons[id(Logger.current_neuron)] = Logger.current_neuron
+        for (neuron_id, log_level, code, error_position, message) in records:
+            Logger.log_message(neuron=neurons.get(neuron_id), code=code, message=message,
+                               error_position=error_position, log_level=log_level)
@@ -36,8 +36,8 @@ class ASTBuilderVisitor(PyNestMLVisitor):
     This class is used to create an internal representation of the model by means of an abstract syntax tree.
     """
 
-    def __init__(self, tokens):
-        self.__comments = CommentCollectorVisitor(tokens)
+    def __init__(self, tokens, collect_comments=True):
+        self.__comments = CommentCollectorVisitor(tokens, collect_comments)
         self.data_type_visitor = ASTDataTypeVisitor()
 
     # Visit a parse tree produced by PyNESTMLParser#nestmlCompilationUnit.
@@ -97,6 +97,17 @@ class ASTBuilderVisitor(PyNestMLVisitor):
 
     # Visit a parse tree produced by PyNESTMLParser#rhs.
     def visitExpression(self, ctx):
+        # chains of left-associative operators, e.g., long sums, are nested in the left operand, thus the chain is
+        # built bottom-up without recursion
+        chain = [ctx]
+        while chain[-1].left is not None:
+            chain.append(chain[-1].left)
+        lhs = None
+        for ctx in reversed(chain):
+            lhs = self.__build_expression(ctx, lhs)
+        return lhs
+
+    def __build_expression(self, ctx, lhs):
         # first check if it is a simple rhs
         if ctx.simpleExpression() is not None:
             return self.visitSimpleExpression(ctx.simpleExpression())
@@ -107,8 +118,7 @@ class ASTBuilderVisitor(PyNestMLVisitor):
         unary_operator = (self.visit(ctx.unaryOperator()) if ctx.unaryOperator() is not None else None)
         is_logical_not = (True if ctx.logicalNot is not None else False)
         expression = self.visit(ctx.term) if ctx.term is not None else None
-        # otherwise it is a combined one, check first lhs, then the operator and finally rhs
-        lhs = (self.visit(ctx.left) if ctx.left is not None else None)
+        # otherwise it is a combined one, the lhs has already been built, check the operator and finally rhs
         if ctx.powOp is not None:
             source_pos = ASTSourceLocation.make_ast_source_position(start_line=ctx.powOp.line,
                                                                     start_column=ctx.powOp.column,
@@ -643,9 +653,12 @@ class ASTBuilderVisitor(PyNestMLVisitor):
 
 def update_node_comments(node, comments):
     node.comment = comments[0]
-    node.pre_comments = comments[1]
+    # empty lists of pre and post comments are not stored, these are allocated on access
+    if comments[1]:
+        node.pre_comments = comments[1]
     node.in_comment = comments[2]
-    node.post_comments = comments[3]
+    if comments[3]:
+        node.post_comments = comments[3]
 
 
 def get_next(_elements = list()):
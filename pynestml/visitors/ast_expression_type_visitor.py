@@ -68,13 +68,26 @@ class ASTExpressionTypeVisitor(ASTVisitor):
 
     def handle(self, _node):
         """
-        Handles the handed over node and executes the required sub routines.
+        Handles the handed over node and executes the required sub routines. Expressions are handled in post-order
+        with an explicit stack instead of recursive calls, thus deeply nested expressions, e.g., long sums, do not
+        exceed the recursion limit.
         :param _node: a meta_model node.
         :type _node: AST_
         """
-        self.traverse(_node)
-        self.get_real_self().visit(_node)
-        self.get_real_self().endvisit(_node)
+        # each entry holds a node and whether its operands have been handled already
+        stack = [(_node, False)]
+        while len(stack) > 0:
+            node, operands_handled = stack.pop()
+            if isinstance(node, ASTExpression):
+                if not operands_handled:
+                    stack.append((node, True))
+                    stack.extend((operand, False) for operand in reversed(self.get_operands(node)))
+                    continue
+                self.select_visitor(node)
+            else:
+                self.traverse(node)
+            self.get_real_self().visit(node)
+            self.get_real_self().endvisit(node)
 
     def traverse_simple_expression(self, node):
         """
@@ -120,17 +133,45 @@ class ASTExpressionTypeVisitor(ASTVisitor):
         :param _node: a single meta_model node
         :type _node: ASTExpression
         """
+        for operand in self.get_operands(_node):
+            operand.accept(self)
+        self.select_visitor(_node)
+
+    @classmethod
+    def get_operands(cls, _node):
+        """
+        Returns the operands of the handed over expression in the order in which their types are derived.
+        :param _node: a single meta_model node
+        :type _node: ASTExpression
+        :return: a list of expressions
+        :rtype: list(ASTExpression or ASTSimpleExpression)
+        """
         assert (_node is not None and isinstance(_node, ASTExpression)), \
             '(PyNestML.ASTExpressionTypeVisitor) No or wrong type of expression provided (%s)!' % type(_node)
+        # Expr = unaryOperator term=expression, as well as parentheses and logicalNot
+        if _node.get_expression() is not None:
+            return [_node.get_expression()]
+        # All rules with binary operators employ left and right side expressions.
+        if _node.get_binary_operator() is not None:
+            return [operand for operand in (_node.get_lhs(), _node.get_rhs()) if operand is not None]
+        # Expr = condition=expression '?' ifTrue=expression ':' ifNot=expression
+        if _node.get_condition() is not None and _node.get_if_true() is not None and _node.get_if_not() is not None:
+            return [_node.get_condition(), _node.get_if_true(), _node.get_if_not()]
+        return []
+
+    def select_visitor(self, _node):
+        """
+        Selects the sub-visitor which derives the type of the handed over expression from the types of its operands.
+        :param _node: a single meta_model node
+        :type _node: ASTExpression
+        """
         # Expr = unaryOperator term=expression
         if _node.get_expression() is not None and _node.get_unary_operator() is not None:
-            _node.get_expression().accept(self)
             self.set_real_self(self.unary_visitor)
             return
 
         # Parentheses and logicalNot
         if _node.get_expression() is not None:
-            _node.get_expression().accept(self)
             # Expr = leftParentheses='(' term=expression rightParentheses=')'
             if _node.is_encapsulated:
                 self.set_real_self(self.parentheses_visitor)
@@ -143,11 +184,6 @@ class ASTExpressionTypeVisitor(ASTVisitor):
         # Rules with binary operators
         if _node.get_binary_operator() is not None:
             bin_op = _node.get_binary_operator()
-            # All these rules employ left and right side expressions.
-            if _node.get_lhs() is not None:
-                _node.get_lhs().accept(self)
-            if _node.get_rhs() is not None:
-                _node.get_rhs().accept(self)
             # Handle all Arithmetic Operators:
             if isinstance(bin_op, ast_arithmetic_operator.ASTArithmeticOperator):
                 # Expr = <assoc=right> left=expression powOp='**' right=expression
@@ -180,8 +216,5 @@ class ASTExpressionTypeVisitor(ASTVisitor):
 
         # Expr = condition=expression '?' ifTrue=expression ':' ifNot=expression
         if _node.get_condition() is not None and _node.get_if_true() is not None and _node.get_if_not() is not None:
-            _node.get_condition().accept(self)
-            _node.get_if_true().accept(self)
-            _node.get_if_not().accept(self)
             self.set_real_self(self.condition_visitor)
             return
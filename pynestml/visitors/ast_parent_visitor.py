@@ -0,0 +1,31 @@
+#
+# ast_parent_visitor.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from pynestml.visitors.ast_parent_aware_visitor import ASTParentAwareVisitor
+
+
+class ASTParentVisitor(ASTParentAwareVisitor):
+    """
+    This visitor sets the parent reference of all nodes below the node on which accept has been called, e.g., in
+    order to restore the references after the tree has been modified directly.
+    """
+
+    def visit(self, node):
+        if not self.parents.is_empty():
+            node.set_parent(self.parents.top())
@@ -610,6 +610,7 @@ def make_trivial_assignment(var, order, equations_block, is_shape = False):
     else:
         node = ASTNodeFactory.create_ast_ode_equation(lhs=lhs_variable, rhs=expression, source_position=source_loc)
     equations_block.get_declarations().append(node)
+    node.set_parent(equations_block)
     return node
 
 
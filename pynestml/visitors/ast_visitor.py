@@ -45,6 +45,7 @@ from pynestml.meta_model.ast_input_type import ASTInputType
 from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
 from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
 from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_ode_function import ASTOdeFunction
 from pynestml.meta_model.ast_ode_shape import ASTOdeShape
@@ -61,6 +62,75 @@ from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 
 
+# the classes of the meta_model in the order in which the dispatchers check them, the first class a node is an
+# instance of determines the methods which are called
+_dispatch_order = (
+    (ASTArithmeticOperator, 'arithmetic_operator'),
+    (ASTAssignment, 'assignment'),
+    (ASTBitOperator, 'bit_operator'),
+    (ASTBlock, 'block'),
+    (ASTBlockWithVariables, 'block_with_variables'),
+    (ASTBody, 'body'),
+    (ASTComparisonOperator, 'comparison_operator'),
+    (ASTCompoundStmt, 'compound_stmt'),
+    (ASTDataType, 'data_type'),
+    (ASTDeclaration, 'declaration'),
+    (ASTElifClause, 'elif_clause'),
+    (ASTElseClause, 'else_clause'),
+    (ASTEquationsBlock, 'equations_block'),
+    (ASTExpression, 'expression'),
+    (ASTForStmt, 'for_stmt'),
+    (ASTFunction, 'function'),
+    (ASTFunctionCall, 'function_call'),
+    (ASTIfClause, 'if_clause'),
+    (ASTIfStmt, 'if_stmt'),
+    (ASTInputBlock, 'input_block'),
+    (ASTInputLine, 'input_line'),
+    (ASTInputType, 'input_type'),
+    (ASTLogicalOperator, 'logical_operator'),
+    (ASTNestMLCompilationUnit, 'compilation_unit'),
+    (ASTNeuron, 'neuron'),
+    (ASTOdeEquation, 'ode_equation'),
+    (ASTOdeFunction, 'ode_function'),
+    (ASTOdeShape, 'ode_shape'),
+    (ASTOutputBlock, 'output_block'),
+    (ASTParameter, 'parameter'),
+    (ASTReturnStmt, 'return_stmt'),
+    (ASTSimpleExpression, 'simple_expression'),
+    (ASTSmallStmt, 'small_stmt'),
+    (ASTUnaryOperator, 'unary_operator'),
+    (ASTUnitType, 'unit_type'),
+    (ASTUpdateBlock, 'update_block'),
+    (ASTVariable, 'variable'),
+    (ASTWhileStmt, 'while_stmt'),
+    (ASTStmt, 'stmt'),
+    (ASTConstraint, 'constraint'),
+    (ASTConstraintsBlock, 'constraints_block'),
+)
+
+# the names of the visit, traverse and endvisit methods by the class of the node, filled on the first dispatch
+_dispatch_table = {}
+
+
+def get_dispatch_names(node_type):
+    """
+    Returns the names of the visit, traverse and endvisit methods which are called for nodes of the handed over
+    class, e.g., ('visit_block', 'traverse_block', 'endvisit_block') for ASTBlock. The names are determined by the
+    first matching class in the dispatch order and stored in the dispatch table.
+    :param node_type: a class of the meta_model
+    :type node_type: type
+    :return: a tuple of method names, or None if no method is called for this class
+    :rtype: (str,str,str) or None
+    """
+    names = None
+    for cls, name in _dispatch_order:
+        if issubclass(node_type, cls):
+            names = ('visit_' + name, 'traverse_' + name, 'endvisit_' + name)
+            break
+    _dispatch_table[node_type] = names
+    return names
+
+
 class ASTVisitor(object):
     """
     This class represents a standard implementation of a visitor as used to create concrete instances.
@@ -740,10 +810,59 @@ class ASTVisitor(object):
         return self.real_self
 
     def handle(self, _node):
-        self.get_real_self().visit(_node)
-        self.get_real_self().traverse(_node)
-        self.get_real_self().endvisit(_node)
-        return
+        """
+        Visits, traverses and endvisits the handed over node, and by means of the traverse methods all nodes below it.
+        As long as the default handle and traverse methods are used, the nodes are processed with an explicit stack
+        instead of recursive calls, thus the depth of the tree is not limited by the recursion limit. Overridden
+        methods are called as usual.
+        :param _node: a single node
+        :type _node: ASTNode
+        """
+        # the module level objects are bound to local names since they are accessed for each node
+        stack, table, finished, no_children, handle, accept = list(), _traversal_table, _finished, _no_children, \
+            ASTVisitor.handle, ASTNode.accept
+        visitor, node = self, _node
+        while True:
+            real_self = visitor.real_self
+            try:
+                traversal = table[type(real_self)][type(node)]
+            except KeyError:
+                traversal = _get_traversal(type(real_self), type(node))
+            traversal[0](real_self, node)
+            # the node is traversed by the real self as it is after the visit
+            traverser = visitor.real_self
+            if traverser is not real_self:
+                try:
+                    traversal = table[type(traverser)][type(node)]
+                except KeyError:
+                    traversal = _get_traversal(type(traverser), type(node))
+            if traversal[1] is None:
+                traverser.traverse(node)
+            elif traversal[1] is not no_children:
+                stack.append((visitor, node, traverser, traversal, traversal[1](node)))
+                visitor = None
+            # endvisit the node if it has been traversed completely, and continue with the next child of the
+            # innermost unfinished node, finished nodes are endvisited
+            while True:
+                if visitor is not None:
+                    real_self = visitor.real_self
+                    if real_self is traverser:
+                        traversal[2](real_self, node)
+                    else:
+                        real_self.endvisit(node)
+                if not stack:
+                    return
+                visitor, node, traverser, traversal, children = stack[-1]
+                child = next(children, finished)
+                if child is finished:
+                    stack.pop()
+                    continue
+                visitor = None
+                child_visitor = traverser.real_self
+                if type(child_visitor).handle == handle and type(child).accept == accept:
+                    visitor, node = child_visitor, child
+                    break
+                child.accept(child_visitor)
 
     def visit(self, node):
         """
@@ -751,129 +870,12 @@ class ASTVisitor(object):
         :param node: The ASTElement to visit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.visit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.visit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.visit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.visit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.visit_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.visit_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.visit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.visit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.visit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.visit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.visit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.visit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.visit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.visit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.visit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.visit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.visit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.visit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.visit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.visit_input_block(node)
-            return
-        if isinstance(node, ASTInputLine):
-            self.visit_input_line(node)
-            return
-        if isinstance(node, ASTInputType):
-            self.visit_input_type(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.visit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.visit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.visit_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.visit_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.visit_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.visit_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.visit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.visit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.visit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.visit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.visit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.visit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.visit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.visit_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.visit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.visit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.visit_stmt(node)
-            return
-        if isinstance(node, ASTConstraint):
-            self.visit_constraint(node)
-            return
-        if isinstance(node, ASTConstraintsBlock):
-            self.visit_constraints_block(node)
-            return
+        try:
+            names = _dispatch_table[type(node)]
+        except KeyError:
+            names = get_dispatch_names(type(node))
+        if names is not None:
+            getattr(self, names[0])(node)
         return
 
     def traverse(self, node):
@@ -882,129 +884,12 @@ class ASTVisitor(object):
         :param node: The ASTElement to visit
         :type node: Inherited from ASTElement
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.traverse_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.traverse_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.traverse_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.traverse_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.traverse_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.traverse_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.traverse_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.traverse_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.traverse_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.traverse_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.traverse_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.traverse_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.traverse_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.traverse_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.traverse_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.traverse_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.traverse_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.traverse_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.traverse_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.traverse_input_block(node)
-            return
-        if isinstance(node, ASTInputLine):
-            self.traverse_input_line(node)
-            return
-        if isinstance(node, ASTInputType):
-            self.traverse_input_type(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.traverse_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.traverse_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.traverse_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.traverse_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.traverse_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.traverse_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.traverse_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.traverse_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.traverse_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.traverse_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.traverse_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.traverse_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.traverse_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.traverse_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.traverse_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.traverse_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.traverse_stmt(node)
-            return
-        if isinstance(node, ASTConstraint):
-            self.traverse_constraint(node)
-            return
-        if isinstance(node, ASTConstraintsBlock):
-            self.traverse_constraints_block(node)
-            return
+        try:
+            names = _dispatch_table[type(node)]
+        except KeyError:
+            names = get_dispatch_names(type(node))
+        if names is not None:
+            getattr(self, names[1])(node)
         return
 
     def endvisit(self, node):
@@ -1013,279 +898,111 @@ class ASTVisitor(object):
         :param node: The ASTElement to endvisit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.endvisit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.endvisit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.endvisit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.endvisit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.endvisit_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.endvisit_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.endvisit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.endvisit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.endvisit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.endvisit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.endvisit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.endvisit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.endvisit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.endvisit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.endvisit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.endvisit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.endvisit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.endvisit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.endvisit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.endvisit_input_block(node)
-            return
-        if isinstance(node, ASTInputLine):
-            self.endvisit_input_line(node)
-            return
-        if isinstance(node, ASTInputType):
-            self.endvisit_input_type(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.endvisit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.endvisit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.endvisit_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.endvisit_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.endvisit_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.endvisit_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.endvisit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.endvisit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.endvisit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.endvisit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.endvisit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.endvisit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.endvisit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.endvisit_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.endvisit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.endvisit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.endvisit_stmt(node)
-            return
-        if isinstance(node, ASTConstraint):
-            self.endvisit_constraint(node)
-            return
-        if isinstance(node, ASTConstraintsBlock):
-            self.endvisit_constraints_block(node)
-            return
+        try:
+            names = _dispatch_table[type(node)]
+        except KeyError:
+            names = get_dispatch_names(type(node))
+        if names is not None:
+            getattr(self, names[2])(node)
         return
 
     def traverse_arithmetic_operator(self, node):
         return
 
     def traverse_assignment(self, node):
-        if node.get_variable() is not None:
-            node.get_variable().accept(self.get_real_self())
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
+        for sub_node in _children_of_assignment(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_bit_operator(self, node):
         return
 
     def traverse_block(self, node):
-        if node.get_stmts() is not None:
-            for sub_node in node.get_stmts():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_block(node):
+            sub_node.accept(self.get_real_self())
         return
 
-    def traverse_block_with_variables(self, _node):
-        if _node.get_declarations() is not None:
-            for sub_node in _node.get_declarations():
-                sub_node.accept(self.get_real_self())
+    def traverse_block_with_variables(self, node):
+        for sub_node in _children_of_block_with_variables(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_body(self, node):
-        if node.get_body_elements() is not None:
-            for sub_node in node.get_body_elements():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_body(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_comparison_operator(self, node):
         return
 
     def traverse_compound_stmt(self, node):
-        if node.get_if_stmt() is not None:
-            node.get_if_stmt().accept(self.get_real_self())
-        if node.get_while_stmt() is not None:
-            node.get_while_stmt().accept(self.get_real_self())
-        if node.get_for_stmt() is not None:
-            node.get_for_stmt().accept(self.get_real_self())
+        for sub_node in _children_of_compound_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_data_type(self, node):
-        if node.get_unit_type() is not None:
-            node.get_unit_type().accept(self.get_real_self())
+        for sub_node in _children_of_data_type(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_declaration(self, node):
-        if node.get_variables() is not None:
-            for sub_node in node.get_variables():
-                sub_node.accept(self.get_real_self())
-        if node.get_data_type() is not None:
-            node.get_data_type().accept(self.get_real_self())
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
-        if node.get_invariant() is not None:
-            node.get_invariant().accept(self.get_real_self())
+        for sub_node in _children_of_declaration(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_elif_clause(self, node):
-        if node.get_condition() is not None:
-            node.get_condition().accept(self.get_real_self())
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_elif_clause(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_else_clause(self, node):
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_else_clause(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_equations_block(self, node):
-        if node.get_declarations() is not None:
-            for sub_node in node.get_declarations():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_equations_block(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_expression(self, node):
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
-        if node.get_unary_operator() is not None:
-            node.get_unary_operator().accept(self.get_real_self())
-        if node.get_lhs() is not None:
-            node.get_lhs().accept(self.get_real_self())
-        if node.get_rhs() is not None:
-            node.get_rhs().accept(self.get_real_self())
-        if node.get_binary_operator() is not None:
-            node.get_binary_operator().accept(self.get_real_self())
-        if node.get_condition() is not None:
-            node.get_condition().accept(self.get_real_self())
-        if node.get_if_true() is not None:
-            node.get_if_true().accept(self.get_real_self())
-        if node.get_if_not() is not None:
-            node.get_if_not().accept(self.get_real_self())
+        for sub_node in _children_of_expression(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_for_stmt(self, node):
-        if node.get_start_from() is not None:
-            node.get_start_from().accept(self.get_real_self())
-        if node.get_end_at() is not None:
-            node.get_end_at().accept(self.get_real_self())
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_for_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_function(self, node):
-        if node.get_parameters() is not None:
-            for sub_node in node.get_parameters():
-                sub_node.accept(self.get_real_self())
-        if node.get_return_type() is not None:
-            node.get_return_type().accept(self.get_real_self())
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_function(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_function_call(self, node):
-        if node.get_args() is not None:
-            for sub_node in node.get_args():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_function_call(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_if_clause(self, node):
-        if node.get_condition() is not None:
-            node.get_condition().accept(self.get_real_self())
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_if_clause(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_if_stmt(self, node):
-        if node.get_if_clause() is not None:
-            node.get_if_clause().accept(self.get_real_self())
-        for elifClause in node.get_elif_clauses():
-            elifClause.accept(self.get_real_self())
-        if node.get_else_clause() is not None:
-            node.get_else_clause().accept(self.get_real_self())
+        for sub_node in _children_of_if_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_input_block(self, node):
-        if node.get_input_lines() is not None:
-            for sub_node in node.get_input_lines():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_input_block(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_input_line(self, node):
-        if node.get_input_types() is not None:
-            for sub_node in node.get_input_types():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_input_line(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_input_type(self, node):
@@ -1295,116 +1012,422 @@ class ASTVisitor(object):
         return
 
     def traverse_compilation_unit(self, node):
-        if node.get_neuron_list() is not None:
-            for sub_node in node.get_neuron_list():
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_compilation_unit(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_neuron(self, node):
-        if node.get_body() is not None:
-            node.get_body().accept(self.get_real_self())
+        for sub_node in _children_of_neuron(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_ode_equation(self, node):
-        if node.get_lhs() is not None:
-            node.get_lhs().accept(self.get_real_self())
-        if node.get_rhs() is not None:
-            node.get_rhs().accept(self.get_real_self())
+        for sub_node in _children_of_ode_equation(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_ode_function(self, node):
-        if node.get_data_type() is not None:
-            node.get_data_type().accept(self.get_real_self())
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
+        for sub_node in _children_of_ode_function(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_ode_shape(self, node):
-        if node.get_variable() is not None:
-            node.get_variable().accept(self.get_real_self())
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
+        for sub_node in _children_of_ode_shape(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_output_block(self, node):
         return
 
     def traverse_parameter(self, node):
-        if node.get_data_type() is not None:
-            node.get_data_type().accept(self.get_real_self())
+        for sub_node in _children_of_parameter(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_return_stmt(self, node):
-        if node.get_expression() is not None:
-            node.get_expression().accept(self.get_real_self())
+        for sub_node in _children_of_return_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_simple_expression(self, node):
-        if node.get_function_call() is not None:
-            node.get_function_call().accept(self.get_real_self())
-        if node.get_variable() is not None:
-            node.get_variable().accept(self.get_real_self())
+        for sub_node in _children_of_simple_expression(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_small_stmt(self, node):
-        if node.get_assignment() is not None:
-            node.get_assignment().accept(self.get_real_self())
-        if node.get_function_call() is not None:
-            node.get_function_call().accept(self.get_real_self())
-        if node.get_declaration() is not None:
-            node.get_declaration().accept(self.get_real_self())
-        if node.get_return_stmt() is not None:
-            node.get_return_stmt().accept(self.get_real_self())
+        for sub_node in _children_of_small_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
-    def traverse_unary_operator(self, _node):
+    def traverse_unary_operator(self, node):
         return
 
     def traverse_unit_type(self, node):
-        if node.base is not None:
-            node.base.accept(self.get_real_self())
-        if node.get_lhs() is not None:
-            if isinstance(node.get_lhs(), ASTUnitType):
-                node.get_lhs().accept(self.get_real_self())
-        if node.get_rhs() is not None:
-            node.get_rhs().accept(self.get_real_self())
-        if node.compound_unit is not None:
-            node.compound_unit.accept(self.get_real_self())
+        for sub_node in _children_of_unit_type(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_update_block(self, node):
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_update_block(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_variable(self, node):
         return
 
     def traverse_while_stmt(self, node):
-        if node.get_condition() is not None:
-            node.get_condition().accept(self.get_real_self())
-        if node.get_block() is not None:
-            node.get_block().accept(self.get_real_self())
+        for sub_node in _children_of_while_stmt(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_stmt(self, node):
-        if node.is_small_stmt():
-            node.small_stmt.accept(self.get_real_self())
-        if node.is_compound_stmt():
-            node.compound_stmt.accept(self.get_real_self())
+        for sub_node in _children_of_stmt(node):
+            sub_node.accept(self.get_real_self())
+        return
 
     def traverse_constraint(self, node):
-        if node.left_bound is not None:
-            node.left_bound.accept(self.get_real_self())
-            node.left_bound_type.accept(self.get_real_self())
-        node.variable.accept(self.get_real_self())
-        if node.right_bound is not None:
-            node.right_bound_type.accept(self.get_real_self())
-            node.right_bound.accept(self.get_real_self())
+        for sub_node in _children_of_constraint(node):
+            sub_node.accept(self.get_real_self())
         return
 
     def traverse_constraints_block(self, node):
-        if node.constraints is not None and len(node.constraints) > 0:
-            for sub_node in node.constraints:
-                sub_node.accept(self.get_real_self())
+        for sub_node in _children_of_constraints_block(node):
+            sub_node.accept(self.get_real_self())
         return
+
+
+# marks the end of the children of a node
+_finished = object()
+
+# the functions which visit a node, yield its children and endvisit it, by the visitor class and the node class
+_traversal_table = {}
+
+
+def _get_traversal(visitor_type, node_type):
+    """
+    Returns the functions which visit a node of the handed over class, yield its children as traversed by the
+    default traverse method, and endvisit it. The visit and endvisit functions are called with the visitor as the
+    first argument, the children function is None if the visitor overrides the traverse method.
+    """
+    names = get_dispatch_names(node_type)
+    visit = _get_dispatched_function(visitor_type, 'visit', names[0] if names is not None else None)
+    endvisit = _get_dispatched_function(visitor_type, 'endvisit', names[2] if names is not None else None)
+    if visitor_type.traverse != ASTVisitor.traverse or \
+            (names is not None and getattr(visitor_type, names[1]) != getattr(ASTVisitor, names[1])):
+        children = None
+    elif names is not None and names[1] in _default_children:
+        children = _default_children[names[1]]
+    else:
+        children = _no_children
+    traversal = (visit, children, endvisit)
+    _traversal_table.setdefault(visitor_type, dict())[node_type] = traversal
+    return traversal
+
+
+def _get_dispatched_function(visitor_type, dispatcher, name):
+    """
+    Returns the function which is called by the handed over dispatcher, e.g., visit, or the dispatcher itself if it
+    is overridden. Methods are compared by equality, since python 2 creates a new unbound method on each access.
+    """
+    if getattr(visitor_type, dispatcher) != getattr(ASTVisitor, dispatcher):
+        return getattr(visitor_type, dispatcher)
+    if name is None:
+        return _ignore
+    # overridden methods might be static or class methods, thus only the default methods are called directly
+    if getattr(visitor_type, name) != getattr(ASTVisitor, name):
+        return getattr(visitor_type, dispatcher)
+    return getattr(visitor_type, name)
+
+
+def _ignore(visitor, node):
+    return
+
+
+def _no_children(node):
+    return iter(())
+
+
+def _children_of_assignment(node):
+    if node.get_variable() is not None:
+        yield node.get_variable()
+    if node.get_expression() is not None:
+        yield node.get_expression()
+
+
+def _children_of_block(node):
+    if node.get_stmts() is not None:
+        for sub_node in node.get_stmts():
+            yield sub_node
+
+
+def _children_of_block_with_variables(node):
+    if node.get_declarations() is not None:
+        for sub_node in node.get_declarations():
+            yield sub_node
+
+
+def _children_of_body(node):
+    if node.get_body_elements() is not None:
+        for sub_node in node.get_body_elements():
+            yield sub_node
+
+
+def _children_of_compound_stmt(node):
+    if node.get_if_stmt() is not None:
+        yield node.get_if_stmt()
+    if node.get_while_stmt() is not None:
+        yield node.get_while_stmt()
+    if node.get_for_stmt() is not None:
+        yield node.get_for_stmt()
+
+
+def _children_of_data_type(node):
+    if node.get_unit_type() is not None:
+        yield node.get_unit_type()
+
+
+def _children_of_declaration(node):
+    if node.get_variables() is not None:
+        for sub_node in node.get_variables():
+            yield sub_node
+    if node.get_data_type() is not None:
+        yield node.get_data_type()
+    if node.get_expression() is not None:
+        yield node.get_expression()
+    if node.get_invariant() is not None:
+        yield node.get_invariant()
+
+
+def _children_of_elif_clause(node):
+    if node.get_condition() is not None:
+        yield node.get_condition()
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_else_clause(node):
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_equations_block(node):
+    if node.get_declarations() is not None:
+        for sub_node in node.get_declarations():
+            yield sub_node
+
+
+def _children_of_expression(node):
+    if node.get_expression() is not None:
+        yield node.get_expression()
+    if node.get_unary_operator() is not None:
+        yield node.get_unary_operator()
+    if node.get_lhs() is not None:
+        yield node.get_lhs()
+    if node.get_rhs() is not None:
+        yield node.get_rhs()
+    if node.get_binary_operator() is not None:
+        yield node.get_binary_operator()
+    if node.get_condition() is not None:
+        yield node.get_condition()
+    if node.get_if_true() is not None:
+        yield node.get_if_true()
+    if node.get_if_not() is not None:
+        yield node.get_if_not()
+
+
+def _children_of_for_stmt(node):
+    if node.get_start_from() is not None:
+        yield node.get_start_from()
+    if node.get_end_at() is not None:
+        yield node.get_end_at()
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_function(node):
+    if node.get_parameters() is not None:
+        for sub_node in node.get_parameters():
+            yield sub_node
+    if node.get_return_type() is not None:
+        yield node.get_return_type()
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_function_call(node):
+    if node.get_args() is not None:
+        for sub_node in node.get_args():
+            yield sub_node
+
+
+def _children_of_if_clause(node):
+    if node.get_condition() is not None:
+        yield node.get_condition()
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_if_stmt(node):
+    if node.get_if_clause() is not None:
+        yield node.get_if_clause()
+    for sub_node in node.get_elif_clauses():
+        yield sub_node
+    if node.get_else_clause() is not None:
+        yield node.get_else_clause()
+
+
+def _children_of_input_block(node):
+    if node.get_input_lines() is not None:
+        for sub_node in node.get_input_lines():
+            yield sub_node
+
+
+def _children_of_input_line(node):
+    if node.get_input_types() is not None:
+        for sub_node in node.get_input_types():
+            yield sub_node
+
+
+def _children_of_compilation_unit(node):
+    if node.get_neuron_list() is not None:
+        for sub_node in node.get_neuron_list():
+            yield sub_node
+
+
+def _children_of_neuron(node):
+    if node.get_body() is not None:
+        yield node.get_body()
+
+
+def _children_of_ode_equation(node):
+    if node.get_lhs() is not None:
+        yield node.get_lhs()
+    if node.get_rhs() is not None:
+        yield node.get_rhs()
+
+
+def _children_of_ode_function(node):
+    if node.get_data_type() is not None:
+        yield node.get_data_type()
+    if node.get_expression() is not None:
+        yield node.get_expression()
+
+
+def _children_of_ode_shape(node):
+    if node.get_variable() is not None:
+        yield node.get_variable()
+    if node.get_expression() is not None:
+        yield node.get_expression()
+
+
+def _children_of_parameter(node):
+    if node.get_data_type() is not None:
+        yield node.get_data_type()
+
+
+def _children_of_return_stmt(node):
+    if node.get_expression() is not None:
+        yield node.get_expression()
+
+
+def _children_of_simple_expression(node):
+    if node.get_function_call() is not None:
+        yield node.get_function_call()
+    if node.get_variable() is not None:
+        yield node.get_variable()
+
+
+def _children_of_small_stmt(node):
+    if node.get_assignment() is not None:
+        yield node.get_assignment()
+    if node.get_function_call() is not None:
+        yield node.get_function_call()
+    if node.get_declaration() is not None:
+        yield node.get_declaration()
+    if node.get_return_stmt() is not None:
+        yield node.get_return_stmt()
+
+
+def _children_of_unit_type(node):
+    if node.base is not None:
+        yield node.base
+    if node.get_lhs() is not None:
+        if isinstance(node.get_lhs(), ASTUnitType):
+            yield node.get_lhs()
+    if node.get_rhs() is not None:
+        yield node.get_rhs()
+    if node.compound_unit is not None:
+        yield node.compound_unit
+
+
+def _children_of_update_block(node):
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_while_stmt(node):
+    if node.get_condition() is not None:
+        yield node.get_condition()
+    if node.get_block() is not None:
+        yield node.get_block()
+
+
+def _children_of_stmt(node):
+    if node.is_small_stmt():
+        yield node.small_stmt
+    if node.is_compound_stmt():
+        yield node.compound_stmt
+
+
+def _children_of_constraint(node):
+    if node.left_bound is not None:
+        yield node.left_bound
+        yield node.left_bound_type
+    yield node.variable
+    if node.right_bound is not None:
+        yield node.right_bound_type
+        yield node.right_bound
+
+
+def _children_of_constraints_block(node):
+    if node.constraints is not None and len(node.constraints) > 0:
+        for sub_node in node.constraints:
+            yield sub_node
+
+
+# the children as traversed by the default traverse methods, by the name of the method
+_default_children = {
+    'traverse_assignment': _children_of_assignment,
+    'traverse_block': _children_of_block,
+    'traverse_block_with_variables': _children_of_block_with_variables,
+    'traverse_body': _children_of_body,
+    'traverse_compound_stmt': _children_of_compound_stmt,
+    'traverse_data_type': _children_of_data_type,
+    'traverse_declaration': _children_of_declaration,
+    'traverse_elif_clause': _children_of_elif_clause,
+    'traverse_else_clause': _children_of_else_clause,
+    'traverse_equations_block': _children_of_equations_block,
+    'traverse_expression': _children_of_expression,
+    'traverse_for_stmt': _children_of_for_stmt,
+    'traverse_function': _children_of_function,
+    'traverse_function_call': _children_of_function_call,
+    'traverse_if_clause': _children_of_if_clause,
+    'traverse_if_stmt': _children_of_if_stmt,
+    'traverse_input_block': _children_of_input_block,
+    'traverse_input_line': _children_of_input_line,
+    'traverse_compilation_unit': _children_of_compilation_unit,
+    'traverse_neuron': _children_of_neuron,
+    'traverse_ode_equation': _children_of_ode_equation,
+    'traverse_ode_function': _children_of_ode_function,
+    'traverse_ode_shape': _children_of_ode_shape,
+    'traverse_parameter': _children_of_parameter,
+    'traverse_return_stmt': _children_of_return_stmt,
+    'traverse_simple_expression': _children_of_simple_expression,
+    'traverse_small_stmt': _children_of_small_stmt,
+    'traverse_unit_type': _children_of_unit_type,
+    'traverse_update_block': _children_of_update_block,
+    'traverse_while_stmt': _children_of_while_stmt,
+    'traverse_stmt': _children_of_stmt,
+    'traverse_constraint': _children_of_constraint,
+    'traverse_constraints_block': _children_of_constraints_block,
+}
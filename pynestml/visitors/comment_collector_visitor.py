@@ -24,143 +24,171 @@ class CommentCollectorVisitor(PyNestMLVisitor):
     """
     This visitor iterates over a given parse tree and inspects the corresponding stream of tokens in order
     to update all nodes by their corresponding tokens.
+    Comments are only collected if requested and if the stream contains any comment at all, e.g., fragments created
+    by the solver are not inspected. Otherwise, no comments are attached to the nodes.
     Attributes:
-        __tokens (list): A list of all tokens representing the model.
+        __index (TokenIndex): An index of all tokens representing the model, or None if no comments are collected.
     """
 
-    def __init__(self, tokens):
-        self.__tokens = tokens
+    def __init__(self, tokens, collect_comments=True):
+        if collect_comments and any(token.channel == 2 for token in tokens):
+            self.__index = TokenIndex(tokens)
+        else:
+            self.__index = None
 
     def visitBlockWithVariables(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitNeuron(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitOdeEquation(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitOdeFunction(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitOdeShape(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitSmallStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitCompoundStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitInputLine(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitDeclaration(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitAssignment(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitUpdateBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitEquationsBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitInputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitOutputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitFunctionCall(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitFunction(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitForStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitWhileStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitConstraint(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitConstraintsBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return (get_comments(ctx, self.__index), get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), get_post_comments(ctx, self.__index))
 
     def visitIfClause(self, ctx):
         temp = list()
-        temp.extend(get_pre_comment(ctx, self.__tokens))
-        temp.append(get_in_comments(ctx, self.__tokens))
+        temp.extend(get_pre_comment(ctx, self.__index))
+        temp.append(get_in_comments(ctx, self.__index))
         # for if clauses no post comments are supported
-        return (temp, get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), list())
+        return (temp, get_pre_comment(ctx, self.__index),
+                get_in_comments(ctx, self.__index), list())
 
     def visitElifClause(self, ctx):
-        temp = get_in_comments(ctx, self.__tokens)
+        temp = get_in_comments(ctx, self.__index)
         if temp is None:
             temp = list()
         else:
             temp = list(temp)
         # for elif clauses, only in comments are supported
-        return (temp, list(), get_in_comments(ctx, self.__tokens),
+        return (temp, list(), get_in_comments(ctx, self.__index),
                 list())
 
     def visitElseClause(self, ctx):
-        temp = get_in_comments(ctx, self.__tokens)
+        temp = get_in_comments(ctx, self.__index)
         if temp is None:
             temp = list()
         else:
             temp = list(temp)
-        return (temp, list(), get_in_comments(ctx, self.__tokens),
-                get_post_comments(ctx, self.__tokens))
+        return (temp, list(), get_in_comments(ctx, self.__index),
+                get_post_comments(ctx, self.__index))
 
 
-def get_comments(ctx, tokens):
+class TokenIndex(object):
+    """
+    A precomputed index over the stream of tokens representing a model, such that the comments which belong to a
+    context can be found without searching the whole stream.
+    Attributes:
+        tokens (list): A list of all tokens representing the model.
+        first_definition (int): The index of the first token on the default channel, i.e., the first definition.
+        next_newline (list): For each position, the index of the next token on the newline channel, or None.
+        next_comment (list): For each position, the index of the next token on the comment channel, or None.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.next_newline = [None] * (len(tokens) + 1)
+        self.next_comment = [None] * (len(tokens) + 1)
+        self.first_definition = len(tokens)
+        for i in range(len(tokens) - 1, -1, -1):
+            self.next_newline[i] = i if tokens[i].channel == 3 else self.next_newline[i + 1]
+            self.next_comment[i] = i if tokens[i].channel == 2 else self.next_comment[i + 1]
+            if tokens[i].channel == 0:
+                self.first_definition = i
+
+
+def get_comments(ctx, index):
     """
     Returns all previously, in-line and pos comments.
     :param ctx: a context
     :type ctx: ctx
-    :param tokens: list of token objects
-    :type tokens: list(Tokens)
+    :param index: the index of the tokens, None if no comments are collected
+    :type index: TokenIndex
     :return: a list of comments
     :rtype: list(str)
     """
     ret = list()
-    pre_comments = get_pre_comment(ctx, tokens)
-    in_comment = get_in_comments(ctx, tokens)
-    post_comments = get_post_comments(ctx, tokens)
+    pre_comments = get_pre_comment(ctx, index)
+    in_comment = get_in_comments(ctx, index)
+    post_comments = get_post_comments(ctx, index)
     if pre_comments is not None:
         ret.extend(pre_comments)
     if in_comment is not None:
@@ -170,22 +198,25 @@ def get_comments(ctx, tokens):
     return ret
 
 
-def get_pre_comment(ctx, tokens):
+def get_pre_comment(ctx, index):
     """
     Returns the comment which has been stated before this element but also before the next previous token.
     :param ctx: a context
     :type ctx: ctx
-    :param tokens: list of token objects
-    :type tokens: list(Tokens)
+    :param index: the index of the tokens, None if no comments are collected
+    :type index: TokenIndex
     :return: the corresponding comment or None
     :rtype: str
     """
-    # first find the position of this token in the stream
     comments = list()
-    empty_before = __no_definitions_before(ctx, tokens)
+    if index is None:
+        return comments
+    empty_before = __no_definitions_before(ctx, index)
     eol = False
     temp = None
-    for possibleCommentToken in reversed(tokens[0:tokens.index(ctx.start)]):
+    # walk backwards from the start of this element, the position of its first token is stored in the token itself
+    for position in range(ctx.start.tokenIndex - 1, -1, -1):
+        possibleCommentToken = index.tokens[position]
         # if we hit a normal token (i.e. not whitespace, not newline and not token) then stop, since we reached
         # the next previous element, thus the next comments belong to this element
         if possibleCommentToken.channel == 0:
@@ -217,61 +248,61 @@ def get_pre_comment(ctx, tokens):
     return list(reversed(comments)) if len(comments) > 0 else list()
 
 
-def __no_definitions_before(ctx, tokens):
+def __no_definitions_before(ctx, index):
     """
     This method indicates whether before the start of ctx, something has been defined, e.g. a different neuron.
     This method is used to identify the start of a model.
     :param ctx: a context
     :type ctx: ctx
-    :param tokens: list of token objects
-    :type tokens: list(Tokens)
+    :param index: the index of the tokens, None if no comments are collected
+    :type index: TokenIndex
     :return: True if nothing defined before, otherwise False.
     :rtype: bool
     """
-    for token in tokens[0:tokens.index(ctx.start)]:
-        if token.channel == 0:
-            return False
-    return True
+    return ctx.start.tokenIndex <= index.first_definition
 
 
-def get_in_comments(ctx, tokens):
+def get_in_comments(ctx, index):
     """
     Returns the sole comment if one is defined in the same line, e.g. function a mV = 10mV # comment
     :param ctx: a context
     :type ctx: ctx
-    :param tokens: list of token objects
-    :type tokens: list(Tokens)
+    :param index: the index of the tokens, None if no comments are collected
+    :type index: TokenIndex
     :return: a comment
     :rtype: str
     """
-    for possibleComment in tokens[tokens.index(ctx.start):]:
-        if possibleComment.channel == 2:
-            return replace_delimiters(possibleComment.text)
-        if possibleComment.channel == 3:  # channel 3 == new line, thus the one line comment ends here
-            break
+    if index is None:
+        return None
+    comment = index.next_comment[ctx.start.tokenIndex]
+    newline = index.next_newline[ctx.start.tokenIndex]
+    # channel 3 == new line, thus the one line comment ends there
+    if comment is not None and (newline is None or comment < newline):
+        return replace_delimiters(index.tokens[comment].text)
     return None
 
 
-def get_post_comments(ctx, tokens):
+def get_post_comments(ctx, index):
     """
     Returns the comment which has been stated after the current token but in the same line.
     :param ctx: a context
     :type ctx: ctx
-    :param tokens: list of token objects
-    :type tokens: list(Tokens)
+    :param index: the index of the tokens, None if no comments are collected
+    :type index: TokenIndex
     :return: the corresponding comment or None
     :rtype: str
     """
     comments = list()
-    next_line_start_index = -1
+    if index is None:
+        return comments
     # first find out where the next line start, since we want to avoid to see comments, which have
     # been stated in the same line, as comments which are stated after the element
-    for possibleToken in tokens[tokens.index(ctx.stop) + 1:]:
-        if possibleToken.channel == 3:
-            next_line_start_index = tokens.index(possibleToken)
-            break
+    next_line_start_index = index.next_newline[ctx.stop.tokenIndex + 1]
+    if next_line_start_index is None:
+        next_line_start_index = len(index.tokens) - 1
     first_line = False
-    for possibleCommentToken in tokens[next_line_start_index:]:
+    for position in range(next_line_start_index, len(index.tokens)):
+        possibleCommentToken = index.tokens[position]
         if possibleCommentToken.channel == 2:
             # if it is a comment on the comment channel -> get it
             comments.append(replace_delimiters(possibleCommentToken.text))
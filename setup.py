@@ -20,9 +20,11 @@
 from setuptools import setup, find_packages
 import sys
 
+from pynestml import __version__
+
 setup(
     name='PyNestML',
-    version='0.1.2.2',
+    version=__version__,
     description='NestML is a domain specific language that supports the specification of neuron models in a'
                 ' precise and concise syntax, based on the syntax of Python. Model equations can either be given'
                 ' as a simple string of mathematical notation or as an algorithm written in the built-in procedural'
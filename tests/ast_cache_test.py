@@ -0,0 +1,80 @@
+#
+# ast_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.ast_cache import ASTCache
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.profiler import Profiler
+
+
+class ASTCacheTest(unittest.TestCase):
+    """
+    Tests if unchanged models are loaded from the cache instead of being parsed again.
+    """
+
+    def setUp(self):
+        self.cache_path = tempfile.mkdtemp()
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            ASTCache.init_ast_cache(self.cache_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_path)
+
+    def test_unchanged_model_is_loaded_from_cache(self):
+        model = os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_alpha.nestml')
+        with self.session:
+            Profiler.init_profiler(True)
+            parsed = ModelParser.parse_model(model)
+            self.assertEqual(len(os.listdir(self.cache_path)), 1)
+            self.assertIn('parsing', Profiler.records['iaf_psc_alpha.nestml'])
+            Profiler.init_profiler(True)
+            loaded = ModelParser.parse_model(model)
+            self.assertNotIn('parsing', Profiler.records['iaf_psc_alpha.nestml'])
+            # the symbol tables are constructed for the cached AST as well
+            self.assertIsNotNone(loaded.get_neuron_list()[0].get_scope())
+            self.assertEqual(str(loaded), str(parsed))
+
+    def test_model_with_messages_is_not_cached(self):
+        model = os.path.join(os.path.dirname(__file__), 'invalid', 'CoCoEachBlockUnique.nestml')
+        with self.session:
+            ModelParser.parse_model(model)
+            self.assertEqual(os.listdir(self.cache_path), [])
+
+    def test_key_depends_on_content(self):
+        model = os.path.join(self.cache_path, 'model.nestml')
+        with open(model, 'w') as f:
+            f.write('neuron a:\nend\n')
+        key = ASTCache.compute_key(model)
+        with open(model, 'w') as f:
+            f.write('neuron b:\nend\n')
+        self.assertNotEqual(ASTCache.compute_key(model), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
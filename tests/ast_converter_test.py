@@ -0,0 +1,160 @@
+#
+# ast_converter_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import ast
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.solver.ast_converter import ASTConverter
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+def structure(expression):
+    """
+    Returns a nested tuple representation of the handed over expression, such that the structure of two
+    expressions can be compared, e.g., a left and a right associative expression result in different tuples.
+    """
+    if isinstance(expression, ASTSimpleExpression):
+        if expression.is_function_call():
+            return (expression.get_function_call().get_name(),
+                    tuple(structure(arg) for arg in expression.get_function_call().get_args()))
+        return str(expression)
+    if expression.is_compound_expression():
+        return structure(expression.get_lhs()), str(expression.get_binary_operator()), structure(expression.get_rhs())
+    if expression.is_encapsulated:
+        return '()', structure(expression.get_expression())
+    if expression.is_logical_not:
+        return 'not', structure(expression.get_expression())
+    return str(expression.get_unary_operator()), structure(expression.get_expression())
+
+
+class ASTConverterTest(unittest.TestCase):
+    """
+    Tests if solver results converted directly to meta_model nodes are equal to the parsed ones.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+
+    def test_expressions(self):
+        expressions = ['(exp(-__h/Tau)) * V_abs+ ((I_e + currents)/C_m) * (Tau - Tau*exp(-__h/Tau))',
+                       '-1/tau_syn_in**2 * g_in + -2/tau_syn_in * g_in__d', 'e*nS/tau_syn_in', '0', '1.5e-3 * x',
+                       '((a))', 'f((a), b)', '-a**-b**2', 'a - b - c', 'a / b / c', 'min(a, (b+c)*d)', 'a <= b',
+                       'not a', 'inf', '(a)*(b)']
+        with self.session:
+            for expression in expressions:
+                converted = ASTConverter.convert_expression(expression)
+                self.assertEqual(structure(converted), structure(ModelParser.parse_expression(expression)))
+                self.assertTrue(converted.get_source_position().is_added_source_position())
+
+    def test_exponent_with_leading_zero(self):
+        # python prints small numbers as 5e-05, which the NESTML lexer splits into 5e-0 and 5
+        with self.session:
+            converted = ASTConverter.convert_expression('5e-05 / ms')
+            self.assertEqual(converted.get_lhs().get_numeric_literal(), 5e-05)
+            self.assertEqual(converted.get_rhs().get_variable().get_name(), 'ms')
+
+    def test_without_source_segments(self):
+        # older versions of python provide no source segments, the result must not depend on them
+        get_source_segment = getattr(ast, 'get_source_segment', None)
+        if get_source_segment is not None:
+            del ast.get_source_segment
+        try:
+            with self.session:
+                self.assertEqual(str(ASTConverter.convert_expression('5e-05/1.0')), '5e-05 / 1.0')
+                expression = '((a)) * -(b + c)**2'
+                self.assertEqual(structure(ASTConverter.convert_expression(expression)),
+                                 structure(ModelParser.parse_expression(expression)))
+                stmt = ASTConverter.convert_stmt('V_m += (1 - 5e-05) * I_e')
+                self.assertEqual(str(stmt.small_stmt.get_assignment()).strip(), 'V_m += (1 - 5e-05) * I_e')
+        finally:
+            if get_source_segment is not None:
+                ast.get_source_segment = get_source_segment
+
+    def test_fallback(self):
+        # chained comparisons are not converted but parsed
+        with self.session:
+            converted = ASTConverter.convert_expression('a < b < c')
+            self.assertEqual(structure(converted), structure(ModelParser.parse_expression('a < b < c')))
+            self.assertEqual(len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)), 0)
+
+    def test_stmts(self):
+        stmts = ['V_abs = __P11 * V_abs + __P12 * (I_syn)', 'V_abs += (a + b) * c', 'g_ex -= g_in']
+        with self.session:
+            for stmt in stmts:
+                converted = ASTConverter.convert_stmt(stmt).small_stmt.get_assignment()
+                parsed = ModelParser.parse_stmt(stmt).small_stmt.get_assignment()
+                self.assertEqual(str(converted), str(parsed))
+                self.assertEqual(structure(converted.get_expression()), structure(parsed.get_expression()))
+
+    def test_convert_stmts(self):
+        # a statement which is not supported is parsed on its own, the others are converted in one batch
+        stmts = ['V_abs = __P11 * V_abs + __P12 * (I_syn)', 'V_abs += (a + b) * c', 'a = b < c < d', 'g_ex -= g_in']
+        with self.session:
+            converted = ASTConverter.convert_stmts(stmts)
+            self.assertEqual(len(converted), len(stmts))
+            for stmt, converted_stmt in zip(stmts, converted):
+                converted_assignment = converted_stmt.small_stmt.get_assignment()
+                parsed = ModelParser.parse_stmt(stmt).small_stmt.get_assignment()
+                self.assertEqual(str(converted_assignment), str(parsed))
+                self.assertEqual(structure(converted_assignment.get_expression()),
+                                 structure(parsed.get_expression()))
+
+    def test_convert_stmts_without_model_parser(self):
+        stmts = ['V_abs = __P11 * V_abs + __P12 * (I_syn)', 'integrate_odes()', 'g_ex += 5e-05 * spikes']
+        parse_stmt = ModelParser.__dict__['parse_stmt']
+        get_source_segment = getattr(ast, 'get_source_segment', None)
+        if get_source_segment is not None:
+            del ast.get_source_segment
+
+        def fail(cls, string):
+            raise AssertionError(string)
+
+        ModelParser.parse_stmt = classmethod(fail)
+        try:
+            with self.session:
+                converted = ASTConverter.convert_stmts(stmts)
+        finally:
+            ModelParser.parse_stmt = parse_stmt
+            if get_source_segment is not None:
+                ast.get_source_segment = get_source_segment
+        self.assertEqual([str(stmt).strip() for stmt in converted],
+                         ['V_abs = __P11 * V_abs + __P12 * (I_syn)', 'integrate_odes()', 'g_ex += 5e-05 * spikes'])
+        self.assertEqual(converted[1].small_stmt.get_function_call().get_name(), 'integrate_odes')
+
+    def test_substitute_variable(self):
+        with self.session:
+            expression = ModelParser.parse_expression('I_syn + f(I_syn) * I_syn\'')
+            definition = ModelParser.parse_expression('g * (V_m - E)')
+            expression = ASTConverter.substitute_variable(expression, 'I_syn', definition)
+            self.assertEqual(str(expression), '(g * (V_m - E)) + f((g * (V_m - E))) * I_syn\'')
+            self.assertTrue(isinstance(expression, ASTExpression))
+            # the definition is copied, not shared
+            self.assertIsNot(expression.get_lhs().get_expression(), definition)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#
+# ast_deep_traversal_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import sys
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.real_type_symbol import RealTypeSymbol
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.fast_expression_parser import FastExpressionParser
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class CountingVisitor(ASTVisitor):
+    """
+    Counts the visited variables and checks that each expression is endvisited after its operands.
+    """
+
+    def __init__(self):
+        super(CountingVisitor, self).__init__()
+        self.variables = 0
+        self.open_expressions = list()
+
+    def visit_variable(self, node):
+        self.variables += 1
+
+    def visit_expression(self, node):
+        self.open_expressions.append(node)
+
+    def endvisit_expression(self, node):
+        assert self.open_expressions.pop() is node
+
+
+class OverridingVisitor(CountingVisitor):
+    """
+    Overrides the traversal of expressions, such that only the left-hand sides are traversed.
+    """
+
+    def traverse_expression(self, node):
+        if node.get_lhs() is not None:
+            node.get_lhs().accept(self.get_real_self())
+
+
+class ASTDeepTraversalTest(unittest.TestCase):
+    """
+    Tests that the depth of expressions is not limited by the recursion limit, e.g., for long sums of conductances.
+    """
+
+    def setUp(self):
+        with CompilationSession():
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            # the sum is nested to the left, i.e., its depth is the number of terms
+            self.terms = 2 * sys.getrecursionlimit()
+            self.expression = FastExpressionParser.parse(' + '.join('g_%d' % i for i in range(self.terms)))
+
+    def test_deep_expression(self):
+        visitor = CountingVisitor()
+        self.expression.accept(visitor)
+        self.assertEqual(visitor.variables, self.terms)
+        self.assertEqual(visitor.open_expressions, [])
+        self.assertEqual(len(ASTUtils.get_all(self.expression, ASTVariable)), self.terms)
+        self.assertEqual(len(ASTUtils.get_all(self.expression, ASTExpression)), self.terms - 1)
+
+    def test_overridden_traversal(self):
+        # the overridden method recurses as before, thus a shorter sum is used
+        expression = FastExpressionParser.parse('a + b + c')
+        visitor = OverridingVisitor()
+        expression.accept(visitor)
+        self.assertEqual(visitor.variables, 1)
+        self.assertEqual(visitor.open_expressions, [])
+
+    def test_deep_model(self):
+        # the model is parsed by ANTLR, built and checked, including the derivation of the type of the sum
+        parameters = ''.join('    g_%d real = %d.5\n' % (i, i) for i in range(10))
+        model = ('neuron deep:\n  state:\n    x real = 0.0\n  end\n  parameters:\n' + parameters + '  end\n'
+                 '  input:\n    spikes pA <- spike\n  end\n  output: spike\n'
+                 '  update:\n    x = ' + ' + '.join('g_%d' % (i % 10) for i in range(self.terms)) + '\n  end\nend\n')
+        with CompilationSession():
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            ast = ModelParser.parse_model(model, from_string=True)
+            self.assertEqual(Logger.get_all_messages_of_level(LoggingLevel.ERROR), [])
+            self.assertEqual(Logger.get_all_messages_of_level(LoggingLevel.WARNING), [])
+            assignment = ASTUtils.get_all(ast, ASTAssignment)[0]
+            self.assertEqual(len(ASTUtils.get_all(assignment, ASTVariable)), self.terms + 1)
+            self.assertIsInstance(assignment.get_expression().type, RealTypeSymbol)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#
+# ast_memory_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+class ASTMemoryBenchmarkTest(unittest.TestCase):
+    """
+    Checks that the nodes of the ASTs of all models in the models directory are stored without a per-instance
+    dictionary. The memory held by the ASTs is reported by the ast_memory benchmark in tools/benchmark.py.
+    """
+
+    def test_nodes_without_dictionary(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models'))
+        with CompilationSession():
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            asts = [ModelParser.parse_model(os.path.join(models_path, model))
+                    for model in sorted(os.listdir(models_path)) if model.endswith('.nestml')]
+            nodes = [node for ast in asts for node in ASTUtils.get_all(ast, ASTNode)]
+        self.assertGreater(len(nodes), 0)
+        self.assertTrue(all(not hasattr(node, '__dict__') for node in nodes))
+        self.assertTrue(all(not hasattr(node.get_source_position(), '__dict__') for node in nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
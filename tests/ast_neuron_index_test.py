@@ -0,0 +1,99 @@
+#
+# ast_neuron_index_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_ode_shape import ASTOdeShape
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.utils.ast_helper import ASTHelper
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+model = """
+neuron test:
+  state:
+    x real = a + b
+  end
+  initial_values:
+    V_m mV = 0 mV
+  end
+  equations:
+    shape g = exp(-t)
+  end
+end
+"""
+
+
+class ASTNeuronIndexTest(unittest.TestCase):
+    """
+    Tests that the index of nodes kept by each neuron corresponds to the tree, also after the tree has been modified.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            self.neuron = ModelParser.parse_model(model, from_string=True).get_neuron_list()[0]
+
+    def get_all_by_traversal(self, node_type):
+        ret = list()
+        self.neuron.accept(ASTHigherOrderVisitor(visit_funcs=lambda node: ret.append(node)
+                                                 if isinstance(node, node_type) else None))
+        return ret
+
+    def test_nodes_of_type(self):
+        with self.session:
+            for node_type in (ASTVariable, ASTDeclaration, ASTOdeShape):
+                self.assertEqual(ASTUtils.get_all(self.neuron, node_type), self.get_all_by_traversal(node_type))
+            # the returned lists can be modified without affecting the index
+            ASTUtils.get_all(self.neuron, ASTVariable).clear()
+            self.assertEqual(ASTUtils.get_all(self.neuron, ASTVariable), self.get_all_by_traversal(ASTVariable))
+
+    def test_modification_invalidates_index(self):
+        with self.session:
+            variables = ASTUtils.get_all(self.neuron, ASTVariable)
+            equations_block = ASTHelper.get_equations_block_from_neuron(self.neuron)
+            self.assertEqual(len(ASTHelper.get_ode_shapes_from_equations_block(equations_block)), 1)
+            # adding a declaration to a block updates the index
+            declaration = ModelParser.parse_declaration('y real = x')
+            ASTHelper.add_to_initial_values_block(self.neuron, declaration)
+            self.assertEqual(ASTUtils.get_all(self.neuron, ASTVariable), self.get_all_by_traversal(ASTVariable))
+            self.assertEqual(len(ASTUtils.get_all(self.neuron, ASTVariable)), len(variables) + 2)
+            # so does replacing an expression by a setter
+            declaration.set_expression(ASTNodeFactory.create_ast_simple_expression(
+                    numeric_literal=1, source_position=ASTSourceLocation.get_added_source_position()))
+            self.assertEqual(ASTUtils.get_all(self.neuron, ASTVariable), self.get_all_by_traversal(ASTVariable))
+            ASTHelper.add_shape(self.neuron, ModelParser.parse_ode_shape('shape h = exp(-t)'))
+            self.assertEqual(len(ASTHelper.get_ode_shapes_from_equations_block(equations_block)), 2)
+            # as well as removing blocks
+            ASTHelper.remove_equations_block_from_neuron(self.neuron)
+            self.assertIsNone(ASTHelper.get_equations_block_from_neuron(self.neuron))
+            self.assertEqual(ASTUtils.get_all(self.neuron, ASTOdeShape), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#
+# ast_parent_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_parent_collector_visitor import ASTParentCollectorVisitor
+
+
+class ASTParentTest(unittest.TestCase):
+    """
+    Tests that the parent references of the nodes correspond to the structure of the tree, also after the tree has
+    been modified directly.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+
+    def test_parents_of_parsed_model(self):
+        model = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_cond_alpha.nestml'))
+        with self.session:
+            neuron = ModelParser.parse_model(model).get_neuron_list()[0]
+            for node in ASTUtils.get_all(neuron.get_body(), ASTNode):
+                collector = ASTParentCollectorVisitor(node)
+                neuron.accept(collector)
+                self.assertIs(node.get_parent(), collector.parent)
+                self.assertIs(ASTUtils.get_parent(neuron, node), collector.parent)
+
+    def test_outdated_parent(self):
+        with self.session:
+            neuron = ModelParser.parse_model('neuron test:\n  state:\n    x real = a + b\n  end\nend\n',
+                                             from_string=True).get_neuron_list()[0]
+            declaration = neuron.get_body().get_body_elements()[0].get_declarations()[0]
+            expression = declaration.get_expression()
+            # a node which is put into the tree directly has no parent reference, it is restored on demand
+            rhs = ASTNodeFactory.create_ast_simple_expression(
+                    numeric_literal=1, source_position=ASTSourceLocation.get_added_source_position())
+            old_rhs = expression.rhs
+            expression.rhs = rhs
+            self.assertIsNone(rhs.get_parent())
+            self.assertIs(ASTUtils.get_parent(neuron, rhs), expression)
+            # the removed node still references its former parent, which does not contain it anymore
+            self.assertIs(old_rhs.get_parent(), expression)
+            self.assertIsNone(ASTUtils.get_parent(neuron, old_rhs))
+            # setters keep the references up to date
+            declaration.set_expression(old_rhs)
+            self.assertIs(ASTUtils.get_parent(neuron, old_rhs), declaration)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+#
+# ast_visitor_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
+from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_bit_operator import ASTBitOperator
+from pynestml.meta_model.ast_block import ASTBlock
+from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
+from pynestml.meta_model.ast_body import ASTBody
+from pynestml.meta_model.ast_comparison_operator import ASTComparisonOperator
+from pynestml.meta_model.ast_compound_stmt import ASTCompoundStmt
+from pynestml.meta_model.ast_constraint import ASTConstraint
+from pynestml.meta_model.ast_constraints_block import ASTConstraintsBlock
+from pynestml.meta_model.ast_data_type import ASTDataType
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.meta_model.ast_elif_clause import ASTElifClause
+from pynestml.meta_model.ast_else_clause import ASTElseClause
+from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_for_stmt import ASTForStmt
+from pynestml.meta_model.ast_function import ASTFunction
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_if_clause import ASTIfClause
+from pynestml.meta_model.ast_if_stmt import ASTIfStmt
+from pynestml.meta_model.ast_input_block import ASTInputBlock
+from pynestml.meta_model.ast_input_line import ASTInputLine
+from pynestml.meta_model.ast_input_type import ASTInputType
+from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
+from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
+from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
+from pynestml.meta_model.ast_ode_function import ASTOdeFunction
+from pynestml.meta_model.ast_ode_shape import ASTOdeShape
+from pynestml.meta_model.ast_output_block import ASTOutputBlock
+from pynestml.meta_model.ast_parameter import ASTParameter
+from pynestml.meta_model.ast_return_stmt import ASTReturnStmt
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_small_stmt import ASTSmallStmt
+from pynestml.meta_model.ast_stmt import ASTStmt
+from pynestml.meta_model.ast_unary_operator import ASTUnaryOperator
+from pynestml.meta_model.ast_unit_type import ASTUnitType
+from pynestml.meta_model.ast_update_block import ASTUpdateBlock
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+# the classes with the names of their methods, as checked one after another by the chain of isinstance checks
+dispatch_order = (
+    (ASTArithmeticOperator, 'arithmetic_operator'),
+    (ASTAssignment, 'assignment'),
+    (ASTBitOperator, 'bit_operator'),
+    (ASTBlock, 'block'),
+    (ASTBlockWithVariables, 'block_with_variables'),
+    (ASTBody, 'body'),
+    (ASTComparisonOperator, 'comparison_operator'),
+    (ASTCompoundStmt, 'compound_stmt'),
+    (ASTDataType, 'data_type'),
+    (ASTDeclaration, 'declaration'),
+    (ASTElifClause, 'elif_clause'),
+    (ASTElseClause, 'else_clause'),
+    (ASTEquationsBlock, 'equations_block'),
+    (ASTExpression, 'expression'),
+    (ASTForStmt, 'for_stmt'),
+    (ASTFunction, 'function'),
+    (ASTFunctionCall, 'function_call'),
+    (ASTIfClause, 'if_clause'),
+    (ASTIfStmt, 'if_stmt'),
+    (ASTInputBlock, 'input_block'),
+    (ASTInputLine, 'input_line'),
+    (ASTInputType, 'input_type'),
+    (ASTLogicalOperator, 'logical_operator'),
+    (ASTNestMLCompilationUnit, 'compilation_unit'),
+    (ASTNeuron, 'neuron'),
+    (ASTOdeEquation, 'ode_equation'),
+    (ASTOdeFunction, 'ode_function'),
+    (ASTOdeShape, 'ode_shape'),
+    (ASTOutputBlock, 'output_block'),
+    (ASTParameter, 'parameter'),
+    (ASTReturnStmt, 'return_stmt'),
+    (ASTSimpleExpression, 'simple_expression'),
+    (ASTSmallStmt, 'small_stmt'),
+    (ASTUnaryOperator, 'unary_operator'),
+    (ASTUnitType, 'unit_type'),
+    (ASTUpdateBlock, 'update_block'),
+    (ASTVariable, 'variable'),
+    (ASTWhileStmt, 'while_stmt'),
+    (ASTStmt, 'stmt'),
+    (ASTConstraint, 'constraint'),
+    (ASTConstraintsBlock, 'constraints_block'),
+)
+chain = tuple((cls, ('visit_' + name, 'traverse_' + name, 'endvisit_' + name)) for cls, name in dispatch_order)
+
+
+class RecordingVisitor(ASTVisitor):
+    """
+    Records the names of the dispatched methods together with the nodes.
+    """
+
+    def __init__(self):
+        super(RecordingVisitor, self).__init__()
+        self.calls = list()
+
+
+def create_recording_method(name):
+    def record(self, node):
+        self.calls.append((name, node))
+    return record
+
+
+for _, method_name in dispatch_order:
+    for prefix in ('visit_', 'endvisit_'):
+        setattr(RecordingVisitor, prefix + method_name, create_recording_method(prefix + method_name))
+
+
+class ChainVisitor(ASTVisitor):
+    """
+    Dispatches by checking the classes one after another, as done before the dispatch table was introduced.
+    """
+
+    def dispatch(self, node, index):
+        for cls, names in chain:
+            if isinstance(node, cls):
+                getattr(self, names[index])(node)
+                return
+
+    def visit(self, node):
+        self.dispatch(node, 0)
+
+    def traverse(self, node):
+        self.dispatch(node, 1)
+
+    def endvisit(self, node):
+        self.dispatch(node, 2)
+
+
+class RecordingChainVisitor(ChainVisitor, RecordingVisitor):
+    pass
+
+
+class ASTVisitorBenchmarkTest(unittest.TestCase):
+    """
+    Checks that the dispatch table calls the same methods as the chain of isinstance checks on the ASTs of all models
+    in the models directory. The traversal times are reported by the visitor_dispatch benchmark in tools/benchmark.py.
+    """
+
+    def setUp(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models'))
+        with CompilationSession():
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            self.asts = [ModelParser.parse_model(os.path.join(models_path, model))
+                         for model in sorted(os.listdir(models_path)) if model.endswith('.nestml')]
+
+    def test_same_dispatch(self):
+        for ast in self.asts:
+            table = RecordingVisitor()
+            chain = RecordingChainVisitor()
+            ast.accept(table)
+            ast.accept(chain)
+            self.assertGreater(len(table.calls), 0)
+            self.assertEqual(table.calls, chain.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
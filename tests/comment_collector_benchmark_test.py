@@ -0,0 +1,78 @@
+#
+# comment_collector_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from antlr4 import CommonTokenStream, InputStream
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import parse_rule
+from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+
+
+def create_model(declarations):
+    """
+    Creates a synthetic model with the handed over number of commented declarations, split into state blocks of
+    50 declarations each.
+    """
+    lines = ['/* synthetic model */', 'neuron synthetic:']
+    for i in range(declarations):
+        if i % 50 == 0:
+            lines.append('  state:')
+        lines.append('    # pre comment %d' % i)
+        lines.append('    x_%d mV = %d mV # in comment %d' % (i, i, i))
+        if i % 5 == 0:
+            lines.append('')
+        if i % 50 == 49:
+            lines.append('  end')
+    lines.append('end')
+    return '\n'.join(lines) + '\n'
+
+
+class CommentCollectorBenchmarkTest(unittest.TestCase):
+    """
+    Checks the collection of comments on synthetic models with thousands of declarations. The time required, which
+    grows linearly with the length of the model, is reported by the comment_collection benchmark in tools/benchmark.py.
+    """
+
+    def build(self, declarations):
+        stream = CommonTokenStream(PyNestMLLexer(InputStream(create_model(declarations))))
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        compilation_unit = parse_rule(parser, parser.nestMLCompilationUnit)
+        return ASTBuilderVisitor(stream.tokens).visit(compilation_unit)
+
+    def test_comment_collection(self):
+        with CompilationSession():
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            large_ast = self.build(4000)
+        declarations = [declaration for block in large_ast.get_neuron_list()[0].get_body().get_body_elements()
+                        for declaration in block.get_declarations()]
+        self.assertEqual(len(declarations), 4000)
+        for i in (0, 5, 1235, 3995):
+            self.assertEqual(declarations[i].get_comment(), [' pre comment %d' % i, ' in comment %d' % i])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -90,6 +90,21 @@ class CommentTest(unittest.TestCase):
         self.assertEqual(neuron_body_elements[7].constraints[0].get_comment()[1], 'constraint in ok')
         self.assertEqual(neuron_body_elements[7].constraints[0].get_comment()[2], 'constraint post ok')
 
+    def test_without_comments(self):
+        input_file = FileStream(
+            os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), 'resources')),
+                         'CommentTest.nestml'))
+        stream = CommonTokenStream(PyNestMLLexer(input_file))
+        stream.fill()
+        compilation_unit = PyNestMLParser(stream).nestMLCompilationUnit()
+        # comments are not required, e.g., for a dry run
+        ast = ASTBuilderVisitor(stream.tokens, collect_comments=False).visit(compilation_unit)
+        neuron_body_elements = ast.get_neuron_list()[0].get_body().get_body_elements()
+        self.assertFalse(neuron_body_elements[0].has_comment())
+        self.assertFalse(neuron_body_elements[0].get_declarations()[0].has_comment())
+        self.assertEqual(neuron_body_elements[0].get_declarations()[0].pre_comments, list())
+        self.assertIsNone(neuron_body_elements[0].get_declarations()[0].in_comment)
+
 
 if __name__ == '__main__':
     unittest.main()
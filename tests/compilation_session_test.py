@@ -0,0 +1,108 @@
+#
+# compilation_session_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import to_nest
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class CompilationSessionTest(unittest.TestCase):
+    """
+    Tests if several compilations can be processed concurrently in sessions of their own.
+    """
+
+    def test_state_is_isolated(self):
+        Logger.init_logger(LoggingLevel.NO)
+        with CompilationSession() as session:
+            self.assertIs(CompilationSession.get_current(), session)
+            Logger.init_logger(LoggingLevel.INFO)
+            Logger.log_message(message='in session', log_level=LoggingLevel.INFO)
+            self.assertEqual(len(Logger.get_log()), 1)
+        self.assertIsNot(CompilationSession.get_current(), session)
+        self.assertEqual(Logger.logging_level, LoggingLevel.NO)
+        self.assertEqual(len(Logger.get_log()), 0)
+
+    def test_session_per_call_is_opt_in(self):
+        model = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_delta.nestml'))
+        directory = tempfile.mkdtemp()
+        try:
+            with CompilationSession() as active:
+                Logger.init_logger(LoggingLevel.NO)
+                # by default, the state of the last call remains accessible in the active session
+                self.assertIs(to_nest(path=model, target=directory, dry=True, logging_level='NO'), active)
+                self.assertEqual(FrontendConfiguration.get_target_path(), directory)
+                messages = len(Logger.get_log())
+                self.assertGreater(messages, 0)
+                # a handed over session isolates the call, the active session is left untouched
+                isolated = to_nest(path=model, target=os.path.join(directory, 'isolated'), dry=True,
+                                   logging_level='NO', session=CompilationSession())
+                self.assertIsNot(isolated, active)
+                self.assertIs(CompilationSession.get_current(), active)
+                self.assertEqual(FrontendConfiguration.get_target_path(), directory)
+                self.assertEqual(len(Logger.get_log()), messages)
+                with isolated:
+                    self.assertEqual(FrontendConfiguration.get_target_path(), os.path.join(directory, 'isolated'))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_concurrent_sessions(self):
+        models = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models'))
+        model_files = ['iaf_psc_alpha.nestml', 'iaf_psc_delta.nestml', 'iaf_cond_exp.nestml', 'izhikevich.nestml']
+        directory = tempfile.mkdtemp()
+        sessions = dict()
+        errors = list()
+
+        def compile_model(model_file):
+            try:
+                sessions[model_file] = to_nest(path=os.path.join(models, model_file),
+                                               target=os.path.join(directory, model_file), dry=True,
+                                               logging_level='NO', session=CompilationSession())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=compile_model, args=(model_file,)) for model_file in model_files]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(errors, [])
+        for model_file, session in sessions.items():
+            with session:
+                # each session only contains the messages, configuration and neurons of its own model
+                artifacts = set(entry[0] for entry in Logger.get_log().values()) - {'GLOBAL'}
+                self.assertEqual(artifacts, {model_file})
+                self.assertEqual(Logger.get_all_messages_of_level(LoggingLevel.ERROR), [])
+                self.assertEqual(FrontendConfiguration.get_files(), [os.path.join(models, model_file)])
+                for neuron_name in SymbolTable.name2neuron_scope.keys():
+                    self.assertTrue(neuron_name.startswith(model_file[:-len('.nestml')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#
+# compile_server_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from pynestml.frontend.compile_server import CompileServer
+
+
+class CompileServerTest(unittest.TestCase):
+    """
+    Tests if the compile server processes several jobs and reports their logs.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.directory, 'pynestml.sock')
+        self.server = threading.Thread(target=CompileServer.serve, args=(self.socket_path,))
+        self.server.start()
+        for _ in range(600):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.1)
+
+    def test_compile_jobs(self):
+        models = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models'))
+        target = os.path.join(self.directory, 'target')
+        for model in ('iaf_psc_alpha.nestml', 'iaf_psc_delta.nestml'):
+            response = CompileServer.submit(self.socket_path, path=os.path.join(models, model), target=target,
+                                            dry=True, logging_level='INFO')
+            self.assertEqual(response['status'], 'ok')
+            self.assertTrue(len(response['log']) > 0)
+            # each job only reports its own messages
+            self.assertEqual(set(entry['filename'] for entry in response['log']) - {'GLOBAL'}, {model})
+        response = CompileServer.submit(self.socket_path, path=os.path.join(self.directory, 'missing.nestml'))
+        self.assertEqual(response['status'], 'error')
+
+    def tearDown(self):
+        CompileServer.submit(self.socket_path, command='shutdown')
+        self.server.join()
+        shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#
+# fast_expression_parser_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from antlr4 import CommonTokenStream, FileStream, ParseTreeWalker, ParseTreeListener
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.fast_expression_parser import FastExpressionParser
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import FragmentParser
+
+
+def dump(node):
+    """
+    Returns a representation of the handed over node and all its children which can be compared, source positions,
+    scopes and parent references are not part of it.
+    """
+    if isinstance(node, ASTNode):
+        # the attributes of nodes are slots, private ones, e.g., the cached type, are not compared
+        attributes = set(name for cls in type(node).__mro__ for name in getattr(cls, '__slots__', ())
+                         if not name.startswith('__'))
+        return type(node).__name__, tuple((key, dump(getattr(node, key, None))) for key in sorted(attributes)
+                                          if key not in ('source_position', 'sourcePosition', 'scope', 'parent'))
+    if isinstance(node, list):
+        return tuple(dump(element) for element in node)
+    return node
+
+
+class ExpressionCollector(ParseTreeListener):
+    """
+    Collects the source text of all expressions in a parse tree.
+    """
+
+    def __init__(self):
+        self.expressions = list()
+
+    def enterEveryRule(self, ctx):
+        if isinstance(ctx, PyNestMLParser.ExpressionContext):
+            self.expressions.append(ctx.start.getInputStream().getText(ctx.start.start, ctx.stop.stop))
+
+
+class FastExpressionParserTest(unittest.TestCase):
+    """
+    Tests if the hand-written parser builds the same ASTs as the ANTLR parser.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+
+    def assert_same_as_antlr(self, expression):
+        fast = FastExpressionParser.parse(expression)
+        if fast is not None:
+            self.assertEqual(dump(fast), dump(FragmentParser.parse(expression, 'expression')), expression)
+        return fast is not None
+
+    def test_expressions_in_models(self):
+        models = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models'))
+        collector = ExpressionCollector()
+        for model in sorted(os.listdir(models)):
+            if model.endswith('.nestml'):
+                stream = CommonTokenStream(PyNestMLLexer(FileStream(os.path.join(models, model), encoding='utf-8')))
+                ParseTreeWalker.DEFAULT.walk(collector, PyNestMLParser(stream).nestMLCompilationUnit())
+        with self.session:
+            parsed = [expression for expression in collector.expressions if self.assert_same_as_antlr(expression)]
+        self.assertGreater(len(parsed), len(collector.expressions) / 2)
+
+    def test_subset(self):
+        supported = ['10mV', '10 mV * 2', 'V_m\'\'', '-a**-b**2 * c', '1.e5 + .5 - 1.5E-3', '2e', 'inf', 'true',
+                     'exp(-t / tau) * (a + b)', 'max(a, min(b, 1), c) % 3', 'f()', '+ - a', '(((a)))']
+        unsupported = ['a < b', 'a and b', 'not a', 'a ? b : c', 'a # comment', '"string"', 'a b', '(a', '007',
+                       'a & b', 'end', '~a', '']
+        with self.session:
+            for expression in supported:
+                self.assertTrue(self.assert_same_as_antlr(expression), expression)
+            for expression in unsupported:
+                self.assertIsNone(FastExpressionParser.parse(expression), expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#
+# fragment_parser_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import threading
+import unittest
+from collections import OrderedDict
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import FragmentParser, ModelParser
+
+
+class FragmentParserTest(unittest.TestCase):
+    """
+    Tests if fragments parsed by the pooled parser and the memorized parse trees result in independent ASTs.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+
+    def test_recurring_fragment(self):
+        with self.session:
+            first = ModelParser.parse_declaration('V_m mV = E_L + I_e * R')
+            second = ModelParser.parse_declaration('V_m mV = E_L + I_e * R')
+            self.assertIn(('declaration', 'V_m mV = E_L + I_e * R'), FragmentParser.memo)
+            self.assertEqual(str(first), str(second))
+            # a new AST is built each time, thus modifications of one AST do not affect the other one
+            self.assertIsNot(first, second)
+            self.assertIsNot(first.get_expression(), second.get_expression())
+            first.get_variables()[0].set_name('V_abs')
+            self.assertEqual(second.get_variables()[0].get_name(), 'V_m')
+
+    def test_pooled_parser(self):
+        with self.session:
+            # simple expressions are parsed without ANTLR, thus a statement is used
+            ModelParser.parse_stmt('y = a + b')
+            parser = FragmentParser.local.parser
+            self.assertEqual(str(ModelParser.parse_stmt('x = y * 2')).strip(), 'x = y * 2')
+            self.assertIs(FragmentParser.local.parser, parser)
+
+    def test_syntax_errors_not_memorized(self):
+        with self.session:
+            ModelParser.parse_expression('(a + b')
+            errors = len(Logger.get_all_messages_of_level(LoggingLevel.ERROR))
+            self.assertGreater(errors, 0)
+            self.assertNotIn(('expression', '(a + b'), FragmentParser.memo)
+            ModelParser.parse_expression('(a + b')
+            self.assertEqual(len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)), 2 * errors)
+
+    def test_concurrent_sessions(self):
+        failures = list()
+
+        def parse(offset):
+            try:
+                with CompilationSession():
+                    init_predefined()
+                    Logger.init_logger(LoggingLevel.NO)
+                    for i in range(200):
+                        stmt = 'x = a + ' + str((offset + i) % 50)
+                        if str(ModelParser.parse_stmt(stmt)).strip() != stmt:
+                            failures.append(stmt)
+            except Exception as e:
+                failures.append(e)
+
+        memo, memo_size = FragmentParser.memo, FragmentParser.memo_size
+        # a small memo forces concurrent evictions
+        FragmentParser.memo, FragmentParser.memo_size = OrderedDict(), 8
+        try:
+            threads = [threading.Thread(target=parse, args=(offset,)) for offset in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertLessEqual(len(FragmentParser.memo), 8)
+        finally:
+            FragmentParser.memo, FragmentParser.memo_size = memo, memo_size
+        self.assertEqual(failures, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
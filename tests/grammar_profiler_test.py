@@ -0,0 +1,64 @@
+#
+# grammar_profiler_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import unittest
+
+from antlr4.atn.PredictionMode import PredictionMode
+
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.grammar_profiler import GrammarProfiler
+
+
+class GrammarProfilerTest(unittest.TestCase):
+    """
+    Tests that the grammar profiler collects the statistics of the decisions without affecting the parser.
+    """
+
+    model = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_alpha.nestml'))
+
+    def test_profile_model(self):
+        dfa_states = [len(dfa.states) for dfa in PyNestMLParser.decisionsToDFA]
+        profiler = GrammarProfiler()
+        profiler.profile_model(self.model)
+        infos = profiler.get_decision_infos()
+        self.assertEqual(profiler.syntax_errors, 0)
+        self.assertIn('expression', [info.rule_name for info in infos])
+        for info in infos:
+            self.assertGreater(info.invocations, 0)
+            # each prediction looks at least at the next token
+            self.assertGreaterEqual(info.sll_total_look, info.invocations)
+            self.assertLessEqual(info.sll_max_look, info.sll_total_look)
+        # the profiler uses a cache of its own, the one of the parser is not touched
+        self.assertEqual([len(dfa.states) for dfa in PyNestMLParser.decisionsToDFA], dfa_states)
+        report = json.loads(profiler.get_json_format())
+        self.assertEqual(len(report['decisions']), len(infos))
+
+    def test_sll_without_fallback(self):
+        profiler = GrammarProfiler(PredictionMode.SLL)
+        profiler.profile_model('neuron test:\n  update:\n    x = a + b * (c - d)\n  end\nend\n', from_string=True)
+        infos = profiler.get_decision_infos()
+        self.assertGreater(len(infos), 0)
+        self.assertTrue(all(info.ll_fallback == 0 and info.ll_atn_transitions == 0 for info in infos))
+        self.assertIn('Total parse time', profiler.get_table_format())
+
+
+if __name__ == '__main__':
+    unittest.main()
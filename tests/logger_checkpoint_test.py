@@ -0,0 +1,64 @@
+#
+# logger_checkpoint_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
+from pynestml.utils.model_parser import ModelParser
+
+
+class LoggerCheckpointTest(unittest.TestCase):
+    """
+    Tests the checkpoint and rollback of the log and checks that the log only references the neurons of previously
+    parsed models. The parse times are reported by the repeated_parsing benchmark in tools/benchmark.py.
+    """
+
+    def setUp(self):
+        self.session = CompilationSession()
+        with self.session:
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+
+    def test_rollback(self):
+        with self.session:
+            Logger.log_message(code=MessageCode.START_PROCESSING_FILE, message='kept', log_level=LoggingLevel.INFO)
+            checkpoint = Logger.checkpoint()
+            Logger.log_message(code=MessageCode.START_PROCESSING_FILE, message='discarded',
+                               log_level=LoggingLevel.INFO)
+            Logger.rollback(checkpoint)
+            Logger.log_message(code=MessageCode.START_PROCESSING_FILE, message='new', log_level=LoggingLevel.INFO)
+            self.assertEqual([entry[5] for entry in Logger.get_log().values()], ['kept', 'new'])
+            self.assertEqual(Logger.curr_message, 2)
+
+    def test_log_not_copied(self):
+        model = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_alpha.nestml'))
+        with self.session:
+            asts = [ModelParser.parse_model(model) for _ in range(3)]
+            # the log references the neurons of all previously parsed models, these must not be copied
+            self.assertIs(Logger.get_log()[Logger.curr_message - 1][1], asts[-1].get_neuron_list()[0])
+            for ast in asts:
+                self.assertTrue(any(entry[1] is ast.get_neuron_list()[0] for entry in Logger.get_log().values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#
+# model_watcher_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.model_watcher import ModelWatcher
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
+
+
+class ModelWatcherTest(unittest.TestCase):
+    """
+    Tests if the watch mode recompiles only modified models.
+    """
+
+    def setUp(self):
+        self.models_dir = os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models')))
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, 'models')
+        os.makedirs(self.path)
+        for model in ('iaf_psc_delta.nestml', 'izhikevich.nestml'):
+            shutil.copy(os.path.join(self.models_dir, model), self.path)
+        FrontendConfiguration.parse_config(['-path', self.path, '-target', os.path.join(self.work_dir, 'target'),
+                                            '-logging_level', 'NO'])
+        init_predefined()
+
+    def get_generated_neurons(self):
+        return [neuron.get_name() for (artifact_name, neuron, log_level, code, error_position, message)
+                in Logger.get_log().values() if code == MessageCode.CODE_SUCCESSFULLY_GENERATED]
+
+    def test_recompile_modified_models(self):
+        watcher = ModelWatcher()
+        self.assertTrue(watcher.update())
+        self.assertEqual(sorted(self.get_generated_neurons()), ['iaf_psc_delta_neuron', 'izhikevich_neuron'])
+        header = os.path.join(FrontendConfiguration.get_target_path(), 'iaf_psc_delta_neuron.h')
+        stamp = os.stat(header).st_mtime
+        # nothing has changed
+        self.assertFalse(watcher.update())
+        # only the modified model is processed again
+        with open(os.path.join(self.path, 'izhikevich.nestml'), 'a') as f:
+            f.write('\n# modified\n')
+        self.assertTrue(watcher.update())
+        self.assertEqual(self.get_generated_neurons(), ['izhikevich_neuron'])
+        self.assertEqual(os.stat(header).st_mtime, stamp)
+        # an added model is processed, while the module code is updated
+        shutil.copy(os.path.join(self.models_dir, 'iaf_cond_alpha.nestml'), self.path)
+        self.assertTrue(watcher.update())
+        self.assertEqual(sorted(self.get_generated_neurons()), ['iaf_cond_alpha_implicit', 'iaf_cond_alpha_neuron'])
+        with open(os.path.join(FrontendConfiguration.get_target_path(), 'models.cpp')) as f:
+            self.assertIn('iaf_cond_alpha_neuron', f.read())
+
+    def test_remove_model_which_failed(self):
+        watcher = ModelWatcher()
+        self.assertTrue(watcher.update())
+        # a model which can not even be read is not indexed
+        broken = os.path.join(self.path, 'broken.nestml')
+        with open(broken, 'wb') as f:
+            f.write(b'\xff\xfe\xfa neuron broken:\nend\n')
+        self.assertRaises(ValueError, watcher.update)
+        os.remove(broken)
+        self.assertTrue(watcher.update())
+        self.assertEqual(sorted(watcher.name_index.keys()), sorted(watcher.valid_neurons.keys()))
+        self.assertNotIn(broken, watcher.name_index.keys())
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#
+# output_sink_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+
+from pynestml.frontend.output_sink import MemorySink, TarSink
+from pynestml.frontend.pynestml_frontend import to_nest
+from pynestml.utils.compilation_session import CompilationSession
+
+
+class OutputSinkTest(unittest.TestCase):
+    """
+    Tests if generated code can be written to sinks other than the target directory.
+    """
+
+    def setUp(self):
+        self.path = str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                      os.path.join('..', 'models', 'iaf_psc_delta.nestml'))))
+        self.target = os.path.join(tempfile.mkdtemp(), 'target')
+
+    def test_memory_sink(self):
+        sink = MemorySink()
+        to_nest(path=self.path, target=self.target, logging_level='NO', module_name='sink_module', store_log=True,
+                session=CompilationSession(), output_sink=sink)
+        for file_name in ('iaf_psc_delta_neuron.h', 'iaf_psc_delta_neuron.cpp', 'sink_module.h', 'sink_module.cpp',
+                          'CMakeLists.txt', os.path.join('sli', 'sink_module-init.sli')):
+            self.assertIn(file_name, sink.files.keys())
+        self.assertIn('log.txt', sink.reports.keys())
+        # nothing has been written to the file system
+        self.assertFalse(os.path.exists(self.target))
+
+    def test_tar_sink(self):
+        stream = io.BytesIO()
+        to_nest(path=self.path, target=self.target, logging_level='NO', module_name='sink_module', store_log=True,
+                session=CompilationSession(), output_sink=TarSink(stream))
+        with tarfile.open(fileobj=io.BytesIO(stream.getvalue())) as archive:
+            names = archive.getnames()
+            self.assertIn('iaf_psc_delta_neuron.h', names)
+            self.assertIn('report/log.txt', names)
+            self.assertIn(b'iaf_psc_delta_neuron', archive.extractfile('iaf_psc_delta_neuron.h').read())
+        self.assertFalse(os.path.exists(self.target))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,11 +17,15 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import json
 import os
 import unittest
 
 from pynestml.frontend.pynestml_frontend import main
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
 
 
 class PyNestMLFrontendTest(unittest.TestCase):
@@ -47,6 +51,89 @@ class PyNestMLFrontendTest(unittest.TestCase):
         # except Exception:
         #    self.assertTrue(False)
 
+    def test_parallel_processing_of_all_models(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        params = list()
+        params.append('-path')
+        params.append(path)
+        params.append('-dry')
+        params.append('-logging_level')
+        params.append('NO')
+        params.append('-target')
+        params.append('target/models')
+        params.append('-jobs')
+        params.append('2')
+        main(params)
+        # the logs of all workers have been merged in the order of the files
+        artifacts = list()
+        for (artifact_name, neuron, log_level, code, error_position, message) in Logger.get_log().values():
+            if artifact_name != 'GLOBAL' and artifact_name not in artifacts:
+                artifacts.append(artifact_name)
+        self.assertEqual(artifacts, sorted(artifacts))
+        self.assertEqual(len(artifacts), len(FrontendConfiguration.get_files()))
+
+    def test_incremental_build(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                 os.path.join('..', 'models', 'iaf_psc_delta.nestml'))))
+        params = list()
+        params.append('-path')
+        params.append(path)
+        params.append('-logging_level')
+        params.append('NO')
+        params.append('-target')
+        params.append('target/models')
+        main(params)
+        codes = [code for (artifact_name, neuron, log_level, code, error_position, message)
+                 in Logger.get_log().values()]
+        self.assertNotIn(MessageCode.NEURON_UP_TO_DATE, codes)
+        self.assertNotIn(MessageCode.MODULE_UP_TO_DATE, codes)
+        # the second run is able to reuse all generated files
+        main(params)
+        codes = [code for (artifact_name, neuron, log_level, code, error_position, message)
+                 in Logger.get_log().values()]
+        self.assertIn(MessageCode.NEURON_UP_TO_DATE, codes)
+        self.assertIn(MessageCode.MODULE_UP_TO_DATE, codes)
+        self.assertNotIn(MessageCode.CODE_SUCCESSFULLY_GENERATED, codes)
+        # a modified generated file has to be generated again
+        with open(os.path.join(FrontendConfiguration.get_target_path(), 'iaf_psc_delta_neuron.h'), 'a') as f:
+            f.write('// modified')
+        main(params)
+        codes = [code for (artifact_name, neuron, log_level, code, error_position, message)
+                 in Logger.get_log().values()]
+        self.assertNotIn(MessageCode.NEURON_UP_TO_DATE, codes)
+        self.assertIn(MessageCode.MODULE_UP_TO_DATE, codes)
+        # the manifest records exactly the files written for the neuron
+        with open(os.path.join(FrontendConfiguration.get_target_path(), '.pynestml_manifest.json')) as f:
+            entry = json.load(f)['neurons']['iaf_psc_delta_neuron']
+        self.assertEqual(sorted(entry['files'].keys()), ['iaf_psc_delta_neuron.cpp', 'iaf_psc_delta_neuron.h'])
+        for file_name, file_hash in entry['files'].items():
+            with open(os.path.join(FrontendConfiguration.get_target_path(), file_name), 'rb') as f:
+                self.assertEqual(hashlib.sha1(f.read()).hexdigest(), file_hash)
+
+    def test_profile_report(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                 os.path.join('..', 'models', 'iaf_psc_alpha.nestml'))))
+        params = list()
+        params.append('-path')
+        params.append(path)
+        params.append('-logging_level')
+        params.append('NO')
+        params.append('-target')
+        params.append('target/models')
+        params.append('-profile')
+        params.append('cprofile')
+        main(params)
+        with open(os.path.join(FrontendConfiguration.get_report_path(), 'profile.json')) as f:
+            report = json.load(f)
+        self.assertIn('iaf_psc_alpha.nestml', report['units'])
+        for phase in ('symbol_table_and_cocos', 'ode_transformation', 'ode_toolbox', 'template_rendering',
+                      'file_writing'):
+            self.assertIn(phase, report['units']['iaf_psc_alpha_neuron'])
+        for phase in ('lexing', 'parsing', 'ast_building'):
+            self.assertIn(phase, report['total'])
+        self.assertTrue(os.path.isfile(os.path.join(FrontendConfiguration.get_report_path(),
+                                                    'iaf_psc_alpha_neuron.pstats')))
+
     def tearDown(self):
         # clean up
         import shutil
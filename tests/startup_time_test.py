@@ -0,0 +1,68 @@
+#
+# startup_time_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# dependencies which are only required for the analysis of the equations and the code generation
+deferred_modules = ('sympy', 'odetoolbox', 'jinja2')
+
+# performs a dry run and prints the names of all modules imported thereby as the last line
+dry_run = """
+import json
+import sys
+from pynestml.frontend.pynestml_frontend import main
+main(sys.argv[1:])
+print(json.dumps(sorted(sys.modules.keys())))
+"""
+
+
+class StartupTimeTest(unittest.TestCase):
+    """
+    Checks that a dry run on a single small model only imports the dependencies which are required for parsing and
+    checking of models. The startup time itself is reported by tools/benchmark.py.
+    """
+
+    def test_dry_run_imports(self):
+        root = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+        target = tempfile.mkdtemp()
+        try:
+            env = dict(os.environ)
+            env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+            process = subprocess.Popen([sys.executable, '-c', dry_run,
+                                        '-path', os.path.join(root, 'models', 'iaf_psc_delta.nestml'),
+                                        '-target', target, '-dry', '-logging_level', 'NO'],
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=target,
+                                       universal_newlines=True)
+            out, err = process.communicate()
+        finally:
+            shutil.rmtree(target)
+        self.assertEqual(process.returncode, 0, err)
+        imports = set(name.split('.')[0] for name in json.loads(out.splitlines()[-1]))
+        for module in deferred_modules:
+            self.assertNotIn(module, imports, '%s imported during a dry run' % module)
+
+
+if __name__ == '__main__':
+    unittest.main()
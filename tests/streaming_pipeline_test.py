@@ -0,0 +1,111 @@
+#
+# streaming_pipeline_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.frontend.build_cache import BuildCache
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined, main, process_neurons
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
+
+
+class StreamingPipelineTest(unittest.TestCase):
+    """
+    Tests if models are processed neuron by neuron, while the cross-unit checks are based on the names only.
+    """
+
+    def setUp(self):
+        self.models_dir = os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models')))
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, 'models')
+        os.makedirs(self.path)
+        self.target = os.path.join(self.work_dir, 'target')
+
+    def test_name_collision_across_units(self):
+        shutil.copy(os.path.join(self.models_dir, 'iaf_psc_delta.nestml'), os.path.join(self.path, 'a.nestml'))
+        shutil.copy(os.path.join(self.models_dir, 'iaf_psc_delta.nestml'), os.path.join(self.path, 'b.nestml'))
+        main(['-path', self.path, '-target', self.target, '-logging_level', 'NO', '-dry'])
+        collisions = [message for (artifact_name, neuron, log_level, code, error_position, message)
+                      in Logger.get_log().values() if code == MessageCode.NAME_COLLISION]
+        self.assertEqual(len(collisions), 2)
+        self.assertIn('iaf_psc_delta_neuron', collisions[0])
+
+    def test_neurons_are_generated_one_after_another(self):
+        for model in ('iaf_psc_delta.nestml', 'izhikevich.nestml'):
+            shutil.copy(os.path.join(self.models_dir, model), self.path)
+        FrontendConfiguration.parse_config(['-path', self.path, '-target', self.target, '-logging_level', 'NO'])
+        init_predefined()
+        FrontendConfiguration.get_output_sink().open()
+        BuildCache.load_manifest()
+        neurons = process_neurons(FrontendConfiguration.get_files())
+        model_file, neuron = next(neurons)
+        self.assertEqual(neuron.get_name(), 'iaf_psc_delta_neuron')
+        # the code of the first neuron is available before the second model has been processed
+        self.assertTrue(os.path.isfile(os.path.join(self.target, 'iaf_psc_delta_neuron.h')))
+        self.assertFalse(os.path.isfile(os.path.join(self.target, 'izhikevich_neuron.h')))
+        # only a body-less copy of the processed neuron is retained
+        self.assertEqual(len(neuron.get_body().get_body_elements()), 0)
+        model_file, neuron = next(neurons)
+        self.assertEqual(neuron.get_name(), 'izhikevich_neuron')
+        self.assertTrue(os.path.isfile(os.path.join(self.target, 'izhikevich_neuron.h')))
+
+    def test_neurons_with_errors_are_excluded(self):
+        shutil.copy(os.path.join(self.models_dir, 'terub_neuron_gpe.nestml'), self.path)
+        FrontendConfiguration.parse_config(['-path', self.path, '-target', self.target, '-logging_level', 'NO',
+                                            '-dry'])
+        init_predefined()
+        # the errors of a model are reported for all of its neurons, thus both are excluded
+        neurons = [neuron.get_name() for model_file, neuron in process_neurons(FrontendConfiguration.get_files())]
+        self.assertEqual(neurons, [])
+        self.assertEqual(self.get_excluded_neurons(), ['terub_neuron_gpe', 'terub_neuron_gpe_implicit'])
+        # the log only references the body-less copies of the processed neurons
+        for (artifact_name, neuron, log_level, code, error_position, message) in Logger.get_log().values():
+            if neuron is not None:
+                self.assertEqual(len(neuron.get_body().get_body_elements()), 0)
+
+    def test_consecutive_neurons_with_errors_are_excluded_with_and_without_jobs(self):
+        # two files of two erroneous neurons each, thus consecutive ones within a file and across the files
+        with open(os.path.join(self.models_dir, 'terub_neuron_gpe.nestml')) as model_file:
+            model = model_file.read()
+        with open(os.path.join(self.path, 'a.nestml'), 'w') as model_file:
+            model_file.write(model)
+        with open(os.path.join(self.path, 'b.nestml'), 'w') as model_file:
+            model_file.write(model.replace('terub_neuron_gpe', 'terub_neuron_gpe_copy'))
+        expected = ['terub_neuron_gpe', 'terub_neuron_gpe_copy', 'terub_neuron_gpe_copy_implicit',
+                    'terub_neuron_gpe_implicit']
+        main(['-path', self.path, '-target', self.target, '-logging_level', 'NO', '-dry'])
+        self.assertEqual(self.get_excluded_neurons(), expected)
+        main(['-path', self.path, '-target', self.target, '-logging_level', 'NO', '-dry', '-jobs', '2'])
+        self.assertEqual(self.get_excluded_neurons(), expected)
+
+    @staticmethod
+    def get_excluded_neurons():
+        return sorted(neuron.get_name() for (artifact_name, neuron, log_level, code, error_position, message)
+                      in Logger.get_log().values() if code == MessageCode.NEURON_CONTAINS_ERRORS)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#
+# time_budget_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pynestml.exceptions.analysis_timeout_exception import AnalysisTimeoutException
+from pynestml.frontend.output_sink import MemorySink
+from pynestml.frontend.pynestml_frontend import to_nest
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_source_location import ASTSourceLocation
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
+from pynestml.utils.time_budget import TimeBudget
+
+
+def sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def fail():
+    raise ValueError('analysis failed')
+
+
+def log_and_fail(message):
+    Logger.log_message(message=message, log_level=LoggingLevel.WARNING)
+    raise ValueError(message)
+
+
+class TimeBudgetTest(unittest.TestCase):
+    """
+    Tests if the symbolic analysis is cancelled as soon as its time budget is exhausted.
+    """
+
+    def test_run_within_budget(self):
+        with CompilationSession():
+            TimeBudget.init_time_budget(phase_budget=10.0)
+            self.assertEqual(TimeBudget.run('test', sleep_and_return, 0.0, {'solver': 'numeric'}),
+                             {'solver': 'numeric'})
+            # exceptions are handed over from the worker
+            self.assertRaises(ValueError, TimeBudget.run, 'test', fail)
+
+    def test_messages_of_worker_are_logged(self):
+        with CompilationSession():
+            Logger.init_logger(LoggingLevel.NO)
+            TimeBudget.init_time_budget(phase_budget=10.0)
+            neuron = ASTNodeFactory.create_ast_neuron(name='test_neuron',
+                                                      body=ASTNodeFactory.create_ast_body(list(), None),
+                                                      source_position=ASTSourceLocation.get_added_source_position(),
+                                                      artifact_name='test.nestml')
+            Logger.set_current_neuron(neuron)
+            self.assertRaises(ValueError, TimeBudget.run, 'test', log_and_fail, 'analysis failed')
+            self.assertEqual([(entry[1], entry[2], entry[5]) for entry in Logger.get_log().values()],
+                             [(neuron, LoggingLevel.WARNING, 'analysis failed')])
+
+    def test_phase_budget_exceeded(self):
+        with CompilationSession():
+            TimeBudget.init_time_budget(phase_budget=0.2)
+            start = time.time()
+            with self.assertRaises(AnalysisTimeoutException) as context:
+                TimeBudget.run('test', sleep_and_return, 60.0, None)
+            self.assertLess(time.time() - start, 10.0)
+            self.assertEqual(context.exception.phase, 'test')
+
+    def test_neuron_budget_exceeded(self):
+        with CompilationSession():
+            TimeBudget.init_time_budget(phase_budget=60.0, neuron_budget=0.2)
+            with TimeBudget.limit_neuron():
+                time.sleep(0.3)
+                self.assertEqual(TimeBudget.get_budget(), 0.0)
+                self.assertRaises(AnalysisTimeoutException, TimeBudget.run, 'test', sleep_and_return, 0.0, None)
+            self.assertEqual(TimeBudget.get_budget(), 60.0)
+
+    def test_fallback_to_numeric_solver(self):
+        # a variant of iaf_psc_exp with shapes given as odes, thus the numeric solver requires no analysis at all
+        with open(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_exp.nestml')) as f:
+            model = f.read()
+        model = model.replace('    V_abs mV = 0mV\n', '    V_abs mV = 0mV\n    I_shape_in pA = 0pA\n'
+                                                        '    I_shape_ex pA = 0pA\n')
+        model = model.replace('shape I_shape_in = exp(-1/tau_syn_in*t)', "shape I_shape_in' = -I_shape_in/tau_syn_in")
+        model = model.replace('shape I_shape_ex = exp(-1/tau_syn_ex*t)', "shape I_shape_ex' = -I_shape_ex/tau_syn_ex")
+        path = os.path.join(tempfile.mkdtemp(), 'iaf_psc_exp.nestml')
+        with open(path, 'w') as f:
+            f.write(model)
+        sink = MemorySink()
+        with to_nest(path=path, logging_level='NO', session=CompilationSession(), output_sink=sink,
+                     analysis_timeout=0.0001):
+            codes = [code for (artifact_name, neuron, log_level, code, error_position, message)
+                     in Logger.get_log().values()]
+        self.assertIn(MessageCode.ANALYSIS_TIMEOUT, codes)
+        # the neuron has been generated for the numeric solver instead
+        self.assertIn('gsl_odeiv_step', sink.files['iaf_psc_exp_neuron.h'])
+        shutil.rmtree(os.path.dirname(path))
+
+    def test_delta_shape_falls_back_to_numeric_solver(self):
+        path = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_delta.nestml'))
+        sink = MemorySink()
+        with to_nest(path=path, logging_level='NO', session=CompilationSession(), output_sink=sink,
+                     neuron_timeout=0.0001):
+            timeouts = [log_level for (artifact_name, neuron, log_level, code, error_position, message)
+                        in Logger.get_log().values() if code == MessageCode.ANALYSIS_TIMEOUT]
+        self.assertEqual(timeouts, [LoggingLevel.WARNING])
+        self.assertIn('gsl_odeiv_step', sink.files['iaf_psc_delta_neuron.h'])
+
+    def test_neuron_without_fallback_is_not_generated(self):
+        # functional shapes have to be transformed before the numeric solver can handle them
+        path = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'models', 'iaf_psc_alpha.nestml'))
+        sink = MemorySink()
+        with to_nest(path=path, logging_level='NO', session=CompilationSession(), output_sink=sink,
+                     neuron_timeout=0.0001):
+            codes = [code for (artifact_name, neuron, log_level, code, error_position, message)
+                     in Logger.get_log().values()]
+        self.assertIn(MessageCode.ANALYSIS_TIMEOUT, codes)
+        self.assertNotIn('iaf_psc_alpha_neuron.h', sink.files.keys())
+        # the module is still built, yet without the neuron
+        self.assertNotIn('iaf_psc_alpha_neuron', sink.files['module.cpp'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#
+# two_stage_parsing_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+from antlr4 import *
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.compilation_session import CompilationSession
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
+from pynestml.utils.model_parser import parse_rule, set_up_parser_error_reporting
+
+
+def create_parser(input_stream):
+    lexer = PyNestMLLexer(input_stream)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    parser = PyNestMLParser(stream)
+    set_up_parser_error_reporting(parser)
+    return parser
+
+
+class TwoStageParsingTest(unittest.TestCase):
+    """
+    Tests if parsing in SLL mode with a fallback to full LL mode yields the same parse trees and messages.
+    """
+
+    def test_same_parse_trees(self):
+        models_path = os.path.join(os.path.dirname(__file__), '..', 'models')
+        for file_name in sorted(os.listdir(models_path)):
+            if file_name.endswith('.nestml'):
+                parser = create_parser(FileStream(os.path.join(models_path, file_name)))
+                expected = parser.nestMLCompilationUnit().toStringTree(recog=parser)
+                parser = create_parser(FileStream(os.path.join(models_path, file_name)))
+                self.assertEqual(parse_rule(parser, parser.nestMLCompilationUnit).toStringTree(recog=parser),
+                                 expected)
+                # the parser is restored to the default configuration
+                self.assertEqual(len(parser.getErrorListenerDispatch().delegates), 1)
+
+    def test_syntax_errors_reported_once(self):
+        with CompilationSession():
+            Logger.init_logger(LoggingLevel.NO)
+            parser = create_parser(InputStream('(V_m + 2'))
+            parser.expression()
+            expected = [message[5] for message in Logger.get_log().values()]
+            Logger.init_logger(LoggingLevel.NO)
+            parser = create_parser(InputStream('(V_m + 2'))
+            parse_rule(parser, parser.expression)
+            messages = [message[5] for message in Logger.get_log().values()]
+            self.assertGreater(len(messages), 0)
+            self.assertEqual(messages, expected)
+            self.assertTrue(all(message[3] == MessageCode.SYNTAX_ERROR for message in Logger.get_log().values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+#
+# benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Runs the benchmarks of the toolchain and reports their timings. The tests only check the deterministic properties
+which the optimizations rely on, the timings themselves depend on the machine and are therefore reported here, e.g.,
+    python tools/benchmark.py startup_time
+runs a single benchmark, while all benchmarks are run if no name is handed over.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+root = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+models_path = os.path.join(root, 'models')
+sys.path.insert(0, root)
+
+benchmarks = OrderedDict()
+
+
+def benchmark(function):
+    """
+    Registers the handed over function as a benchmark under its name.
+    """
+    benchmarks[function.__name__] = function
+    return function
+
+
+@benchmark
+def startup_time():
+    """
+    Reports the time of a cold dry run on a single small model together with the slowest top-level imports.
+    """
+    target = tempfile.mkdtemp()
+    try:
+        env = dict(os.environ)
+        env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+        # the import times are only reported by python 3.7 and newer
+        options = ['-X', 'importtime'] if sys.version_info >= (3, 7) else []
+        start = time.time()
+        process = subprocess.Popen([sys.executable] + options + [os.path.join(root, 'PyNestML.py'),
+                                   '-path', os.path.join(models_path, 'iaf_psc_delta.nestml'),
+                                   '-target', target, '-dry'],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=target,
+                                   universal_newlines=True)
+        out, err = process.communicate()
+        elapsed = time.time() - start
+    finally:
+        shutil.rmtree(target)
+    # each line has the form 'import time: self [us] | cumulative | imported package'
+    imports = dict()
+    for line in err.splitlines():
+        if line.startswith('import time:') and not line.endswith('imported package'):
+            self_time, cumulative, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(cumulative)
+    print('Dry run of a single model took %.2fs' % elapsed)
+    for cumulative, name in sorted([(cumulative, name) for name, cumulative in imports.items() if '.' not in name],
+                                   reverse=True)[:10]:
+        print('%10.1fms %s' % (cumulative / 1000.0, name))
+
+
+@benchmark
+def session_attributes():
+    """
+    Reports how often the attributes stored per compilation session are read while all models are generated, and
+    the cost of each read compared to a plain class attribute.
+    """
+    import timeit
+    from collections import Counter
+    from pynestml.frontend.output_sink import MemorySink
+    from pynestml.frontend.pynestml_frontend import to_nest
+    from pynestml.utils.compilation_session import SessionAttribute
+    from pynestml.utils.logger import Logger
+
+    class Plain(object):
+        logging_level = None
+
+    reads = Counter()
+    get = SessionAttribute.__get__
+
+    def counting_get(self, cls, metaclass = None):
+        reads[self.owner.__name__ + '.' + self.name] += 1
+        return get(self, cls, metaclass)
+
+    SessionAttribute.__get__ = counting_get
+    try:
+        start = time.time()
+        to_nest(path=models_path, logging_level='NO', output_sink=MemorySink())
+        elapsed = time.time() - start
+    finally:
+        SessionAttribute.__get__ = get
+    session_read = min(timeit.repeat(lambda: Logger.logging_level, number=100000, repeat=5)) / 100000
+    plain_read = min(timeit.repeat(lambda: Plain.logging_level, number=100000, repeat=5)) / 100000
+    total = sum(reads.values())
+    print('Generating all models took %.2fs and read %d session attributes' % (elapsed, total))
+    print('A read takes %.2fus instead of %.2fus, i.e., %.3fs in total'
+          % (session_read * 1e6, plain_read * 1e6, total * (session_read - plain_read)))
+    for name, count in reads.most_common(5):
+        print('%10d %s' % (count, name))
+
+
+@benchmark
+def comment_collection():
+    """
+    Reports the time of building the ASTs of synthetic models with thousands of commented declarations, which grows
+    linearly with the number of declarations, while a quadratic collection of the comments would not.
+    """
+    from antlr4 import CommonTokenStream, InputStream
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+    from pynestml.generated.PyNestMLParser import PyNestMLParser
+    from pynestml.utils.compilation_session import CompilationSession
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import parse_rule
+    from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+    from tests.comment_collector_benchmark_test import create_model
+
+    with CompilationSession():
+        init_predefined()
+        Logger.init_logger(LoggingLevel.NO)
+        for declarations in (1000, 2000, 4000):
+            stream = CommonTokenStream(PyNestMLLexer(InputStream(create_model(declarations))))
+            stream.fill()
+            parser = PyNestMLParser(stream)
+            compilation_unit = parse_rule(parser, parser.nestMLCompilationUnit)
+            start = time.time()
+            ASTBuilderVisitor(stream.tokens).visit(compilation_unit)
+            print('Building the AST of %d declarations took %.2fs' % (declarations, time.time() - start))
+
+
+@benchmark
+def repeated_parsing():
+    """
+    Reports the time of parsing the same model after one and after 25 previously parsed models, which must not grow
+    with the size of the log.
+    """
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.utils.compilation_session import CompilationSession
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import ModelParser
+
+    times = list()
+    with CompilationSession():
+        init_predefined()
+        Logger.init_logger(LoggingLevel.NO)
+        for _ in range(30):
+            start = time.time()
+            ModelParser.parse_model(os.path.join(models_path, 'iaf_psc_alpha.nestml'))
+            times.append(time.time() - start)
+    print('Parsing took %.3fs after 1 and %.3fs after 25 models' % (sum(times[1:6]) / 5, sum(times[-5:]) / 5))
+
+
+@benchmark
+def ast_memory():
+    """
+    Reports the memory held by the ASTs of all models in the models directory as measured by tracemalloc, which is
+    only available with python 3.4 and newer. With a dictionary per node and source position and eagerly allocated
+    comment lists, about 480 bytes were required per node.
+    """
+    import gc
+    import tracemalloc
+    from antlr4 import CommonTokenStream, FileStream
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+    from pynestml.generated.PyNestMLParser import PyNestMLParser
+    from pynestml.meta_model.ast_node import ASTNode
+    from pynestml.utils.ast_utils import ASTUtils
+    from pynestml.utils.compilation_session import CompilationSession
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import parse_rule
+    from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+
+    with CompilationSession():
+        init_predefined()
+        Logger.init_logger(LoggingLevel.NO)
+        # the parse trees are created up front, such that only the ASTs are measured
+        parse_trees = list()
+        for model in sorted(os.listdir(models_path)):
+            if model.endswith('.nestml'):
+                stream = CommonTokenStream(PyNestMLLexer(FileStream(os.path.join(models_path, model))))
+                stream.fill()
+                parser = PyNestMLParser(stream)
+                parse_trees.append((stream.tokens, parse_rule(parser, parser.nestMLCompilationUnit)))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            asts = [ASTBuilderVisitor(tokens).visit(parse_tree) for tokens, parse_tree in parse_trees]
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        nodes = [node for ast in asts for node in ASTUtils.get_all(ast, ASTNode)]
+    print('The ASTs of %d models hold %d nodes in %d bytes, i.e., %.1f bytes per node'
+          % (len(asts), len(nodes), size, float(size) / len(nodes)))
+
+
+@benchmark
+def visitor_dispatch():
+    """
+    Reports the time of traversing the ASTs of all models in the models directory five times with the dispatch table
+    and with the chain of isinstance checks used before.
+    """
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.utils.compilation_session import CompilationSession
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import ModelParser
+    from pynestml.visitors.ast_visitor import ASTVisitor
+    from tests.ast_visitor_benchmark_test import ChainVisitor
+
+    with CompilationSession():
+        init_predefined()
+        Logger.init_logger(LoggingLevel.NO)
+        asts = [ModelParser.parse_model(os.path.join(models_path, model))
+                for model in sorted(os.listdir(models_path)) if model.endswith('.nestml')]
+    for visitor_type, name in ((ASTVisitor, 'the dispatch table'), (ChainVisitor, 'the chain of isinstance checks')):
+        start = time.time()
+        for _ in range(5):
+            for ast in asts:
+                ast.accept(visitor_type())
+        print('Traversing the ASTs of %d models five times took %.2fs with %s' % (len(asts), time.time() - start, name))
+
+
+def main(args):
+    unknown = [name for name in args if name not in benchmarks]
+    if len(unknown) > 0:
+        print('Unknown benchmarks: %s, available are: %s' % (', '.join(unknown), ', '.join(benchmarks.keys())))
+        return 1
+    for name in args if len(args) > 0 else benchmarks.keys():
+        print('== %s' % name)
+        benchmarks[name]()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))